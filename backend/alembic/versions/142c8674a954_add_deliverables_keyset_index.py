@@ -0,0 +1,26 @@
+"""add_deliverables_keyset_index
+
+Revision ID: 142c8674a954
+Revises: 789df888a224
+Create Date: 2026-10-16 10:12:41.218304
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "142c8674a954"
+down_revision: str | Sequence[str] | None = "789df888a224"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Index the default list ordering so keyset pages are index range scans."""
+    op.create_index("ix_deliverables_created_at_id", "deliverables", ["created_at", "id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_deliverables_created_at_id", table_name="deliverables")
@@ -0,0 +1,45 @@
+"""result_cache
+
+Revision ID: 3c9e5a71b2d8
+Revises: 8f3a6c2d1e47
+Create Date: 2026-10-16 21:02:44.518230
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c9e5a71b2d8"
+down_revision: str | Sequence[str] | None = "8f3a6c2d1e47"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Invalidation counters and the shared store for cached time-series results."""
+    op.create_table(
+        "result_cache_generations",
+        sa.Column("team_id", sa.Integer(), nullable=False),
+        sa.Column("object_type", sa.Text(), nullable=False),
+        sa.Column("generation", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("team_id", "object_type"),
+    )
+    op.create_table(
+        "result_cache_entries",
+        sa.Column("key", sa.Text(), nullable=False),
+        sa.Column("value", sa.LargeBinary(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    op.create_index(op.f("ix_result_cache_entries_expires_at"), "result_cache_entries", ["expires_at"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the result cache tables."""
+    op.drop_index(op.f("ix_result_cache_entries_expires_at"), table_name="result_cache_entries")
+    op.drop_table("result_cache_entries")
+    op.drop_table("result_cache_generations")
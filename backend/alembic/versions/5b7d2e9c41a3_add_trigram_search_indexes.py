@@ -0,0 +1,95 @@
+"""add_trigram_search_indexes
+
+Revision ID: 5b7d2e9c41a3
+Revises: 142c8674a954
+Create Date: 2026-10-16 14:03:27.512948
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b7d2e9c41a3"
+down_revision: str | Sequence[str] | None = "142c8674a954"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# index name -> (table, searchable columns); mirrors BaseObject.search_columns
+SEARCH_INDEXES = {
+    "ix_deliverables_search_trgm": ("deliverables", ["title", "content"]),
+    "ix_campaigns_search_trgm": ("campaigns", ["name", "description", "counterparty_name"]),
+    "ix_brands_search_trgm": ("brands", ["name", "description", "website"]),
+    "ix_roster_search_trgm": ("roster", ["name", "email", "instagram_handle", "tiktok_handle"]),
+}
+
+# Tables whose RLS policy also admits campaign guests (dual_scope_policy)
+CAMPAIGN_SCOPED_TABLES = {"deliverables"}
+
+# Mirrors app.objects.search.MIN_FUZZY_TERM_LENGTH
+MIN_FUZZY_TERM_LENGTH = 3
+
+# The USING clauses of team_scope_policy / dual_scope_policy (app/base/scope_mixins.py)
+SYSTEM_MODE = "NULLIF(current_setting('app.is_system_mode', true), '')::boolean IS TRUE"
+TEAM_SCOPE = (
+    "(NULLIF(current_setting('app.team_id', true), '') IS NOT NULL"
+    " AND team_id = NULLIF(current_setting('app.team_id', true), '')::int)"
+)
+CAMPAIGN_SCOPE = (
+    "(NULLIF(current_setting('app.campaign_id', true), '') IS NOT NULL"
+    " AND campaign_id = NULLIF(current_setting('app.campaign_id', true), '')::int)"
+)
+
+
+def _search_function(table: str, columns: list[str]) -> str:
+    """``search_<table>(search_term)``: ids of the caller's rows matching the term.
+
+    Under RLS Postgres won't use ILIKE or ``%>`` (not LEAKPROOF) as index
+    conditions, so app-role searches can't reach the GIN index directly. The
+    function runs as the table owner, which RLS doesn't apply to, and applies
+    the policy's scope itself; callers join on ``id``.
+    """
+    scope = " OR ".join([SYSTEM_MODE, TEAM_SCOPE, *([CAMPAIGN_SCOPE] if table in CAMPAIGN_SCOPED_TABLES else [])])
+    substring = " OR ".join(f"{column} ILIKE ('%' || search_term || '%')" for column in columns)
+    fuzzy = " OR ".join(f"{column} %> search_term" for column in columns)
+    return f"""
+        CREATE FUNCTION search_{table}(search_term text) RETURNS SETOF integer
+        LANGUAGE plpgsql STABLE SECURITY DEFINER
+        SET search_path = public, pg_temp
+        ROWS 100
+        AS $$
+        BEGIN
+            IF length(search_term) >= {MIN_FUZZY_TERM_LENGTH} THEN
+                RETURN QUERY SELECT id FROM {table} WHERE ({scope}) AND ({substring} OR {fuzzy});
+            ELSE
+                RETURN QUERY SELECT id FROM {table} WHERE ({scope}) AND ({substring});
+            END IF;
+        END
+        $$
+    """
+
+
+def upgrade() -> None:
+    """GIN trigram indexes for list search (ILIKE / word similarity) and the functions reaching them."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for index_name, (table, columns) in SEARCH_INDEXES.items():
+        op.create_index(
+            index_name,
+            table,
+            columns,
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops=dict.fromkeys(columns, "gin_trgm_ops"),
+        )
+        op.execute(_search_function(table, columns))
+        # Only the application role searches; the function trusts its scope settings
+        op.execute(f"REVOKE ALL ON FUNCTION search_{table}(text) FROM PUBLIC")
+        op.execute(f"GRANT EXECUTE ON FUNCTION search_{table}(text) TO arive")
+
+
+def downgrade() -> None:
+    # pg_trgm is left installed; other objects may depend on it
+    for index_name, (table, _columns) in SEARCH_INDEXES.items():
+        op.execute(f"DROP FUNCTION IF EXISTS search_{table}(text)")
+        op.drop_index(index_name, table_name=table, postgresql_using="gin")
@@ -0,0 +1,31 @@
+"""message_event_id
+
+Revision ID: 5e2a8c4d7f13
+Revises: 7d4b1f0a9c62
+Create Date: 2026-10-16 23:02:41.118734
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e2a8c4d7f13"
+down_revision: str | Sequence[str] | None = "7d4b1f0a9c62"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Link event messages to their event, so coalesced updates rewrite the message."""
+    op.add_column("messages", sa.Column("event_id", sa.Integer(), nullable=True))
+    op.create_index(op.f("ix_messages_event_id"), "messages", ["event_id"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the message event link."""
+    op.drop_index(op.f("ix_messages_event_id"), table_name="messages")
+    op.drop_column("messages", "event_id")
@@ -0,0 +1,41 @@
+"""event_outbox
+
+Revision ID: 7d4b1f0a9c62
+Revises: 3c9e5a71b2d8
+Create Date: 2026-10-16 22:14:05.301877
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7d4b1f0a9c62"
+down_revision: str | Sequence[str] | None = "3c9e5a71b2d8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Events awaiting delivery to outbox consumers, with per-consumer checkpoints."""
+    op.create_table(
+        "event_outbox",
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("team_id", sa.Integer(), nullable=False),
+        sa.Column("completed", postgresql.ARRAY(sa.Text()), server_default="{}", nullable=False),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("available_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint("event_id"),
+    )
+    op.create_index(op.f("ix_event_outbox_available_at"), "event_outbox", ["available_at"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the event outbox."""
+    op.drop_index(op.f("ix_event_outbox_available_at"), table_name="event_outbox")
+    op.drop_table("event_outbox")
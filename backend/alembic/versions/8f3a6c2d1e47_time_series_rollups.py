@@ -0,0 +1,121 @@
+"""time_series_rollups
+
+Revision ID: 8f3a6c2d1e47
+Revises: 5b7d2e9c41a3
+Create Date: 2026-10-16 16:21:09.104377
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic_utils.pg_policy import PGPolicy
+
+from alembic import op
+from app.utils.sqids import SqidType
+
+# revision identifiers, used by Alembic.
+revision: str = "8f3a6c2d1e47"
+down_revision: str | Sequence[str] | None = "5b7d2e9c41a3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+DUAL_SCOPE_POLICY = PGPolicy(
+    schema="public",
+    signature="dual_scope_policy",
+    on_entity="public.time_series_rollups",
+    definition="AS PERMISSIVE\n                        FOR ALL\n                        USING (\n                            NULLIF(current_setting('app.is_system_mode', true), '')::boolean IS TRUE\n                            OR (NULLIF(current_setting('app.team_id', true), '') IS NOT NULL\n                                AND team_id = NULLIF(current_setting('app.team_id', true), '')::int)\n                            OR (NULLIF(current_setting('app.campaign_id', true), '') IS NOT NULL\n                                AND campaign_id = NULLIF(current_setting('app.campaign_id', true), '')::int)\n                        )",
+)
+
+# table -> (campaign_id column or None, categorical fields, numeric fields); mirrors BaseObject.rollup_fields
+ROLLUP_SOURCES = {
+    "deliverables": ("campaign_id", ["platforms", "state"], []),
+    "campaigns": (None, ["state", "compensation_structure"], []),
+    "invoices": ("campaign_id", [], ["amount_due", "amount_paid"]),
+}
+
+
+def _backfill_sql(table: str, campaign_column: str | None, granularity: str, field: str, kind: str) -> str:
+    campaign_id = campaign_column or "NULL::integer"
+    match kind:
+        case "categorical":
+            category, row_count, value_sum, where = (
+                f"{field}::text",
+                "count(*)",
+                "NULL::numeric",
+                f"{field} IS NOT NULL",
+            )
+        case "numeric":
+            category, row_count, value_sum, where = "''", f"count({field})", f"sum({field})", "true"
+        case _:
+            category, row_count, value_sum, where = "''", "count(*)", "NULL::numeric", "true"
+    return f"""
+        INSERT INTO time_series_rollups
+            (team_id, campaign_id, object_type, field, granularity, bucket, category, row_count, value_sum)
+        SELECT team_id, {campaign_id}, '{table}', '{field}', '{granularity}', date_trunc('{granularity}', created_at),
+               {category}, {row_count}, {value_sum}
+        FROM {table}
+        WHERE deleted_at IS NULL AND {where}
+        GROUP BY 1, 2, 6, 7
+    """
+
+
+def upgrade() -> None:
+    """Rollup table for /o/{object_type}/data, backfilled from the existing rows."""
+    op.create_table(
+        "time_series_rollups",
+        sa.Column("object_type", sa.Text(), nullable=False),
+        sa.Column("field", sa.Text(), nullable=False),
+        sa.Column("granularity", sa.Text(), nullable=False),
+        sa.Column("bucket", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("category", sa.Text(), nullable=False),
+        sa.Column("row_count", sa.BigInteger(), nullable=False),
+        sa.Column("value_sum", sa.Numeric(), nullable=True),
+        sa.Column("team_id", SqidType(), nullable=False),
+        sa.Column("campaign_id", SqidType(), nullable=True),
+        sa.Column("id", SqidType(), autoincrement=True, nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["campaign_id"], ["campaigns.id"], ondelete="RESTRICT"),
+        sa.ForeignKeyConstraint(["team_id"], ["teams.id"], ondelete="RESTRICT"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_time_series_rollups_campaign_id"), "time_series_rollups", ["campaign_id"], unique=False)
+    op.create_index(op.f("ix_time_series_rollups_deleted_at"), "time_series_rollups", ["deleted_at"], unique=False)
+    op.create_index(
+        "ix_time_series_rollups_lookup",
+        "time_series_rollups",
+        ["object_type", "field", "granularity", "bucket"],
+        unique=False,
+    )
+    op.create_index(op.f("ix_time_series_rollups_team_id"), "time_series_rollups", ["team_id"], unique=False)
+    op.create_index(
+        "uq_time_series_rollups_bucket",
+        "time_series_rollups",
+        ["team_id", "campaign_id", "object_type", "field", "granularity", "bucket", "category"],
+        unique=True,
+        postgresql_nulls_not_distinct=True,
+    )
+
+    op.enable_rls("public", "time_series_rollups")
+    op.create_entity(DUAL_SCOPE_POLICY)
+
+    for table, (campaign_column, categorical, numeric) in ROLLUP_SOURCES.items():
+        fields = [("", "count"), *((f, "categorical") for f in categorical), *((f, "numeric") for f in numeric)]
+        for granularity in ("hour", "day"):
+            for field, kind in fields:
+                op.execute(_backfill_sql(table, campaign_column, granularity, field, kind))
+
+
+def downgrade() -> None:
+    """Drop the rollup table."""
+    op.drop_entity(DUAL_SCOPE_POLICY)
+    op.disable_rls("public", "time_series_rollups")
+
+    op.drop_index("uq_time_series_rollups_bucket", table_name="time_series_rollups", postgresql_nulls_not_distinct=True)
+    op.drop_index(op.f("ix_time_series_rollups_team_id"), table_name="time_series_rollups")
+    op.drop_index("ix_time_series_rollups_lookup", table_name="time_series_rollups")
+    op.drop_index(op.f("ix_time_series_rollups_deleted_at"), table_name="time_series_rollups")
+    op.drop_index(op.f("ix_time_series_rollups_campaign_id"), table_name="time_series_rollups")
+    op.drop_table("time_series_rollups")
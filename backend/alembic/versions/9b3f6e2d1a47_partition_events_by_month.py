@@ -0,0 +1,151 @@
+"""partition_events_by_month
+
+Revision ID: 9b3f6e2d1a47
+Revises: 5e2a8c4d7f13
+Create Date: 2026-10-17 09:41:27.604512
+
+"""
+
+from collections.abc import Sequence
+
+from alembic_utils.pg_policy import PGPolicy
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b3f6e2d1a47"
+down_revision: str | Sequence[str] | None = "5e2a8c4d7f13"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Months of partitions created ahead of the current one (EVENT_PARTITION_MONTHS_AHEAD)
+MONTHS_AHEAD = 3
+
+INDEXES = (
+    ("ix_events_actor", "actor_id, created_at"),
+    ("ix_events_actor_id", "actor_id"),
+    ("ix_events_deleted_at", "deleted_at"),
+    ("ix_events_team_created", "team_id, created_at"),
+    ("ix_events_team_id", "team_id"),
+    ("ix_events_team_object", "team_id, object_type, object_id, created_at"),
+)
+
+team_scope_policy = PGPolicy(
+    schema="public",
+    signature="team_scope_policy",
+    on_entity="public.events",
+    definition="AS PERMISSIVE\n                        FOR ALL\n                        USING (\n                            NULLIF(current_setting('app.is_system_mode', true), '')::boolean IS TRUE\n                            OR (NULLIF(current_setting('app.team_id', true), '') IS NOT NULL\n                                AND team_id = NULLIF(current_setting('app.team_id', true), '')::int)\n                        )",
+)
+
+
+def _replace_events_table(partition_by: str) -> None:
+    """Set ``events`` aside as ``events_old`` and create its replacement (``partition_by`` clause or "")."""
+    op.execute("ALTER TABLE events RENAME TO events_old")
+    op.execute("ALTER TABLE events_old RENAME CONSTRAINT events_pkey TO events_old_pkey")
+    for name, _ in INDEXES:
+        op.execute(f"DROP INDEX {name}")
+
+    op.execute(f"CREATE TABLE events (LIKE events_old INCLUDING DEFAULTS) {partition_by}")
+    primary_key = "id, created_at" if partition_by else "id"
+    op.execute(f"ALTER TABLE events ADD CONSTRAINT events_pkey PRIMARY KEY ({primary_key})")
+    op.execute("ALTER TABLE events ADD CONSTRAINT events_actor_id_fkey FOREIGN KEY (actor_id) REFERENCES users (id)")
+    op.execute(
+        "ALTER TABLE events ADD CONSTRAINT events_team_id_fkey"
+        " FOREIGN KEY (team_id) REFERENCES teams (id) ON DELETE RESTRICT"
+    )
+    # LIKE doesn't copy privileges
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            granted record;
+        BEGIN
+            FOR granted IN
+                SELECT grantee, privilege_type FROM information_schema.role_table_grants
+                WHERE table_schema = 'public' AND table_name = 'events_old'
+                    AND grantee <> (SELECT tableowner FROM pg_tables WHERE tablename = 'events_old')
+            LOOP
+                EXECUTE format('GRANT %s ON events TO %I', granted.privilege_type, granted.grantee);
+            END LOOP;
+        END
+        $$
+        """
+    )
+
+
+def _finish_events_table() -> None:
+    """Keep the id sequence, drop the old table, and restore the indexes and RLS."""
+    op.execute("ALTER SEQUENCE events_id_seq OWNED BY events.id")
+    op.execute("DROP TABLE events_old")
+    for name, columns in INDEXES:
+        op.execute(f"CREATE INDEX {name} ON events ({columns})")
+    op.enable_rls("public", "events")
+    op.create_entity(team_scope_policy)
+
+
+def upgrade() -> None:
+    """Range-partition events by created_at month, with partition functions for the maintenance task."""
+    _replace_events_table("PARTITION BY RANGE (created_at)")
+    op.execute("CREATE TABLE events_default PARTITION OF events DEFAULT")
+
+    # Run as the admin role that owns events (the worker's partition task connects as it)
+    op.execute(
+        """
+        CREATE FUNCTION events_create_partition(month date) RETURNS text
+        LANGUAGE plpgsql SET search_path = public AS $$
+        DECLARE
+            start_at timestamptz := date_trunc('month', month::timestamp) AT TIME ZONE 'UTC';
+            partition_name text := 'events_' || to_char(month, 'YYYY_MM');
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF events FOR VALUES FROM (%L) TO (%L)',
+                partition_name, start_at, start_at + interval '1 month'
+            );
+            RETURN partition_name;
+        END
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION events_drop_partition(month date) RETURNS boolean
+        LANGUAGE plpgsql SET search_path = public AS $$
+        DECLARE
+            partition_name text := 'events_' || to_char(month, 'YYYY_MM');
+        BEGIN
+            IF to_regclass(partition_name) IS NULL THEN
+                RETURN false;
+            END IF;
+            EXECUTE format('DROP TABLE %I', partition_name);
+            RETURN true;
+        END
+        $$
+        """
+    )
+
+    # EXECUTE is granted to PUBLIC by default: keep the application role from dropping audit history
+    op.execute("REVOKE ALL ON FUNCTION events_create_partition(date) FROM PUBLIC")
+    op.execute("REVOKE ALL ON FUNCTION events_drop_partition(date) FROM PUBLIC")
+
+    # Partitions for every month with events, through the months the task would create
+    op.execute(
+        f"""
+        SELECT events_create_partition(month::date)
+        FROM generate_series(
+            date_trunc('month', coalesce((SELECT min(created_at) FROM events_old), now()) AT TIME ZONE 'UTC'),
+            date_trunc('month', now() AT TIME ZONE 'UTC') + interval '{MONTHS_AHEAD} months',
+            interval '1 month'
+        ) AS month
+        """
+    )
+    op.execute("INSERT INTO events SELECT * FROM events_old")
+    _finish_events_table()
+
+
+def downgrade() -> None:
+    """Move events back into a single table (archived months are not restored)."""
+    op.execute("DROP FUNCTION events_drop_partition(date)")
+    op.execute("DROP FUNCTION events_create_partition(date)")
+    _replace_events_table("")
+    op.execute("INSERT INTO events SELECT * FROM events_old")
+    _finish_events_table()
@@ -1,4 +1,5 @@
 from abc import ABC
+from collections.abc import Sequence
 from enum import StrEnum
 from typing import TYPE_CHECKING, Any, ClassVar
 
@@ -59,6 +60,10 @@ class BaseAction[O: BaseDBModel, D: Struct](ABC):
     should_redirect_to_parent: ClassVar[bool] = False  # Whether to redirect to parent after execution
     is_hidden: ClassVar[bool] = False  # Hidden actions are not shown in dropdown but can still be executed
 
+    # Object attributes is_available reads (besides deps, which are fixed per request). Batched
+    # availability memoizes on their values; None means unknown, so every object is evaluated.
+    availability_inputs: ClassVar[tuple[str, ...] | None] = None
+
     # Model is set by action group during registration
     model: ClassVar[type[BaseDBModel] | None] = None
 
@@ -70,6 +75,26 @@ class BaseAction[O: BaseDBModel, D: Struct](ABC):
     ) -> bool:
         return True
 
+    @classmethod
+    def get_availability_inputs(cls) -> tuple[str, ...] | None:
+        # The default is_available doesn't look at the object at all
+        if cls.availability_inputs is None and cls.is_available.__func__ is BaseAction.is_available.__func__:
+            return ()
+        return cls.availability_inputs
+
+    @classmethod
+    def to_dto(cls, group_type: ActionGroupType, action_key: str) -> ActionDTO:
+        return ActionDTO(
+            action_group_type=group_type,
+            action=action_key,
+            label=cls.label,
+            is_bulk_allowed=cls.is_bulk_allowed,
+            priority=cls.priority,
+            icon=cls.icon.value if cls.icon else None,
+            confirmation_message=cls.confirmation_message,
+            should_redirect_to_parent=cls.should_redirect_to_parent,
+        )
+
 
 class BaseObjectAction[O: BaseDBModel, D: Struct](BaseAction[O, D]):
     """Base class for actions that operate on existing database objects.
@@ -234,39 +259,83 @@ class ActionGroup:
         self,
         obj: BaseDBModel | None = None,
     ) -> list[ActionDTO]:
-        from app.actions.deps import ActionDeps
+        if obj is not None:
+            return self.get_available_actions_batch([obj])[0]
 
-        # Select the appropriate pre-sorted dictionary
-        actions_dict = self.top_level_actions if obj is None else self.object_actions
+        from app.actions.deps import ActionDeps
 
         # Create deps instance for this request
         deps = ActionDeps(**self.action_registry.dependencies)
 
         available = []
-        for action_key, action_class in actions_dict.items():
+        for action_key, action_class in self.top_level_actions.items():
             # Skip hidden actions (they can still be executed but won't show in dropdown)
             if action_class.is_hidden:
                 continue
-            if action_class.is_available(obj, deps):
+            if action_class.is_available(None, deps):
                 available.append((action_key, action_class))
 
         # Sort by priority
         available.sort(key=lambda x: x[1].priority)
 
         # Transform to DTOs
-        return [
-            ActionDTO(
-                action_group_type=self.group_type,
-                action=action_key,
-                label=action_class.label,
-                is_bulk_allowed=action_class.is_bulk_allowed,
-                priority=action_class.priority,
-                icon=action_class.icon.value if action_class.icon else None,
-                confirmation_message=action_class.confirmation_message,
-                should_redirect_to_parent=action_class.should_redirect_to_parent,
+        return [action_class.to_dto(self.group_type, action_key) for action_key, action_class in available]
+
+    def get_available_actions_batch(self, objs: Sequence[BaseDBModel]) -> list[list[ActionDTO]]:
+        """Available object actions for each of ``objs``, evaluated for the whole batch at once.
+
+        One ``ActionDeps`` is shared by every check. Each action's result is memoized on the
+        values of its ``availability_inputs``, and rows with the same set of available
+        actions share a single (read-only) DTO list.
+        """
+        from app.actions.deps import ActionDeps
+
+        deps = ActionDeps(**self.action_registry.dependencies)
+
+        # Visible actions in display order; sorting up front keeps the per-row lists ordered
+        actions = sorted(
+            ((key, action) for key, action in self.object_actions.items() if not action.is_hidden),
+            key=lambda item: item[1].priority,
+        )
+        inputs = [action.get_availability_inputs() for _, action in actions]
+        memos: list[dict[tuple[Any, ...], bool]] = [{} for _ in actions]
+        dto_lists: dict[tuple[bool, ...], list[ActionDTO]] = {}
+
+        results = []
+        for obj in objs:
+            signature = tuple(
+                self._is_available(action, obj, deps, action_inputs, memo)
+                for (_, action), action_inputs, memo in zip(actions, inputs, memos, strict=True)
             )
-            for action_key, action_class in available
-        ]
+            dtos = dto_lists.get(signature)
+            if dtos is None:
+                dtos = dto_lists[signature] = [
+                    action.to_dto(self.group_type, key)
+                    for (key, action), available in zip(actions, signature, strict=True)
+                    if available
+                ]
+            results.append(dtos)
+        return results
+
+    @staticmethod
+    def _is_available(
+        action: type[BaseAction],
+        obj: BaseDBModel,
+        deps: "ActionDeps",
+        inputs: tuple[str, ...] | None,
+        memo: dict[tuple[Any, ...], bool],
+    ) -> bool:
+        if inputs is None:
+            return action.is_available(obj, deps)
+        key = tuple(getattr(obj, name) for name in inputs)
+        try:
+            return memo[key]
+        except KeyError:
+            available = memo[key] = action.is_available(obj, deps)
+            return available
+        except TypeError:
+            # Unhashable input values can't be memoized
+            return action.is_available(obj, deps)
 
 
 def action_group_factory[T: BaseDBModel](
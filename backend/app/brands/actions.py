@@ -13,7 +13,7 @@ from app.actions.schemas import ActionExecutionResponse
 from app.brands.enums import BrandActions
 from app.brands.models.brands import Brand
 from app.brands.schemas import BrandCreateSchema, BrandUpdateSchema
-from app.utils.db import create_model, update_model
+from app.utils.db import create_model, delete_model, update_model
 
 # Create brand action group
 brand_actions = action_group_factory(
@@ -37,7 +37,7 @@ class DeleteBrand(BaseObjectAction[Brand, EmptyActionData]):
     async def execute(
         cls, obj: Brand, data: EmptyActionData, transaction: AsyncSession, deps
     ) -> ActionExecutionResponse:
-        await transaction.delete(obj)
+        await delete_model(session=transaction, model_instance=obj, user_id=deps.user, team_id=obj.team_id)
         return ActionExecutionResponse(
             message="Deleted brand",
         )
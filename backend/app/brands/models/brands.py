@@ -19,7 +19,18 @@ class Brand(ThreadableMixin, RLSMixin(), BaseDBModel):
     """Brand object model."""
 
     __tablename__ = "brands"
-    __table_args__ = (Index("ix_brands_team_id_name_lower", "team_id", "name", unique=True),)
+    __table_args__ = (
+        Index("ix_brands_team_id_name_lower", "team_id", "name", unique=True),
+        # Backs BrandObject.search_columns (ILIKE and trigram similarity)
+        Index(
+            "ix_brands_search_trgm",
+            "name",
+            "description",
+            "website",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops", "description": "gin_trgm_ops", "website": "gin_trgm_ops"},
+        ),
+    )
 
     # Brand-specific fields
     name: Mapped[str] = mapped_column(sa.Text, nullable=False)
@@ -33,6 +33,9 @@ class BrandObject(BaseObject[Brand]):
     top_level_action_group = ActionGroupType.BrandActions
     action_group = ActionGroupType.BrandActions
 
+    # Trigram-indexed search (ix_brands_search_trgm)
+    search_columns = ("name", "description", "website")
+
     column_definitions = [
         ObjectColumn(
             key="id",
@@ -22,7 +22,7 @@ from app.campaigns.schemas import (
     ReplaceContractSchema,
 )
 from app.deliverables.models import Deliverable
-from app.utils.db import create_model, update_model
+from app.utils.db import create_model, delete_model, update_model
 
 campaign_actions = action_group_factory(
     ActionGroupType.CampaignActions,
@@ -45,7 +45,7 @@ class DeleteCampaign(BaseObjectAction[Campaign, EmptyActionData]):
     async def execute(
         cls, obj: Campaign, data: EmptyActionData, transaction: AsyncSession, deps
     ) -> ActionExecutionResponse:
-        await transaction.delete(obj)
+        await delete_model(session=transaction, model_instance=obj, user_id=deps.user, team_id=obj.team_id)
         return ActionExecutionResponse(
             message="Deleted campaign",
         )
@@ -145,6 +145,8 @@ class AddContractToCampaign(BaseObjectAction[Campaign, AddContractToCampaignSche
             message=f"Contract added to campaign '{obj.name}'",
         )
 
+    availability_inputs = ("contract",)
+
     @classmethod
     def is_available(cls, obj: Campaign | None, deps) -> bool:
         # Only available if campaign has no contract
@@ -181,6 +183,8 @@ class ReplaceContract(BaseObjectAction[Campaign, ReplaceContractSchema]):
             message=f"Contract replaced for campaign '{obj.name}'",
         )
 
+    availability_inputs = ("contract",)
+
     @classmethod
     def is_available(cls, obj: Campaign | None, deps) -> bool:
         # Only available if campaign already has a contract
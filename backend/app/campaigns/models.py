@@ -38,6 +38,17 @@ class Campaign(
     BaseDBModel,
 ):
     __tablename__ = "campaigns"
+    # Backs CampaignObject.search_columns (ILIKE and trigram similarity)
+    __table_args__ = (
+        sa.Index(
+            "ix_campaigns_search_trgm",
+            "name",
+            "description",
+            "counterparty_name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops", "description": "gin_trgm_ops", "counterparty_name": "gin_trgm_ops"},
+        ),
+    )
 
     # Basic info
     name: Mapped[str] = mapped_column(sa.Text, nullable=False)
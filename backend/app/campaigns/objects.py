@@ -36,6 +36,16 @@ class CampaignObject(BaseObject[Campaign]):
         joinedload(Campaign.contract),
     ]
 
+    # Projection for requested list columns (contract drives action availability)
+    list_columns = ("name", "description")
+    list_load_paths = ("contract",)
+
+    # Trigram-indexed search (ix_campaigns_search_trgm)
+    search_columns = ("name", "description", "counterparty_name")
+
+    # Pre-aggregated time series (time_series_rollups)
+    rollup_fields = ("state", "compensation_structure")
+
     @classmethod
     def title_field(cls, obj: Campaign) -> str:
         return obj.name
@@ -118,6 +128,7 @@ class CampaignObject(BaseObject[Campaign]):
             object_type=ObjectTypes.Brands,
             query_relationship="brand",
             query_column="name",
+            load=("brand",),
         ),
         ObjectColumn(
             key="state",
@@ -0,0 +1,83 @@
+"""Live dashboard updates pushed over Channels.
+
+Open dashboards used to poll ``/o/{object_type}/data`` for every widget.
+``stream_widget_updates`` instead subscribes to the (team, table) channels
+of the tables the widgets read. CREATED/UPDATED/DELETED events notify them
+when the write commits (``notify_table_change`` in app/objects/cache.py).
+After the first notification it waits ``LIVE_DEBOUNCE_SECONDS`` so a burst
+of writes costs one refresh, re-renders only the widgets over the changed
+tables, and sends each one's ``WidgetRenderSchema``. A dashboard whose data
+doesn't change runs no queries.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+import msgspec
+from litestar.channels import ChannelsPlugin
+from litestar.stores.base import Store
+
+from app.dashboard.models import Widget
+from app.dashboard.render import render_widgets
+from app.dashboard.schemas import WidgetQuerySchema
+from app.objects.base import ObjectRegistry
+from app.objects.cache import table_change_channel
+from app.objects.time_series import source_tables
+from app.utils.db import StreamSessionFactory
+from app.utils.sqids import sqid_enc_hook
+
+logger = logging.getLogger(__name__)
+
+LIVE_DEBOUNCE_SECONDS = 1.0
+
+_encoder = msgspec.json.Encoder(enc_hook=sqid_enc_hook)
+
+
+def widget_tables(widget: Widget, object_registry: ObjectRegistry) -> set[str]:
+    """Tables whose changes can change ``widget``'s data (empty for an invalid query)."""
+    try:
+        query = msgspec.convert(widget.query, type=WidgetQuerySchema)
+        object_service = object_registry.get_class(query.object_type)
+    except (msgspec.ValidationError, ValueError):
+        return set()
+    field_metadata = object_service.get_field_metadata(query.field)
+    if field_metadata is None:
+        return set()
+    return set(source_tables(object_service, field_metadata))
+
+
+async def stream_widget_updates(
+    send: Callable[[str], Awaitable[Any]],
+    channels: ChannelsPlugin,
+    widgets: Sequence[Widget],
+    stream_session: StreamSessionFactory,
+    object_registry: ObjectRegistry,
+    team_id: int,
+    cache: Store | None = None,
+    debounce: float = LIVE_DEBOUNCE_SECONDS,
+) -> None:
+    """Send re-rendered widgets whenever the tables they read change; runs until cancelled."""
+    tables_by_widget = {widget.id: widget_tables(widget, object_registry) for widget in widgets}
+    tables = set().union(*tables_by_widget.values())
+    if not tables:
+        return
+
+    changes: asyncio.Queue[bytes] = asyncio.Queue()
+    async with (
+        channels.start_subscription([table_change_channel(team_id, table) for table in sorted(tables)]) as subscriber,
+        subscriber.run_in_background(changes.put),
+    ):
+        while True:
+            changed = {(await changes.get()).decode()}
+            await asyncio.sleep(debounce)
+            while not changes.empty():
+                changed.add(changes.get_nowait().decode())
+
+            affected = [widget for widget in widgets if tables_by_widget[widget.id] & changed]
+            logger.debug("Refreshing live widgets", extra={"tables": sorted(changed), "widgets": len(affected)})
+            for rendered in await render_widgets(
+                affected, stream_session, object_registry, cache=cache, team_id=team_id
+            ):
+                await send(_encoder.encode(rendered).decode())
@@ -0,0 +1,146 @@
+"""Server-side dashboard rendering.
+
+``render_widgets`` runs every widget's stored time-series query in one
+request instead of one ``/o/{object_type}/data`` round trip per widget. Each
+widget gets its own RLS-scoped session (a separate pooled connection), at
+most ``WIDGET_RENDER_CONCURRENCY`` run at once, and each one is bounded by
+``WIDGET_TIMEOUT_SECONDS``. A widget that fails or times out reports an
+error in its own slot; the other widgets still render.
+
+``prewarm_dashboards`` renders every team's default dashboards into the
+result cache ahead of time, so the first loads of the day aren't cold.
+"""
+
+import asyncio
+import logging
+from collections.abc import Sequence
+
+import msgspec
+from litestar.exceptions import HTTPException
+from litestar.stores.base import Store
+from psycopg.errors import QueryCanceled
+from sqlalchemy import event, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import selectinload
+
+from app.dashboard.models import Dashboard, Widget
+from app.dashboard.schemas import WidgetQuerySchema, WidgetRenderSchema
+from app.objects.base import ObjectRegistry
+from app.objects.time_series import get_time_series
+from app.utils.db import StreamSessionFactory, team_session_factory
+from app.utils.db_filters import soft_delete_filter
+from app.utils.sqids import Sqid
+
+logger = logging.getLogger(__name__)
+
+WIDGET_RENDER_CONCURRENCY = 4
+WIDGET_TIMEOUT_SECONDS = 10.0
+
+
+async def _render_widget(
+    widget: Widget,
+    stream_session: StreamSessionFactory,
+    object_registry: ObjectRegistry,
+    semaphore: asyncio.Semaphore,
+    timeout: float,
+    cache: Store | None,
+    team_id: int | None,
+    refresh: bool,
+) -> WidgetRenderSchema:
+    widget_id = Sqid(widget.id)
+    async with semaphore:
+        try:
+            query = msgspec.convert(widget.query, type=WidgetQuerySchema)
+            object_service = object_registry.get_class(query.object_type)
+            async with asyncio.timeout(timeout), stream_session() as session:
+                # Have Postgres cancel a runaway query too, so the connection goes back to the pool
+                await session.execute(
+                    text("SELECT set_config('statement_timeout', :timeout, true)"),
+                    {"timeout": f"{int(timeout * 1000)}ms"},
+                )
+                data = await get_time_series(session, object_service, query, cache, team_id, refresh)
+        except (msgspec.ValidationError, ValueError, HTTPException) as e:
+            return WidgetRenderSchema(widget_id=widget_id, error=str(e))
+        except Exception as e:
+            if isinstance(e, TimeoutError) or isinstance(getattr(e, "orig", None), QueryCanceled):
+                logger.warning("Widget render timed out", extra={"widget_id": widget.id, "timeout": timeout})
+                return WidgetRenderSchema(widget_id=widget_id, error=f"Timed out after {timeout:g}s")
+            logger.exception("Widget render failed", extra={"widget_id": widget.id})
+            return WidgetRenderSchema(widget_id=widget_id, error="Failed to load widget data")
+    return WidgetRenderSchema(widget_id=widget_id, data=data)
+
+
+async def render_widgets(
+    widgets: Sequence[Widget],
+    stream_session: StreamSessionFactory,
+    object_registry: ObjectRegistry,
+    concurrency: int = WIDGET_RENDER_CONCURRENCY,
+    timeout: float = WIDGET_TIMEOUT_SECONDS,
+    cache: Store | None = None,
+    team_id: int | None = None,
+    refresh: bool = False,
+) -> list[WidgetRenderSchema]:
+    """Run each widget's query concurrently; results come back in ``widgets`` order.
+
+    With a ``cache`` and ``team_id``, widgets are served from the result cache when possible
+    (or, with ``refresh``, recomputed and stored in it).
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    return list(
+        await asyncio.gather(
+            *(
+                _render_widget(widget, stream_session, object_registry, semaphore, timeout, cache, team_id, refresh)
+                for widget in widgets
+            )
+        )
+    )
+
+
+async def prewarm_dashboards(
+    session_maker: async_sessionmaker[AsyncSession],
+    object_registry: ObjectRegistry,
+    cache: Store,
+    concurrency: int = WIDGET_RENDER_CONCURRENCY,
+    timeout: float = WIDGET_TIMEOUT_SECONDS,
+    budget: float | None = None,
+) -> dict[str, int | bool]:
+    """Recompute every team's default dashboard widgets into ``cache``.
+
+    ``session_maker`` opens system-mode sessions (the worker's); each team's
+    widgets run under that team's RLS context, so the cached results are the
+    ones its requests would compute. Teams are warmed one at a time until
+    ``budget`` seconds have passed.
+    """
+    async with session_maker() as session:
+        event.listen(session.sync_session, "do_orm_execute", soft_delete_filter)
+        result = await session.execute(
+            select(Dashboard)
+            .where(Dashboard.is_default.is_(True))
+            .options(selectinload(Dashboard.widgets))
+            .order_by(Dashboard.team_id, Dashboard.id)
+        )
+        widgets_by_team: dict[int, list[Widget]] = {}
+        for dashboard in result.scalars():
+            widgets_by_team.setdefault(int(dashboard.team_id), []).extend(dashboard.widgets)
+
+    stats: dict[str, int | bool] = {"teams": 0, "warmed": 0, "failed": 0, "budget_exhausted": False}
+    try:
+        async with asyncio.timeout(budget):
+            for team_id, widgets in widgets_by_team.items():
+                rendered = await render_widgets(
+                    widgets,
+                    team_session_factory(session_maker, team_id),
+                    object_registry,
+                    concurrency,
+                    timeout,
+                    cache=cache,
+                    team_id=team_id,
+                    refresh=True,
+                )
+                stats["teams"] += 1
+                stats["warmed"] += sum(widget.error is None for widget in rendered)
+                stats["failed"] += sum(widget.error is not None for widget in rendered)
+    except TimeoutError:
+        logger.warning("Dashboard prewarm ran out of time", extra={"budget": budget, **stats})
+        stats["budget_exhausted"] = True
+    return stats
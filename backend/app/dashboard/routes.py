@@ -2,6 +2,7 @@
 
 from litestar import Request, Router, get, patch, post
 from litestar.exceptions import NotFoundException, PermissionDeniedException
+from litestar.stores.base import Store
 from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -10,13 +11,17 @@ from app.actions.enums import ActionGroupType
 from app.actions.registry import ActionRegistry
 from app.auth.guards import requires_scoped_session
 from app.dashboard.models import Dashboard, Widget
+from app.dashboard.render import render_widgets
 from app.dashboard.schemas import (
     CreateDashboardSchema,
+    DashboardRenderSchema,
     DashboardSchema,
     UpdateDashboardSchema,
     WidgetQuerySchema,
     WidgetSchema,
 )
+from app.objects.base import ObjectRegistry
+from app.utils.db import StreamSessionFactory
 from app.utils.sqids import Sqid
 
 
@@ -109,6 +114,36 @@ async def get_dashboard(id: Sqid, transaction: AsyncSession, action_registry: Ac
     return _dashboard_to_schema(dashboard, action_registry)
 
 
+@get("/{id:str}/render")
+async def render_dashboard(
+    id: Sqid,
+    transaction: AsyncSession,
+    stream_session: StreamSessionFactory,
+    object_registry: ObjectRegistry,
+    time_series_cache: Store,
+    team_id: int | None,
+    campaign_id: int | None,
+) -> DashboardRenderSchema:
+    """Get the data for every widget of a dashboard in one response.
+
+    Widget queries run concurrently on their own connections (see
+    app/dashboard/render.py); a widget that fails or times out carries an
+    error instead of data.
+    """
+    stmt = select(Dashboard).where(Dashboard.id == id).options(selectinload(Dashboard.widgets))
+    result = await transaction.execute(stmt)
+    dashboard = result.scalar_one_or_none()
+    if not dashboard:
+        raise NotFoundException(f"Dashboard with id {id} not found")
+
+    # Campaign guests see a subset of the team's rows, so only team-scoped results are cached
+    cache_team_id = team_id if campaign_id is None else None
+    widgets = await render_widgets(
+        dashboard.widgets, stream_session, object_registry, cache=time_series_cache, team_id=cache_team_id
+    )
+    return DashboardRenderSchema(dashboard_id=dashboard.id, widgets=widgets)
+
+
 @post("/")
 async def create_dashboard(
     data: CreateDashboardSchema,
@@ -185,6 +220,7 @@ dashboard_router = Router(
     route_handlers=[
         list_dashboards,
         get_dashboard,
+        render_dashboard,
         create_dashboard,
         update_dashboard,
     ],
@@ -6,7 +6,7 @@ from typing import Any
 from app.actions.schemas import ActionDTO
 from app.base.schemas import BaseSchema
 from app.objects.enums import ObjectTypes
-from app.objects.schemas import TimeSeriesDataRequest
+from app.objects.schemas import TimeSeriesDataRequest, TimeSeriesDataResponse
 from app.utils.sqids import Sqid
 
 # =============================================================================
@@ -34,6 +34,14 @@ class WidgetSchema(BaseSchema):
     actions: list[ActionDTO]
 
 
+class WidgetRenderSchema(BaseSchema):
+    """One widget's data in a rendered dashboard: ``data`` on success, ``error`` otherwise."""
+
+    widget_id: Sqid
+    data: TimeSeriesDataResponse | None = None
+    error: str | None = None
+
+
 class CreateWidgetSchema(BaseSchema):
     """Schema for creating a widget."""
 
@@ -78,6 +86,13 @@ class DashboardSchema(BaseSchema):
     actions: list[ActionDTO]
 
 
+class DashboardRenderSchema(BaseSchema):
+    """Every widget's data for a dashboard, in widget order."""
+
+    dashboard_id: Sqid
+    widgets: list[WidgetRenderSchema]
+
+
 class CreateDashboardSchema(BaseSchema):
     """Schema for creating a new dashboard.
 
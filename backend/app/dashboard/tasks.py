@@ -0,0 +1,50 @@
+"""Background tasks for dashboards."""
+
+import logging
+
+from app.dashboard.render import prewarm_dashboards
+from app.objects.cache import PostgresResultStore
+from app.queue.registry import scheduled_task
+from app.queue.types import AppContext
+from app.utils.discovery import discover_and_import
+from app.utils.providers import provide_object_registry
+
+__all__ = ["prewarm_default_dashboards"]
+
+logger = logging.getLogger(__name__)
+
+# Object classes register on import; the worker doesn't load the object routes
+discover_and_import(["objects.py"], base_path="app")
+
+
+@scheduled_task(cron="50 * * * *", timeout=1200)
+async def prewarm_default_dashboards(ctx: AppContext) -> dict:
+    """Recompute every team's default dashboard widgets into the shared result cache.
+
+    Runs hourly, shortly before the previous run's entries expire (``CACHE_TTL``),
+    so default dashboards always load from the cache. Only the ``postgres``
+    cache backend is shared with the API nodes; with the in-memory LRU there is
+    nothing to warm.
+
+    Args:
+        ctx: SAQ task context
+
+    Returns:
+        Dictionary with the number of teams and widgets warmed, widgets that
+        failed, and whether the time budget ran out
+    """
+    config = ctx["config"]
+    if config.TIME_SERIES_CACHE_BACKEND != "postgres":
+        logger.info("Skipping dashboard prewarm: the result cache isn't shared")
+        return {"teams": 0, "warmed": 0, "failed": 0, "budget_exhausted": False}
+
+    session_maker = ctx["db_sessionmaker"]
+    result = await prewarm_dashboards(
+        session_maker,
+        provide_object_registry(ctx["s3_client"], config),
+        PostgresResultStore(session_maker),
+        concurrency=config.DASHBOARD_PREWARM_CONCURRENCY,
+        budget=config.DASHBOARD_PREWARM_BUDGET_SECONDS,
+    )
+    logger.info(f"Dashboard prewarm completed: {result}")
+    return result
@@ -0,0 +1,67 @@
+import asyncio
+import logging
+
+from litestar import WebSocket, websocket
+from litestar.channels import ChannelsPlugin
+from litestar.exceptions import WebSocketDisconnect
+from litestar.status_codes import WS_1008_POLICY_VIOLATION
+from litestar.stores.base import Store
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app.auth.guards import requires_team
+from app.dashboard.live import stream_widget_updates
+from app.dashboard.models import Dashboard
+from app.objects.base import ObjectRegistry
+from app.utils.db import StreamSessionFactory
+from app.utils.sqids import Sqid
+
+logger = logging.getLogger(__name__)
+
+
+async def _receive_until_disconnect(socket: WebSocket) -> None:
+    # Clients don't send anything; receiving notices the disconnect (raising WebSocketDisconnect)
+    while True:
+        await socket.receive_text()
+
+
+@websocket("/ws/dashboards/{id:str}", guards=[requires_team])
+async def dashboard_live_handler(
+    socket: WebSocket,
+    id: Sqid,
+    channels: ChannelsPlugin,
+    stream_session: StreamSessionFactory,
+    object_registry: ObjectRegistry,
+    time_series_cache: Store,
+    team_id: int,
+) -> None:
+    """Push fresh widget data for an open dashboard when its underlying rows change.
+
+    Each message is a ``WidgetRenderSchema`` for one widget (see app/dashboard/live.py).
+    """
+    await socket.accept()
+    async with stream_session() as session:
+        stmt = select(Dashboard).where(Dashboard.id == id).options(selectinload(Dashboard.widgets))
+        result = await session.execute(stmt)
+        dashboard = result.scalar_one_or_none()
+    if dashboard is None:
+        await socket.close(code=WS_1008_POLICY_VIOLATION, reason="Dashboard not found")
+        return
+
+    logger.info(f"Live dashboard connected: dashboard {dashboard.id}, team {team_id}")
+    try:
+        async with asyncio.TaskGroup() as tasks:
+            tasks.create_task(
+                stream_widget_updates(
+                    socket.send_text,
+                    channels,
+                    dashboard.widgets,
+                    stream_session,
+                    object_registry,
+                    team_id,
+                    cache=time_series_cache,
+                )
+            )
+            tasks.create_task(_receive_until_disconnect(socket))
+    except* WebSocketDisconnect:
+        logger.info(f"Live dashboard disconnected: dashboard {dashboard.id}")
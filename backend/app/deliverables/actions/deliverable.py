@@ -20,7 +20,7 @@ from app.deliverables.schemas import (
     DeliverableUpdateSchema,
 )
 from app.media.models import Media
-from app.utils.db import create_model, update_model
+from app.utils.db import create_model, delete_model, update_model
 
 deliverable_actions = action_group_factory(
     ActionGroupType.DeliverableActions,
@@ -43,7 +43,7 @@ class DeleteDeliverable(BaseObjectAction[Deliverable, EmptyActionData]):
     async def execute(
         cls, obj: Deliverable, data: EmptyActionData, transaction: AsyncSession, deps
     ) -> ActionExecutionResponse:
-        await transaction.delete(obj)
+        await delete_model(session=transaction, model_instance=obj, user_id=deps.user, team_id=obj.team_id)
         return ActionExecutionResponse(
             message="Deleted deliverable",
         )
@@ -98,6 +98,8 @@ class PublishDeliverable(BaseObjectAction[Deliverable, EmptyActionData]):
             message="Published deliverable",
         )
 
+    availability_inputs = ("state",)
+
     @classmethod
     def is_available(cls, obj: Deliverable | None, deps) -> bool:
         return obj is not None and obj.state == DeliverableStates.DRAFT
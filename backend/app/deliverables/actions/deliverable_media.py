@@ -66,6 +66,8 @@ class AcceptDeliverableMedia(BaseObjectAction[DeliverableMedia, EmptyActionData]
             message="Accepted media",
         )
 
+    availability_inputs = ("approved_at",)
+
     @classmethod
     def is_available(cls, obj: DeliverableMedia | None, deps) -> bool:
         # Only available if not already approved
@@ -97,6 +99,8 @@ class RejectDeliverableMedia(BaseObjectAction[DeliverableMedia, EmptyActionData]
             message="Rejected media",
         )
 
+    availability_inputs = ("approved_at",)
+
     @classmethod
     def is_available(cls, obj: DeliverableMedia | None, deps) -> bool:
         # Only available if already approved
@@ -35,6 +35,18 @@ class Deliverable(
     """Deliverable object model."""
 
     __tablename__ = "deliverables"
+    # Matches the default list ordering (created_at DESC, id DESC) for keyset pagination
+    __table_args__ = (
+        sa.Index("ix_deliverables_created_at_id", "created_at", "id"),
+        # Backs DeliverableObject.search_columns (ILIKE and trigram similarity)
+        sa.Index(
+            "ix_deliverables_search_trgm",
+            "title",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops", "content": "gin_trgm_ops"},
+        ),
+    )
 
     # Deliverable-specific fields
     title: Mapped[str] = mapped_column(sa.Text, nullable=False)
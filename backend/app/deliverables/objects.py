@@ -5,7 +5,7 @@ from app.campaigns.models import Campaign
 from app.deliverables.enums import DeliverableStates, SocialMediaPlatforms
 from app.deliverables.models import Deliverable, DeliverableMedia
 from app.objects.base import BaseObject
-from app.objects.enums import ObjectTypes
+from app.objects.enums import ListExecution, ObjectTypes
 from app.objects.schemas import (
     DatetimeFieldValue,
     EnumFieldValue,
@@ -56,6 +56,18 @@ class DeliverableObject(BaseObject[Deliverable]):
         joinedload(Deliverable.thread),
     ]
 
+    # Projection for requested list columns
+    list_columns = ("title", "content")
+
+    # Trigram-indexed search (ix_deliverables_search_trgm)
+    search_columns = ("title", "content")
+
+    # Pre-aggregated time series (time_series_rollups)
+    rollup_fields = ("platforms", "state")
+
+    # Page ids first so the media association collection isn't joined into the sorted page query
+    list_execution = ListExecution.two_phase
+
     column_definitions = [
         ObjectColumn(
             key="id",
@@ -112,6 +124,7 @@ class DeliverableObject(BaseObject[Deliverable]):
             editable=False,
             include_in_list=True,
             object_type=ObjectTypes.Campaigns,
+            load=("campaign",),
         ),
         ObjectColumn(
             key="content",
@@ -173,6 +186,7 @@ class DeliverableObject(BaseObject[Deliverable]):
             include_in_list=True,
             query_relationship="assigned_roster",
             query_column="name",
+            load=("campaign.assigned_roster",),
         ),
         # ObjectColumn(
         #     key="content_owner",
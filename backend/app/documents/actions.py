@@ -13,7 +13,7 @@ from app.actions.schemas import ActionExecutionResponse, DownloadFileActionResul
 from app.documents.enums import DocumentActions, DocumentStates
 from app.documents.models import Document
 from app.documents.schemas import DocumentUpdateSchema, RegisterDocumentSchema
-from app.utils.db import update_model
+from app.utils.db import delete_model, update_model
 
 # Create document action group
 document_actions = action_group_factory(
@@ -36,7 +36,7 @@ class DeleteDocument(BaseObjectAction[Document, EmptyActionData]):
     async def execute(
         cls, obj: Document, data: EmptyActionData, transaction: AsyncSession, deps
     ) -> ActionExecutionResponse:
-        await transaction.delete(obj)
+        await delete_model(session=transaction, model_instance=obj, user_id=deps.user, team_id=obj.team_id)
         return ActionExecutionResponse(
             message="Deleted document",
         )
@@ -93,6 +93,8 @@ class DownloadDocument(BaseObjectAction[Document, EmptyActionData]):
             ),
         )
 
+    availability_inputs = ("state",)
+
     @classmethod
     def is_available(cls, obj: Document | None, deps) -> bool:
         return obj is not None and obj.state == DocumentStates.READY
@@ -1,7 +1,8 @@
 import logging
-from typing import Any
+from typing import Any, NamedTuple
 
 from litestar.channels import ChannelsPlugin
+from sqlalchemy import inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.base.models import BaseDBModel
@@ -17,7 +18,7 @@ from app.threads.enums import ThreadSocketMessageType
 from app.threads.models import Message
 from app.threads.schemas import ServerMessage
 from app.threads.services import (
-    get_or_create_thread,
+    get_or_create_threads,
     notify_thread,
 )
 from app.utils.sqids import sqid_encode
@@ -31,59 +32,81 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 
-async def _post_to_thread(
-    session: AsyncSession,
-    event: Event,
-    content: dict,
-    user_id: int | None,
-    channels: ChannelsPlugin,
-    campaign_id: int | None = None,
-) -> None:
+class ThreadPost(NamedTuple):
+    """A message to post to the thread of an event's object."""
+
+    event: Event
+    content: dict
+    user_id: int | None  # None for system messages
+    campaign_id: int | None = None  # For dual-scoped messages
+
+
+async def _post_to_threads(session: AsyncSession, posts: list[ThreadPost], channels: ChannelsPlugin) -> None:
     """
-    Helper to post a message to an object's thread.
+    Helper to post messages to their objects' threads.
+
+    Threads are looked up (or created) together and the messages inserted with
+    one flush; each thread's WebSocket subscribers are then notified. An event
+    that already has a message (coalesced updates, outbox redelivery) rewrites
+    it instead of posting another.
 
     Args:
         session: Database session
-        event: The event that triggered this
-        content: TipTap content to post
-        user_id: User ID for the message (None for system messages)
+        posts: Messages to post, one per event
         channels: ChannelsPlugin instance from DI
-        campaign_id: Optional campaign_id for dual-scoped messages
     """
-    # Get or create thread for this object
-    thread = await get_or_create_thread(
-        transaction=session,
-        threadable_type=event.object_type,
-        threadable_id=event.object_id,
-        team_id=event.team_id,
-    )
+    result = await session.execute(select(Message).where(Message.event_id.in_([post.event.id for post in posts])))
+    existing = {message.event_id: message for message in result.scalars()}
 
-    # Create thread message
-    thread_message = Message(
-        thread_id=thread.id,
-        user_id=user_id,
-        content=content,
-        team_id=event.team_id,
-        campaign_id=campaign_id,
+    new_posts = [post for post in posts if post.event.id not in existing]
+    threads = (
+        await get_or_create_threads(
+            session, [(post.event.object_type, post.event.object_id, post.event.team_id) for post in new_posts]
+        )
+        if new_posts
+        else {}
     )
-    session.add(thread_message)
+
+    # Create thread messages
+    thread_messages = []
+    for post in posts:
+        thread_message = existing.get(post.event.id)
+        if thread_message is None:
+            thread_message = Message(
+                thread_id=threads[post.event.object_type, post.event.object_id].id,
+                user_id=post.user_id,
+                content=post.content,
+                team_id=post.event.team_id,
+                campaign_id=post.campaign_id,
+                event_id=post.event.id,
+            )
+            session.add(thread_message)
+        else:
+            thread_message.content = post.content
+        thread_messages.append(thread_message)
     await session.flush()
 
     # Notify WebSocket subscribers
     # Event messages are system-created messages
-    await notify_thread(
-        channels,
-        thread.id,
-        ServerMessage(
-            message_type=ThreadSocketMessageType.MESSAGE_CREATED,
-            message_id=sqid_encode(thread_message.id),
-            thread_id=sqid_encode(thread.id),
-            user_id=sqid_encode(0),  # System user (events have no user_id)
-            viewers=[],  # Empty - event consumers don't have viewer_store access
-        ),
-    )
-
-    logger.info(f"Posted event {event.id} to thread {thread.id} as message {thread_message.id}")
+    for post, thread_message in zip(posts, thread_messages, strict=True):
+        updated = post.event.id in existing
+        await notify_thread(
+            channels,
+            thread_message.thread_id,
+            ServerMessage(
+                message_type=(
+                    ThreadSocketMessageType.MESSAGE_UPDATED if updated else ThreadSocketMessageType.MESSAGE_CREATED
+                ),
+                message_id=sqid_encode(thread_message.id),
+                thread_id=sqid_encode(thread_message.thread_id),
+                user_id=sqid_encode(0),  # System user (events have no user_id)
+                viewers=[],  # Empty - event consumers don't have viewer_store access
+            ),
+        )
+        logger.info(
+            f"{'Updated' if updated else 'Posted'} event {post.event.id} in thread {thread_message.thread_id}"
+            f" as message {thread_message.id}"
+        )
 
 
 def _format_object_ref(event: Event, obj: Any) -> str:
@@ -186,74 +209,70 @@ def _get_campaign_id(obj: Any) -> int | None:
     return getattr(obj, "campaign_id", None)
 
 
-@event_consumer(EventType.CREATED, model=THREADABLE_MODELS)
-async def post_created_to_thread(session: AsyncSession, event: Event, obj: Any, channels: ChannelsPlugin) -> None:
-    """Post creation events to thread (attributed to actor)."""
-    object_ref = _format_object_ref(event, obj)
-
+@event_consumer(EventType.CREATED, model=THREADABLE_MODELS, outbox=True, batch=True)
+async def post_created_to_thread(
+    session: AsyncSession, events: list[Event], objs: list[Any], channels: ChannelsPlugin
+) -> None:
+    """Post creation events to threads (attributed to actor)."""
     # Simple creation message - no actor name needed since it's attributed to the user
-    content = doc(paragraph(text("created "), bold(object_ref)))
-
-    campaign_id = _get_campaign_id(obj)
-    await _post_to_thread(
-        session,
-        event,
-        content,
-        user_id=event.actor_id,
-        channels=channels,
-        campaign_id=campaign_id,
-    )
+    posts = [
+        ThreadPost(
+            event,
+            doc(paragraph(text("created "), bold(_format_object_ref(event, obj)))),
+            user_id=event.actor_id,
+            campaign_id=_get_campaign_id(obj),
+        )
+        for event, obj in zip(events, objs, strict=True)
+    ]
+    await _post_to_threads(session, posts, channels)
 
 
-@event_consumer(EventType.UPDATED, model=THREADABLE_MODELS)
+@event_consumer(EventType.UPDATED, model=THREADABLE_MODELS, outbox=True, batch=True)
 async def post_updated_to_thread(
-    session: AsyncSession, event: Event, obj: BaseDBModel, channels: ChannelsPlugin
+    session: AsyncSession, events: list[Event], objs: list[BaseDBModel], channels: ChannelsPlugin
 ) -> None:
-    """Post update events to thread (attributed to actor)."""
-    # Parse event data into structured format
-    event_data = _parse_event_data_to_updated(event.event_data)
-
-    # Build message content
-    content = build_update_message_content(
-        obj=obj,
-        event_data=event_data,
-        object_type=event.object_type,
-        object_id=event.object_id,
-    )
-
-    campaign_id = _get_campaign_id(obj)
-    await _post_to_thread(
-        session,
-        event,
-        content,
-        user_id=event.actor_id,
-        channels=channels,
-        campaign_id=campaign_id,
-    )
+    """Post update events to threads (attributed to actor).
 
+    A coalesced update arrives with only its own changes; the message shows
+    the merged event's.
+    """
+    logged = [await session.get(Event, event.id) if inspect(event).transient else event for event in events]
+    posts = [
+        ThreadPost(
+            event,
+            build_update_message_content(
+                obj=obj,
+                event_data=_parse_event_data_to_updated((logged_event or event).event_data),
+                object_type=event.object_type,
+                object_id=event.object_id,
+            ),
+            user_id=event.actor_id,
+            campaign_id=_get_campaign_id(obj),
+        )
+        for event, logged_event, obj in zip(events, logged, objs, strict=True)
+    ]
+    await _post_to_threads(session, posts, channels)
 
-@event_consumer(EventType.DELETED, model=THREADABLE_MODELS)
-async def post_deleted_to_thread(session: AsyncSession, event: Event, obj: Any, channels: ChannelsPlugin) -> None:
-    """Post deletion events to thread (system message)."""
-    object_ref = _format_object_ref(event, obj)
 
+@event_consumer(EventType.DELETED, model=THREADABLE_MODELS, outbox=True, batch=True)
+async def post_deleted_to_thread(
+    session: AsyncSession, events: list[Event], objs: list[Any], channels: ChannelsPlugin
+) -> None:
+    """Post deletion events to threads (system message)."""
     # Deletion is a system message (no user attribution)
-    content = doc(paragraph(text("deleted "), bold(object_ref)))
-
-    campaign_id = _get_campaign_id(obj)
-    await _post_to_thread(
-        session,
-        event,
-        content,
-        user_id=None,
-        channels=channels,
-        campaign_id=campaign_id,
-    )
+    posts = [
+        ThreadPost(
+            event,
+            doc(paragraph(text("deleted "), bold(_format_object_ref(event, obj)))),
+            user_id=None,
+            campaign_id=_get_campaign_id(obj),
+        )
+        for event, obj in zip(events, objs, strict=True)
+    ]
+    await _post_to_threads(session, posts, channels)
 
 
-@event_consumer(EventType.STATE_CHANGED, model=THREADABLE_MODELS)
-async def post_state_changed_to_thread(session: AsyncSession, event: Event, obj: Any, channels: ChannelsPlugin) -> None:
-    """Post state change events to thread (system message)."""
+def _state_changed_content(event: Event, obj: Any) -> dict[str, Any]:
     object_ref = _format_object_ref(event, obj)
 
     # Extract state change from event data
@@ -262,7 +281,7 @@ async def post_state_changed_to_thread(session: AsyncSession, event: Event, obj:
         old_state = state_change.get("old", "unknown").replace("_", " ").title()
         new_state = state_change.get("new", "unknown").replace("_", " ").title()
 
-        content = doc(
+        return doc(
             paragraph(
                 text("moved "),
                 bold(object_ref),
@@ -271,16 +290,17 @@ async def post_state_changed_to_thread(session: AsyncSession, event: Event, obj:
                 text(f" (from {old_state})"),
             )
         )
-    else:
-        # Fallback
-        content = doc(paragraph(text("changed state of "), bold(object_ref)))
-
-    campaign_id = _get_campaign_id(obj)
-    await _post_to_thread(
-        session,
-        event,
-        content,
-        user_id=None,
-        channels=channels,
-        campaign_id=campaign_id,
-    )
+    # Fallback
+    return doc(paragraph(text("changed state of "), bold(object_ref)))
+
+
+@event_consumer(EventType.STATE_CHANGED, model=THREADABLE_MODELS, outbox=True, batch=True)
+async def post_state_changed_to_thread(
+    session: AsyncSession, events: list[Event], objs: list[Any], channels: ChannelsPlugin
+) -> None:
+    """Post state change events to threads (system message)."""
+    posts = [
+        ThreadPost(event, _state_changed_content(event, obj), user_id=None, campaign_id=_get_campaign_id(obj))
+        for event, obj in zip(events, objs, strict=True)
+    ]
+    await _post_to_threads(session, posts, channels)
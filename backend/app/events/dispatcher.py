@@ -0,0 +1,185 @@
+"""Outbox dispatcher: delivers committed events to ``outbox=True`` consumers.
+
+With ``EVENT_DISPATCH_MODE=outbox``, ``emit_event`` runs only the inline
+consumers and records the event in ``event_outbox`` (in the request's
+transaction), so request latency no longer depends on the outbox consumers.
+The worker runs ``run_outbox_dispatcher``, which wakes on the NOTIFY sent at
+commit (or every ``OUTBOX_POLL_SECONDS``) and drains the outbox:
+
+- Entries are claimed with ``FOR UPDATE SKIP LOCKED`` and leased for
+  ``OUTBOX_LEASE_SECONDS``, so several workers can drain concurrently.
+- Each consumer runs in its own team-scoped transaction, which also appends
+  it to the entry's ``completed`` checkpoint. A crash or failure redelivers
+  only the consumers that haven't completed: delivery is at-least-once for
+  side effects outside the database (channel publishes).
+- A failed consumer is retried when the lease expires, up to
+  ``OUTBOX_MAX_ATTEMPTS`` claims; exhausted entries stay in the table with
+  ``last_error`` for inspection.
+"""
+
+import asyncio
+import logging
+from collections.abc import Sequence
+from contextlib import suppress
+from datetime import timedelta
+from typing import Any
+
+from litestar.channels import ChannelsPlugin
+from sqlalchemy import Row, delete, func, inspect as sa_inspect, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import selectinload
+
+import app.events.consumers  # noqa: F401 - registers the outbox consumers
+from app.base.models import BaseDBModel
+from app.events.models import Event, EventOutboxEntry
+from app.events.registry import get_outbox_consumers
+from app.events.service import OUTBOX_CHANNEL
+from app.utils.db import team_session_factory
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_BATCH_SIZE = 100
+OUTBOX_POLL_SECONDS = 30.0
+OUTBOX_LEASE_SECONDS = 60
+OUTBOX_MAX_ATTEMPTS = 10
+
+
+async def _claim(session_maker: async_sessionmaker[AsyncSession], limit: int) -> Sequence[Row]:
+    """Lease up to ``limit`` due entries, oldest first."""
+    due = (
+        select(EventOutboxEntry.event_id)
+        .where(EventOutboxEntry.available_at <= func.now(), EventOutboxEntry.attempts < OUTBOX_MAX_ATTEMPTS)
+        .order_by(EventOutboxEntry.event_id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    stmt = (
+        update(EventOutboxEntry)
+        .where(EventOutboxEntry.event_id.in_(due.scalar_subquery()))
+        .values(
+            attempts=EventOutboxEntry.attempts + 1,
+            available_at=func.now() + timedelta(seconds=OUTBOX_LEASE_SECONDS),
+        )
+        .returning(EventOutboxEntry.event_id, EventOutboxEntry.team_id, EventOutboxEntry.completed)
+    )
+    async with session_maker() as session, session.begin():
+        result = await session.execute(stmt)
+        return sorted(result.all(), key=lambda row: row.event_id)
+
+
+def _model_for_table(table: str) -> type[BaseDBModel] | None:
+    return next((model for model in BaseDBModel.get_all_models() if model.__tablename__ == table), None)
+
+
+async def _load_object(session: AsyncSession, event: Event) -> BaseDBModel | None:
+    """The event's object (soft-deleted included), with its many-to-one relationships loaded.
+
+    None when the row was hard-deleted.
+    """
+    model = _model_for_table(event.object_type)
+    if model is None:
+        return None
+    # Consumers read parents (e.g. a deliverable media's deliverable); async sessions can't lazy-load
+    parents = [selectinload(rel.class_attribute) for rel in sa_inspect(model).relationships if not rel.uselist]
+    stmt = select(model).where(model.id == event.object_id).options(*parents).execution_options(include_deleted=True)
+    result = await session.execute(stmt)
+    return result.unique().scalar_one_or_none()
+
+
+async def _finish(session_maker: async_sessionmaker[AsyncSession], event_id: int, error: str | None) -> None:
+    """Delete a fully delivered entry, or record why it will be retried."""
+    async with session_maker() as session, session.begin():
+        if error is None:
+            await session.execute(delete(EventOutboxEntry).where(EventOutboxEntry.event_id == event_id))
+        else:
+            await session.execute(
+                update(EventOutboxEntry).where(EventOutboxEntry.event_id == event_id).values(last_error=error)
+            )
+
+
+async def deliver(
+    session_maker: async_sessionmaker[AsyncSession],
+    event_id: int,
+    team_id: int,
+    completed: Sequence[str],
+    dependencies: dict[str, Any],
+) -> bool:
+    """Run the event's outbox consumers that haven't completed; True when none failed."""
+    team_session = team_session_factory(session_maker, team_id)
+    async with team_session() as session:
+        event = await session.get(Event, event_id)
+    if event is None:
+        logger.warning(f"Outbox event {event_id} no longer exists; dropping it")
+        await _finish(session_maker, event_id, None)
+        return True
+
+    errors = []
+    for registration in get_outbox_consumers(event):
+        name = registration.name
+        if name in completed:
+            continue
+        try:
+            async with team_session() as session:
+                obj = await _load_object(session, event)
+                await registration.call(session, event, obj, dependencies)
+                # Checkpoint in the consumer's transaction, so its writes and the checkpoint commit together
+                await session.execute(
+                    update(EventOutboxEntry)
+                    .where(EventOutboxEntry.event_id == event_id)
+                    .values(completed=func.array_append(EventOutboxEntry.completed, name))
+                )
+        except Exception as e:
+            logger.error(f"Outbox consumer '{name}' failed for event {event_id}: {e}", exc_info=True)
+            errors.append(f"{name}: {e}")
+
+    await _finish(session_maker, event_id, "\n".join(errors) if errors else None)
+    return not errors
+
+
+async def drain_outbox(
+    session_maker: async_sessionmaker[AsyncSession],
+    dependencies: dict[str, Any],
+    batch_size: int = OUTBOX_BATCH_SIZE,
+) -> dict[str, int]:
+    """Deliver every due entry; returns counts of delivered and failed events."""
+    stats = {"delivered": 0, "failed": 0}
+    while entries := await _claim(session_maker, batch_size):
+        for entry in entries:
+            delivered = await deliver(session_maker, entry.event_id, entry.team_id, entry.completed, dependencies)
+            stats["delivered" if delivered else "failed"] += 1
+        if len(entries) < batch_size:
+            break
+    return stats
+
+
+async def run_outbox_dispatcher(
+    session_maker: async_sessionmaker[AsyncSession],
+    channels: ChannelsPlugin,
+    poll_interval: float = OUTBOX_POLL_SECONDS,
+) -> None:
+    """Drain the outbox whenever an event commits (and every ``poll_interval``); runs until cancelled.
+
+    Polling picks up notifications missed while the worker was down and
+    retries failed deliveries once their lease expires.
+    """
+    wake = asyncio.Event()
+
+    async def on_notify(_: bytes) -> None:
+        wake.set()
+
+    dependencies = {"channels": channels}
+    async with (
+        channels.start_subscription([OUTBOX_CHANNEL]) as subscriber,
+        subscriber.run_in_background(on_notify),
+    ):
+        logger.info("Event outbox dispatcher started")
+        while True:
+            wake.clear()
+            try:
+                stats = await drain_outbox(session_maker, dependencies)
+                if stats["delivered"] or stats["failed"]:
+                    logger.info(f"Event outbox drained: {stats}")
+            except Exception:
+                logger.exception("Event outbox drain failed")
+            with suppress(TimeoutError):
+                await asyncio.wait_for(wake.wait(), poll_interval)
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import ForeignKey, Index, String
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column, relationship
 
 from app.base.models import BaseDBModel
 from app.base.scope_mixins import RLSMixin
@@ -26,10 +27,27 @@ class Event(RLSMixin(), BaseDBModel):
     Events are processed by registered consumers for downstream actions.
 
     Team-scoped via RLS for data isolation.
+
+    Range-partitioned by ``created_at`` month (see app/events/partitions.py).
+    Postgres requires the partition key in the primary key, so the table's
+    key is (id, created_at); ids stay unique (one sequence), and the ORM
+    identifies events by ``id`` alone.
     """
 
     __tablename__ = "events"
 
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    @declared_attr.directive
+    @classmethod
+    def __mapper_args__(cls) -> dict[str, Any]:
+        return {"primary_key": [cls.__table__.c.id]}
+
     # Actor - who triggered the event
     actor_id: Mapped[Sqid] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
     actor: Mapped[User] = relationship("User", foreign_keys=[actor_id], lazy="joined")
@@ -62,7 +80,30 @@ class Event(RLSMixin(), BaseDBModel):
         Index("ix_events_team_created", "team_id", "created_at"),
         # Index for actor-specific events
         Index("ix_events_actor", "actor_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
     def __repr__(self) -> str:
         return f"<Event({self.event_type.value}: {self.object_type}#{self.object_id} by User#{self.actor_id})>"
+
+
+class EventOutboxEntry(BaseDBModel.registry.generate_base()):
+    """An event awaiting delivery to outbox consumers (see app/events/dispatcher.py).
+
+    Inserted in the writing transaction, so it exists exactly when the event
+    does. ``completed`` checkpoints the consumers that have already handled the
+    event; the row is deleted once all of them have. Not RLS-scoped: the
+    dispatcher claims entries across teams.
+    """
+
+    __tablename__ = "event_outbox"
+
+    event_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    team_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    completed: Mapped[list[str]] = mapped_column(ARRAY(Text), nullable=False, server_default="{}")
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    # Claimed entries move this forward by the lease, which doubles as the retry delay
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), index=True
+    )
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
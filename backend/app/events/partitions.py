@@ -0,0 +1,143 @@
+"""Monthly partitions of the ``events`` table and archival of old months.
+
+``events`` is range-partitioned by ``created_at``: one partition per UTC month
+(``events_YYYY_MM``), plus ``events_default`` for rows outside every month
+partition. Queries bounded on ``created_at`` only scan the months they cover,
+and vacuum works per partition.
+
+The daily ``maintain_event_partitions`` task (app/events/tasks.py) creates
+partitions ``EVENT_PARTITION_MONTHS_AHEAD`` months ahead and archives every
+month older than ``EVENT_RETENTION_MONTHS``: its rows are written to object
+storage as gzipped NDJSON (one ``row_to_json`` event per line) under
+``archive_key(month)``, then the partition is dropped.
+
+Partition DDL goes through the ``events_create_partition`` and
+``events_drop_partition`` functions (created by the migration). Only their
+owner, the admin role, may call them: the task runs on the worker's admin
+sessions, and the RLS-restricted application role can't create or drop
+partitions.
+"""
+
+import asyncio
+import gzip
+import logging
+import re
+import tempfile
+from datetime import UTC, date, datetime
+from typing import IO
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.client.s3_client import BaseS3Client
+
+logger = logging.getLogger(__name__)
+
+EVENT_PARTITION_MONTHS_AHEAD = 3
+EVENT_ARCHIVE_PREFIX = "archive/events"
+
+# Rows read per round trip while exporting a partition
+_EXPORT_BATCH_SIZE = 5000
+
+_PARTITION_NAME = re.compile(r"^events_(\d{4})_(\d{2})$")
+
+
+def month_start(value: date | datetime) -> date:
+    """First day of the (UTC) month containing ``value``."""
+    if isinstance(value, datetime):
+        value = value.astimezone(UTC).date()
+    return value.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    """First day of the month ``months`` after ``month`` (negative for earlier)."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"events_{month:%Y_%m}"
+
+
+def archive_key(month: date) -> str:
+    """Object storage key of a month's archive."""
+    return f"{EVENT_ARCHIVE_PREFIX}/{month:%Y}/{month:%m}.ndjson.gz"
+
+
+async def create_partitions(session: AsyncSession, first: date, last: date) -> list[str]:
+    """Ensure month partitions exist from ``first`` through ``last``; returns their names."""
+    names = []
+    month = month_start(first)
+    while month <= last:
+        result = await session.execute(text("SELECT events_create_partition(:month)"), {"month": month})
+        names.append(result.scalar_one())
+        month = add_months(month, 1)
+    return names
+
+
+async def list_partitions(session: AsyncSession) -> list[date]:
+    """Months that have a partition, oldest first (the default partition is skipped)."""
+    result = await session.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits"
+            " JOIN pg_class parent ON parent.oid = pg_inherits.inhparent"
+            " JOIN pg_class child ON child.oid = pg_inherits.inhrelid"
+            " WHERE parent.relname = 'events'"
+        )
+    )
+    months = []
+    for name in result.scalars():
+        if match := _PARTITION_NAME.match(name):
+            months.append(date(int(match[1]), int(match[2]), 1))
+    return sorted(months)
+
+
+async def export_partition(session: AsyncSession, month: date, fileobj: IO[bytes]) -> int:
+    """Write a month's events to ``fileobj`` as gzipped NDJSON, in id order; returns the row count.
+
+    Reads through ``events`` with the partition's bounds, so only that
+    partition is scanned (and the parent's grants and RLS apply).
+    """
+    stmt = text(
+        "SELECT row_to_json(e)::text FROM events e WHERE e.created_at >= :start AND e.created_at < :end ORDER BY e.id"
+    ).execution_options(yield_per=_EXPORT_BATCH_SIZE)
+    bounds = {
+        "start": datetime.combine(month, datetime.min.time(), UTC),
+        "end": datetime.combine(add_months(month, 1), datetime.min.time(), UTC),
+    }
+    rows = 0
+    with gzip.GzipFile(fileobj=fileobj, mode="wb") as archive:
+        result = await session.stream(stmt, bounds)
+        async for line in result.scalars():
+            archive.write(line.encode())
+            archive.write(b"\n")
+            rows += 1
+    return rows
+
+
+async def archive_partition(
+    session_maker: async_sessionmaker[AsyncSession], s3_client: BaseS3Client, month: date
+) -> int:
+    """Archive a month's events to object storage, then drop its partition; returns the row count.
+
+    The partition is only dropped after the upload succeeded. Re-running for
+    a month that failed midway re-exports and overwrites the archive.
+    """
+    with tempfile.TemporaryFile() as fileobj:
+        async with session_maker() as session, session.begin():
+            rows = await export_partition(session, month, fileobj)
+        fileobj.seek(0)
+        # boto3 is blocking
+        await asyncio.to_thread(s3_client.upload_fileobj, fileobj, archive_key(month))
+
+    async with session_maker() as session, session.begin():
+        await session.execute(text("SELECT events_drop_partition(:month)"), {"month": month})
+
+    logger.info(f"Archived {rows} events of {month:%Y-%m} to {archive_key(month)}")
+    return rows
+
+
+def expired_months(partitions: list[date], today: date, retention_months: int) -> list[date]:
+    """Partitioned months entirely older than the retention period."""
+    cutoff = add_months(month_start(today), -retention_months)
+    return [month for month in partitions if month < cutoff]
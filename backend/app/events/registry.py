@@ -1,10 +1,18 @@
-"""Event consumer registry with decorator-based registration and filtering."""
+"""Event consumer registry with decorator-based registration and filtering.
+
+Registration compiles a dispatch index keyed by ``(EventType, object_type)``:
+each entry lists the matching registrations in registration order, and each
+registration carries an argument adapter built from its signature once. Per
+event, dispatch is a dict lookup plus building each consumer's kwargs.
+"""
 
 from __future__ import annotations
 
+import inspect
 import logging
-from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -20,31 +28,102 @@ logger = logging.getLogger(__name__)
 # Using Callable[..., Awaitable[None]] to allow flexible signatures
 EventConsumer = Callable[..., Awaitable[None]]
 
+# Builds a consumer's kwargs from the core values (session, event/obj or events/objs) and dependencies
+ArgumentAdapter = Callable[[dict[str, Any], dict[str, Any]], dict[str, Any]]
+
+_CORE_ARGUMENTS = ("session", "event", "obj", "events", "objs")
+
+
+def consumer_name(consumer: EventConsumer) -> str:
+    """Stable identifier of a consumer, recorded in outbox checkpoints."""
+    return f"{consumer.__module__}.{consumer.__qualname__}"
+
+
+def _argument_adapter(consumer: EventConsumer) -> ArgumentAdapter:
+    """Compile which arguments ``consumer`` accepts into a kwargs builder.
+
+    Core arguments the consumer declares are always passed; dependencies are
+    passed when provided (a missing required one fails the call, as before).
+    """
+    params = inspect.signature(consumer).parameters
+    core = tuple(name for name in _CORE_ARGUMENTS if name in params)
+    extra = tuple(name for name in params if name not in _CORE_ARGUMENTS)
+
+    def adapt(values: dict[str, Any], dependencies: dict[str, Any]) -> dict[str, Any]:
+        kwargs = {name: values[name] for name in core}
+        for name in extra:
+            if name in dependencies:
+                kwargs[name] = dependencies[name]
+        return kwargs
 
-@dataclass
+    return adapt
+
+
+@dataclass(eq=False)
 class ConsumerRegistration:
-    """Registration info for an event consumer."""
+    """Registration info for an event consumer.
+
+    Batch consumers take ``events``/``objs`` lists (aligned) instead of
+    ``event``/``obj``, and are called once per flushed batch of events.
+    """
 
     consumer: EventConsumer
     model_filters: list[type[BaseDBModel]] | None = None
+    outbox: bool = False
+    batch: bool = False
+    tables: frozenset[str] | None = field(init=False)
+    name: str = field(init=False)
+    adapt_arguments: ArgumentAdapter = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.tables = (
+            None if self.model_filters is None else frozenset(model.__tablename__ for model in self.model_filters)
+        )
+        self.name = consumer_name(self.consumer)
+        self.adapt_arguments = _argument_adapter(self.consumer)
 
     def matches(self, event: Event) -> bool:
         """Check if this consumer should handle the given event."""
-        if self.model_filters is None:
-            return True
+        return self.tables is None or event.object_type in self.tables
 
-        # Check if event's object_type matches any of the model table names
-        return any(event.object_type == model.__tablename__ for model in self.model_filters)
+    def call(
+        self, session: AsyncSession, event: Event, obj: BaseDBModel | None, dependencies: dict[str, Any]
+    ) -> Awaitable[None]:
+        """Call the consumer for one event, with the arguments its signature accepts."""
+        if self.batch:
+            return self.call_batch(session, [event], [obj], dependencies)
+        return self.consumer(**self.adapt_arguments({"session": session, "event": event, "obj": obj}, dependencies))
+
+    def call_batch(
+        self,
+        session: AsyncSession,
+        events: list[Event],
+        objs: Sequence[BaseDBModel | None],
+        dependencies: dict[str, Any],
+    ) -> Awaitable[None]:
+        """Call a batch consumer once for ``events``."""
+        return self.consumer(**self.adapt_arguments({"session": session, "events": events, "objs": objs}, dependencies))
 
 
 class EventConsumerRegistry(BaseRegistry[EventType, list[ConsumerRegistration]]):
     """Registry for event consumers with filtering support."""
 
+    # (event type, object type) -> matching registrations; (event type, None) serves unlisted object types
+    _dispatch: dict[tuple[EventType, str | None], tuple[ConsumerRegistration, ...]]
+
+    def __new__(cls, **dependencies: Any) -> EventConsumerRegistry:
+        inst = super().__new__(cls, **dependencies)
+        if not hasattr(inst, "_dispatch"):
+            inst._dispatch = {}
+        return inst
+
     def register_consumer(
         self,
         event_type: EventType,
         consumer: EventConsumer,
         model_filters: list[type[BaseDBModel]] | None = None,
+        outbox: bool = False,
+        batch: bool = False,
     ) -> None:
         """
         Register a consumer for an event type with optional model filtering.
@@ -53,12 +132,15 @@ class EventConsumerRegistry(BaseRegistry[EventType, list[ConsumerRegistration]])
             event_type: The event type to listen for
             consumer: The consumer function to call
             model_filters: Optional list of model classes to filter by
+            outbox: Deliver from the event outbox when outbox dispatch is enabled
+            batch: Call the consumer once per batch of events (``events``/``objs``)
         """
         if event_type not in self._registry:
             self._registry[event_type] = []
 
-        registration = ConsumerRegistration(consumer=consumer, model_filters=model_filters)
+        registration = ConsumerRegistration(consumer=consumer, model_filters=model_filters, outbox=outbox, batch=batch)
         self._registry[event_type].append(registration)
+        self._compile(event_type)
 
         if model_filters:
             models_str = ", ".join(m.__tablename__ for m in model_filters)
@@ -67,7 +149,38 @@ class EventConsumerRegistry(BaseRegistry[EventType, list[ConsumerRegistration]])
             filter_info = ""
         logger.debug(f"Registered event consumer '{consumer.__name__}' for {event_type.value}{filter_info}")
 
-    def get_consumers(self, event: Event) -> list[EventConsumer]:
+    def _compile(self, event_type: EventType) -> None:
+        """Rebuild the dispatch entries of ``event_type`` (registration order is kept)."""
+        registrations = self._registry[event_type]
+        for key in [key for key in self._dispatch if key[0] == event_type]:
+            del self._dispatch[key]
+
+        tables = set().union(*(reg.tables for reg in registrations if reg.tables is not None))
+        for table in tables:
+            self._dispatch[(event_type, table)] = tuple(
+                reg for reg in registrations if reg.tables is None or table in reg.tables
+            )
+        self._dispatch[(event_type, None)] = tuple(reg for reg in registrations if reg.tables is None)
+
+    def get_registrations(self, event: Event, outbox: bool | None = None) -> tuple[ConsumerRegistration, ...]:
+        """
+        Get the registrations that should handle the given event, in registration order.
+
+        Args:
+            event: The event to get consumers for
+            outbox: Only outbox (True) or only inline (False) consumers; None for all
+
+        Returns:
+            Matching registrations
+        """
+        registrations = self._dispatch.get((event.event_type, event.object_type))
+        if registrations is None:
+            registrations = self._dispatch.get((event.event_type, None), ())
+        if outbox is None:
+            return registrations
+        return tuple(reg for reg in registrations if reg.outbox == outbox)
+
+    def get_consumers(self, event: Event, outbox: bool | None = None) -> list[EventConsumer]:
         """
         Get all consumers that should handle the given event.
 
@@ -75,12 +188,12 @@ class EventConsumerRegistry(BaseRegistry[EventType, list[ConsumerRegistration]])
 
         Args:
             event: The event to get consumers for
+            outbox: Only outbox (True) or only inline (False) consumers; None for all
 
         Returns:
             List of consumer functions that match the event
         """
-        registrations = self._registry.get(event.event_type, [])
-        return [reg.consumer for reg in registrations if reg.matches(event)]
+        return [reg.consumer for reg in self.get_registrations(event, outbox)]
 
 
 # Global singleton registry
@@ -90,15 +203,28 @@ _registry = EventConsumerRegistry()
 def event_consumer(
     *event_types: EventType,
     model: type[BaseDBModel] | list[type[BaseDBModel]] | None = None,
+    outbox: bool = False,
+    batch: bool = False,
 ) -> Callable[[EventConsumer], EventConsumer]:
     """
     Decorator to register a function as an event consumer.
 
     Consumer functions are called synchronously after an event is emitted.
+    With ``outbox=True`` and ``EVENT_DISPATCH_MODE=outbox``, they are instead
+    delivered after the request commits by the worker's outbox dispatcher
+    (app/events/dispatcher.py), in their own transaction. Consumers that must
+    run in the writing transaction (cache invalidation, rollups) stay inline.
+
+    Events emitted during a request are buffered and dispatched together
+    before commit (app/events/service.py). Consumers run once per event,
+    unless ``batch=True``: then they are called once with the matching
+    ``events`` and ``objs``.
 
     Args:
         *event_types: One or more EventType values to listen for
         model: Optional model class or list of model classes to filter events by
+        outbox: Deliver from the event outbox when outbox dispatch is enabled
+        batch: Call the consumer once per batch of events (``events``/``objs``)
 
     Examples:
         # Handle all created events
@@ -120,6 +246,11 @@ def event_consumer(
         @event_consumer(EventType.CREATED, EventType.UPDATED, model=Campaign)
         async def track_campaign_changes(session: AsyncSession, event: Event, campaign: Campaign) -> None:
             print(f"Campaign {event.event_type.value}: {campaign.name}")
+
+        # Handle a request's creations together
+        @event_consumer(EventType.CREATED, batch=True)
+        async def log_creations(session: AsyncSession, events: list[Event], objs: list[BaseDBModel]) -> None:
+            print(f"Created {len(events)} objects")
     """
 
     def decorator(func: EventConsumer) -> EventConsumer:
@@ -129,51 +260,68 @@ def event_consumer(
             model_filters = [model] if not isinstance(model, list) else model
 
         for event_type in event_types:
-            _registry.register_consumer(event_type, func, model_filters)
+            _registry.register_consumer(event_type, func, model_filters, outbox, batch)
         return func
 
     return decorator
 
 
-async def trigger_consumers(session: AsyncSession, event: Event, obj: BaseDBModel, **dependencies) -> None:
-    """Trigger all registered consumers for an event in registration order."""
-    import inspect
+async def trigger_consumers(
+    session: AsyncSession,
+    events: Sequence[Event],
+    objs: Sequence[BaseDBModel],
+    outbox: bool | None = None,
+    **dependencies,
+) -> None:
+    """Trigger registered consumers for a batch of events (``objs`` aligned with ``events``).
 
-    consumers = _registry.get_consumers(event)
-
-    if not consumers:
-        logger.debug(f"No consumers registered for {event.event_type.value} on {event.object_type}")
+    Consumers run in registration order, each over its matching events in
+    order: one call per event, or a single call for batch consumers.
+    ``outbox`` selects outbox (True) or inline (False) consumers; None
+    triggers all of them.
+    """
+    matched: dict[ConsumerRegistration, tuple[list[Event], list[BaseDBModel]]] = {}
+    for event, obj in zip(events, objs, strict=True):
+        for registration in _registry.get_registrations(event, outbox=outbox):
+            matched_events, matched_objs = matched.setdefault(registration, ([], []))
+            matched_events.append(event)
+            matched_objs.append(obj)
+
+    if not matched:
+        logger.debug(f"No consumers registered for {len(events)} event(s)")
         return
 
-    logger.debug(
-        f"Triggering {len(consumers)} consumer(s) for {event.event_type.value} on {event.object_type}#{event.object_id}"
-    )
-
-    for consumer in consumers:
-        try:
-            # Inspect consumer signature to pass only accepted parameters
-            sig = inspect.signature(consumer)
-            params = sig.parameters
-
-            # Prepare candidate arguments (core + dependencies)
-            candidate_args = {
-                "session": session,
-                "event": event,
-                "obj": obj,
-                **dependencies,
-            }
-
-            # Filter to only parameters the consumer accepts
-            filtered_kwargs = {name: val for name, val in candidate_args.items() if name in params}
-
-            await consumer(**filtered_kwargs)
-            logger.debug(f"Consumer '{consumer.__name__}' completed successfully")
-        except Exception as e:
-            logger.error(
-                f"Consumer '{consumer.__name__}' failed for event {event.id}: {e}",
-                exc_info=True,
+    logger.debug(f"Triggering {len(matched)} consumer(s) for {len(events)} event(s)")
+
+    for registration, (matched_events, matched_objs) in matched.items():
+        if registration.batch:
+            await _run_consumer(
+                registration,
+                matched_events,
+                lambda: registration.call_batch(session, matched_events, matched_objs, dependencies),
             )
-            # Continue processing other consumers even if one fails
+        else:
+            for event, obj in zip(matched_events, matched_objs, strict=True):
+                await _run_consumer(registration, [event], lambda: registration.call(session, event, obj, dependencies))
+
+
+async def _run_consumer(
+    registration: ConsumerRegistration, events: list[Event], call: Callable[[], Awaitable[None]]
+) -> None:
+    try:
+        await call()
+        logger.debug(f"Consumer '{registration.consumer.__name__}' completed successfully")
+    except Exception as e:
+        logger.error(
+            f"Consumer '{registration.consumer.__name__}' failed for event(s) {[event.id for event in events]}: {e}",
+            exc_info=True,
+        )
+        # Continue processing other consumers even if one fails
+
+
+def get_outbox_consumers(event: Event) -> tuple[ConsumerRegistration, ...]:
+    """Registrations the outbox dispatcher delivers ``event`` to."""
+    return _registry.get_registrations(event, outbox=True)
 
 
 def get_registered_consumers() -> dict[EventType, list[str]]:
@@ -45,6 +45,26 @@ def make_field_changes(old_values: dict[str, Any], new_values: dict[str, Any]) -
     return changes
 
 
+def merge_field_changes(
+    earlier: dict[str, dict[str, Any]], later: dict[str, dict[str, Any]]
+) -> dict[str, dict[str, Any]]:
+    """
+    Combine two consecutive stored change maps (``event_data["changes"]``) into one.
+
+    Each field keeps its first old value and takes its latest new value; fields
+    that end up back where they started are dropped.
+
+    Example:
+        >>> merge_field_changes({"name": {"old": "A", "new": "B"}}, {"name": {"old": "B", "new": "C"}})
+        >>> # Returns: {"name": {"old": "A", "new": "C"}}
+    """
+    merged = dict(earlier)
+    for field, change in later.items():
+        old = earlier[field]["old"] if field in earlier else change["old"]
+        merged[field] = {"old": old, "new": change["new"]}
+    return {field: change for field, change in merged.items() if change["old"] != change["new"]}
+
+
 @dataclass
 class FieldChange:
     """Represents a change to a single field."""
@@ -1,14 +1,37 @@
-"""Event emission service - pure event recording with consumer triggering."""
+"""Event emission service - pure event recording with consumer triggering.
+
+Inside ``buffered_events`` (every request transaction, see
+``provide_transaction``), ``emit_event`` only collects the event on the
+session. ``flush_events`` runs when the block exits, before commit: it
+inserts the collected events with one flush (a single multi-row INSERT) and
+triggers consumers for the whole batch, so batch consumers handle a bulk
+update in one call. Outside a buffer, events are written and dispatched
+immediately.
+
+UPDATED events coalesce: within the object's window (``event_coalesce_seconds``
+on its object class, else ``EVENT_COALESCE_SECONDS``), an update that follows
+an UPDATED event by the same actor on the same object merges its field
+changes into that event instead of adding a row, whether the earlier event is
+still buffered or already stored. Consumers still see every update, as an
+event with the merged event's id carrying only its own changes, so delta
+consumers (rollups) stay exact; the thread consumer rewrites the event's
+message from the merged changes instead of posting another one.
+"""
 
 import logging
-from dataclasses import asdict
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from litestar.channels import ChannelsPlugin
+from sqlalchemy import func, inspect as sa_inspect, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.base.models import BaseDBModel
-from app.events.models import Event, EventType
+from app.events.models import Event, EventOutboxEntry, EventType
 from app.events.registry import trigger_consumers
 from app.events.schemas import (
     CreatedEventData,
@@ -16,10 +39,18 @@ from app.events.schemas import (
     DeletedEventData,
     StateChangedEventData,
     UpdatedEventData,
+    merge_field_changes,
 )
+from app.utils.configure import config
 from app.utils.tracing import trace_operation
 
 logger = logging.getLogger(__name__)
+
+# Postgres NOTIFY channel that wakes the outbox dispatcher when an event commits
+OUTBOX_CHANNEL = "event_outbox"
+
+# session.info key of the active EventBuffer
+EVENT_BUFFER_KEY = "event_buffer"
 type EventDataTypes = (
     CreatedEventData
     | UpdatedEventData
@@ -31,6 +62,15 @@ type EventDataTypes = (
 )
 
 
+@dataclass
+class EventBuffer:
+    """Events emitted in a session but not yet written, with their objects and consumer dependencies."""
+
+    events: list[Event] = field(default_factory=list)
+    objs: list[BaseDBModel] = field(default_factory=list)
+    dependencies: dict[str, Any] = field(default_factory=dict)
+
+
 @trace_operation("emit_event")
 async def emit_event(
     session: AsyncSession,
@@ -41,6 +81,12 @@ async def emit_event(
     event_data: EventDataTypes = None,
     channels: ChannelsPlugin | None = None,
 ) -> Event:
+    """Record an event and trigger its consumers.
+
+    Within ``buffered_events`` the event is only collected; it gets its id
+    (and consumers run) when the buffer flushes. An UPDATED event that
+    coalesces returns the event it was merged into.
+    """
     # Get object metadata
     object_type = obj.__tablename__
     object_id = obj.id
@@ -63,16 +109,201 @@ async def emit_event(
         event_data=data_dict,
         team_id=team_id,
     )
-    session.add(event)
-    await session.flush()
 
-    logger.info(f"Event emitted: {event_type.value} on {object_type}#{object_id} by User#{user_id}")
+    if event_type == EventType.DELETED:
+        # Consumers may run after the row is gone: load the columns they can read while it still exists
+        state = sa_inspect(obj)
+        if unloaded := [key for key in state.mapper.column_attrs.keys() if key in state.unloaded]:
+            await session.refresh(obj, attribute_names=unloaded)
 
-    # Trigger consumers, passing the actual object and any DI dependencies
+    # Consumer dependencies (DI)
     dependencies = {}
     if channels is not None:
         dependencies["channels"] = channels
 
-    await trigger_consumers(session, event, obj, **dependencies)
+    buffer: EventBuffer | None = session.info.get(EVENT_BUFFER_KEY)
+    if buffer is not None:
+        buffer.dependencies.update(dependencies)
+        if (pending := _merge_pending(buffer, event)) is not None:
+            return pending
+        buffer.events.append(event)
+        buffer.objs.append(obj)
+        return event
+
+    [(logged, dispatched)] = await _write(session, [event])
+
+    logger.info(f"Event emitted: {event_type.value} on {object_type}#{object_id} by User#{user_id}")
+
+    await _dispatch(session, [dispatched], [obj], dependencies)
+
+    return logged
+
+
+async def flush_events(session: AsyncSession) -> None:
+    """Write the session's buffered events in one INSERT and trigger their consumers together.
+
+    Repeats while consumers emit further events.
+    """
+    buffer: EventBuffer | None = session.info.get(EVENT_BUFFER_KEY)
+    while buffer is not None and buffer.events:
+        events, objs = buffer.events, buffer.objs
+        buffer.events, buffer.objs = [], []
+
+        written = await _write(session, events)
+        logger.info(f"Events emitted: {len(events)} buffered event(s)")
+
+        await _dispatch(session, [dispatched for _, dispatched in written], objs, buffer.dependencies)
+
+
+@asynccontextmanager
+async def buffered_events(session: AsyncSession) -> AsyncGenerator[None]:
+    """Collect events emitted in ``session`` and flush them when the block completes.
+
+    Events are discarded if the block raises (the transaction rolls back).
+    Nested blocks share the outermost buffer.
+    """
+    if EVENT_BUFFER_KEY in session.info:
+        yield
+        return
+
+    session.info[EVENT_BUFFER_KEY] = EventBuffer()
+    try:
+        yield
+        await flush_events(session)
+    finally:
+        session.info.pop(EVENT_BUFFER_KEY, None)
+
+
+def _coalesce_window(object_type: str) -> float:
+    """Seconds within which consecutive UPDATED events on ``object_type`` merge (0 disables)."""
+    from app.objects.base import BaseObject
 
-    return event
+    for object_class in BaseObject.registry.get_all_types().values():
+        if object_class.model().__tablename__ == object_type and object_class.event_coalesce_seconds is not None:
+            return object_class.event_coalesce_seconds
+    return config.EVENT_COALESCE_SECONDS
+
+
+def _changes(event: Event) -> dict[str, dict[str, Any]] | None:
+    """An UPDATED event's stored change map; None when its data isn't in ``UpdatedEventData`` form."""
+    changes = (event.event_data or {}).get("changes")
+    return changes if isinstance(changes, dict) else None
+
+
+def _merge_into(earlier: Event, event: Event) -> bool:
+    """Fold ``event``'s changes into ``earlier`` if the two coalesce; returns whether they did."""
+    if earlier.event_type != EventType.UPDATED or earlier.actor_id != event.actor_id:
+        return False
+    earlier_changes, changes = _changes(earlier), _changes(event)
+    if earlier_changes is None or changes is None:
+        return False
+    earlier.event_data = {"changes": merge_field_changes(earlier_changes, changes)}
+    return True
+
+
+def _merge_pending(buffer: EventBuffer, event: Event) -> Event | None:
+    """Merge an UPDATED event into the object's last buffered event if they coalesce; returns that event."""
+    if event.event_type != EventType.UPDATED or not _coalesce_window(event.object_type):
+        return None
+    key = (event.object_type, event.object_id)
+    pending = next((e for e in reversed(buffer.events) if (e.object_type, e.object_id) == key), None)
+    if pending is None or not _merge_into(pending, event):
+        return None
+    return pending
+
+
+async def _merge_stored(session: AsyncSession, event: Event) -> Event | None:
+    """Merge an UPDATED event into the object's latest stored event if they coalesce; returns that event.
+
+    The window runs from the stored event's last merge, so a burst of edits
+    keeps extending it.
+    """
+    window = _coalesce_window(event.object_type)
+    if event.event_type != EventType.UPDATED or not window:
+        return None
+    # Served by ix_events_team_object; the row lock serializes concurrent merges into one event
+    stmt = (
+        select(Event)
+        .where(
+            Event.team_id == event.team_id,
+            Event.object_type == event.object_type,
+            Event.object_id == event.object_id,
+        )
+        .order_by(Event.created_at.desc(), Event.id.desc())
+        .limit(1)
+        .with_for_update(of=Event)
+    )
+    latest = (await session.execute(stmt)).scalar_one_or_none()
+    now = datetime.now(tz=UTC)
+    if latest is None or latest.updated_at < now - timedelta(seconds=window) or not _merge_into(latest, event):
+        return None
+    latest.updated_at = now
+    return latest
+
+
+def _increment(logged: Event, event: Event) -> Event:
+    """A transient event with ``logged``'s identity and only ``event``'s changes, for consumers."""
+    return Event(
+        id=logged.id,
+        actor_id=logged.actor_id,
+        object_type=logged.object_type,
+        object_id=logged.object_id,
+        event_type=logged.event_type,
+        event_data=event.event_data,
+        team_id=logged.team_id,
+        created_at=logged.created_at,
+    )
+
+
+async def _write(session: AsyncSession, events: list[Event]) -> list[tuple[Event, Event]]:
+    """Insert ``events`` with one flush, merging coalescing UPDATED events into their stored predecessor.
+
+    Returns (logged, dispatched) pairs aligned with ``events``: an inserted
+    event is both; a merged one is logged as the stored event and dispatched
+    as its increment.
+    """
+    written: list[tuple[Event, Event]] = []
+    seen: set[tuple[str, int]] = set()
+    for event in events:
+        key = (event.object_type, event.object_id)
+        # An earlier event of this batch sits between this one and the object's stored events
+        logged = None if key in seen else await _merge_stored(session, event)
+        seen.add(key)
+        if logged is None:
+            session.add(event)
+            written.append((event, event))
+        else:
+            written.append((logged, _increment(logged, event)))
+
+    # The unit of work batches the inserts into a single INSERT ... VALUES (...), (...) RETURNING id
+    await session.flush()
+    return written
+
+
+async def _dispatch(
+    session: AsyncSession, events: list[Event], objs: list[BaseDBModel], dependencies: dict[str, Any]
+) -> None:
+    """Trigger consumers, passing the actual objects and any DI dependencies."""
+    if config.EVENT_DISPATCH_MODE == "outbox":
+        # Outbox consumers run after commit in the worker (app/events/dispatcher.py)
+        await enqueue_outbox(session, events)
+        await trigger_consumers(session, events, objs, outbox=False, **dependencies)
+    else:
+        await trigger_consumers(session, events, objs, **dependencies)
+
+
+async def enqueue_outbox(session: AsyncSession, events: list[Event]) -> None:
+    """Record ``events`` for outbox delivery and wake the dispatcher once the transaction commits.
+
+    A coalesced event is queued again from scratch, so its consumers see the merged changes.
+    """
+    stmt = insert(EventOutboxEntry)
+    await session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[EventOutboxEntry.event_id],
+            set_={"completed": [], "attempts": 0, "available_at": func.now(), "last_error": None},
+        ),
+        [{"event_id": event.id, "team_id": event.team_id} for event in events],
+    )
+    # Identical notifications within a transaction are delivered once
+    await session.execute(select(func.pg_notify(OUTBOX_CHANNEL, "")))
@@ -0,0 +1,52 @@
+"""Background tasks for the partitioned events table."""
+
+import logging
+from datetime import UTC, datetime
+
+from app.events.partitions import (
+    EVENT_PARTITION_MONTHS_AHEAD,
+    add_months,
+    archive_partition,
+    create_partitions,
+    expired_months,
+    list_partitions,
+    month_start,
+)
+from app.queue.registry import scheduled_task
+from app.queue.transactions import task_transaction
+from app.queue.types import AppContext
+
+__all__ = ["maintain_event_partitions"]
+
+logger = logging.getLogger(__name__)
+
+
+@scheduled_task(cron="45 2 * * *", timeout=3600)
+async def maintain_event_partitions(ctx: AppContext) -> dict:
+    """Create upcoming monthly event partitions and archive expired ones.
+
+    Runs daily at 2:45 AM UTC. Partitions are created
+    ``EVENT_PARTITION_MONTHS_AHEAD`` months ahead, so a missed run never leaves
+    inserts without one. Months older than ``EVENT_RETENTION_MONTHS`` are
+    archived to object storage and dropped, one per transaction. Runs as the
+    admin role, the only one allowed to call the partition functions.
+
+    Args:
+        ctx: SAQ task context
+
+    Returns:
+        Dictionary with the created partitions and archived row counts per month
+    """
+    today = datetime.now(tz=UTC).date()
+    async with task_transaction(ctx["admin_sessionmaker"]) as transaction:
+        created = await create_partitions(
+            transaction, month_start(today), add_months(month_start(today), EVENT_PARTITION_MONTHS_AHEAD)
+        )
+        expired = expired_months(await list_partitions(transaction), today, ctx["config"].EVENT_RETENTION_MONTHS)
+
+    archived = {}
+    for month in expired:
+        archived[f"{month:%Y-%m}"] = await archive_partition(ctx["admin_sessionmaker"], ctx["s3_client"], month)
+
+    logger.info(f"Event partition maintenance completed: {len(created)} partitions ensured, archived {archived}")
+    return {"partitions": created, "archived": archived}
@@ -37,6 +37,7 @@ from app.campaigns.routes import campaign_router
 from app.client.openai_client import provide_openai_client
 from app.client.s3_client import provide_s3_client
 from app.dashboard.routes import dashboard_router
+from app.dashboard.websocket import dashboard_live_handler
 from app.deliverables.routes import deliverable_router
 from app.documents.routes.documents import document_router
 from app.emails.client import provide_email_client
@@ -53,6 +54,7 @@ from app.threads.websocket import thread_handler
 from app.users.routes import user_router
 from app.utils import providers
 from app.utils.configure import ConfigProtocol
+from app.utils.db_metrics import instrument_statement_cache
 from app.utils.exceptions import ApplicationError, exception_to_http_response
 from app.utils.logging import create_logging_config
 from app.utils.sqids import Sqid, sqid_dec_hook, sqid_enc_hook, sqid_type_predicate
@@ -89,6 +91,9 @@ def create_app(
 
         initialize_opentelemetry(config)
 
+    # Compiled-statement cache hit/miss counters (exported once a meter provider is set)
+    instrument_statement_cache()
+
     # ========================================================================
     # Logging Configuration
     # ========================================================================
@@ -100,6 +105,7 @@ def create_app(
     stores = {
         "sessions": providers.create_postgres_session_store(),
         "viewers": MemoryStore(),
+        "time_series": providers.create_time_series_cache_store(config),
     } | (stores_overrides or {})
 
     # ========================================================================
@@ -141,6 +147,7 @@ def create_app(
 
     dependencies = {
         "transaction": Provide(providers.provide_transaction),
+        "stream_session": Provide(providers.provide_stream_session, sync_to_thread=False),
         "http_client": Provide(providers.provide_http, sync_to_thread=False),
         "config": Provide(lambda: config, sync_to_thread=False),
         "s3_client": Provide(_provide_s3_client, sync_to_thread=False),
@@ -152,6 +159,7 @@ def create_app(
         "team_id": Provide(providers.provide_team_id, sync_to_thread=False),
         "campaign_id": Provide(providers.provide_campaign_id, sync_to_thread=False),
         "viewer_store": Provide(providers.provide_viewer_store, sync_to_thread=False),
+        "time_series_cache": Provide(providers.provide_time_series_cache, sync_to_thread=False),
     } | (dependencies_overrides or {})
 
     # ========================================================================
@@ -255,6 +263,7 @@ def create_app(
         document_router,
         invoice_router,
         dashboard_router,
+        dashboard_live_handler,
         view_router,
         thread_router,
         thread_handler,
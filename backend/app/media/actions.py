@@ -13,7 +13,7 @@ from app.actions.schemas import ActionExecutionResponse, DownloadFileActionResul
 from app.media.enums import MediaActions, MediaStates
 from app.media.models import Media
 from app.media.schemas import MediaUpdateSchema, RegisterMediaSchema
-from app.utils.db import update_model
+from app.utils.db import delete_model, update_model
 
 # Create media action group
 media_actions = action_group_factory(
@@ -36,7 +36,7 @@ class DeleteMedia(BaseObjectAction[Media, EmptyActionData]):
     async def execute(
         cls, obj: Media, data: EmptyActionData, transaction: AsyncSession, deps
     ) -> ActionExecutionResponse:
-        await transaction.delete(obj)
+        await delete_model(session=transaction, model_instance=obj, user_id=deps.user, team_id=obj.team_id)
         return ActionExecutionResponse(
             message="Deleted media",
         )
@@ -93,6 +93,8 @@ class DownloadMedia(BaseObjectAction[Media, EmptyActionData]):
             ),
         )
 
+    availability_inputs = ("state",)
+
     @classmethod
     def is_available(cls, obj: Media | None, deps) -> bool:
         return obj is not None and obj.state == MediaStates.READY
@@ -2,25 +2,35 @@ from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, ClassVar
 
-import sqlalchemy as sa
-from sqlalchemy import Select, func, inspect, or_, select
+import msgspec
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.base import ExecutableOption
 
 from app.actions.registry import ActionRegistry
 from app.base.models import BaseDBModel
 from app.base.registry import BaseRegistry
-from app.objects.enums import ObjectTypes
+from app.objects.counts import (
+    ESTIMATE_EXACT_THRESHOLD,
+    count_cache,
+    count_cache_key,
+    count_estimate,
+    count_exact,
+    is_estimable,
+)
+from app.objects.enums import CountStrategy, ListExecution, ObjectTypes
+from app.objects.pagination import SortKey, apply_cursor, encode_cursor, resolve_sort_keys
+from app.objects.projection import projection_options
 from app.objects.schemas import (
     ColumnDefinitionSchema,
     ObjectColumn,
-    ObjectFieldDTO,
+    ObjectListPage,
     ObjectListRequest,
     ObjectListSchema,
-    SortDirection,
 )
+from app.objects.search import ilike_search_filter, search_rank, trigram_search_filter
+from app.objects.serializer import ListSerializer
 from app.objects.services import apply_filter, get_filter_by_field_type
-from app.utils.sqids import sqid_encode
 
 if TYPE_CHECKING:
     from app.actions.enums import ActionGroupType
@@ -60,10 +70,38 @@ class BaseObject[O: BaseDBModel](ABC):
     # Load options for eager loading relationships
     load_options: ClassVar[list[ExecutableOption]] = []
 
+    # Column projection for list queries (see app/objects/projection.py): the model
+    # columns and relationship paths every row needs beyond its fields, i.e. for
+    # title, subtitle, state and action availability. None opts out of projection.
+    list_columns: ClassVar[tuple[str, ...] | None] = None
+    list_load_paths: ClassVar[tuple[str, ...]] = ()
+
+    # How list pages are fetched: a single eager-loading query, or page ids then hydrate
+    list_execution: ClassVar[ListExecution] = ListExecution.single
+
+    # Trigram-indexed columns for free-text search (see app/objects/search.py);
+    # each opted-in table needs its GIN index and search_<table> function.
+    # None falls back to ILIKE across every String/Text column.
+    search_columns: ClassVar[tuple[str, ...] | None] = None
+
+    # How list totals are computed (see app/objects/counts.py)
+    count_strategy: ClassVar[CountStrategy] = CountStrategy.exact
+
+    # Enum/String or numeric fields with pre-aggregated time series (see app/objects/rollups.py)
+    rollup_fields: ClassVar[tuple[str, ...]] = ()
+
+    # UPDATED event coalescing window in seconds; None uses EVENT_COALESCE_SECONDS (see app/events/service.py)
+    event_coalesce_seconds: ClassVar[float | None] = None
+
+    # Compiled list serializers keyed by rendered column keys (see list_serializer)
+    _list_serializers: ClassVar[dict[tuple[str, ...], ListSerializer]]
+
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
+        cls._list_serializers = {}
         if cls.object_type is not None:
             cls.registry.register(cls.object_type, cls)
+            cls.list_serializer()
 
     @classmethod
     def get_column_schemas(cls) -> list[ColumnDefinitionSchema]:
@@ -89,65 +127,92 @@ class BaseObject[O: BaseDBModel](ABC):
         return action_group.get_available_actions()
 
     @classmethod
-    def to_list_schema(cls, obj: O) -> ObjectListSchema:
-        # Generate fields from column_definitions
-        fields: list[ObjectFieldDTO] = []
+    def uses_projection(cls, request: ObjectListRequest) -> bool:
+        return cls.list_columns is not None and request.column is not None
 
-        for col_def in cls.column_definitions:
-            # Skip if not included in list view
-            if not col_def.include_in_list:
-                continue
-
-            # Extract already-wrapped field value from column definition
-            field_value = col_def.value(obj)
-
-            # Create field DTO
-            field_dto = ObjectFieldDTO(
-                key=col_def.key,
-                value=field_value,
-                label=col_def.label,
-                editable=col_def.editable,
-            )
-            fields.append(field_dto)
-
-        # Get per-object actions if action group is defined
-        actions = []
-        if cls.action_group:
-            action_group = ActionRegistry().get_class(cls.action_group)
-            actions = action_group.get_available_actions(obj=obj)
-
-        object_id = sqid_encode(obj.id)
-        return ObjectListSchema(
-            id=object_id,
-            object_type=cls.object_type,
-            title=cls.title_field(obj),
-            subtitle=cls.subtitle_field(obj),
-            state=getattr(obj, "state", None),
-            created_at=obj.created_at,
-            updated_at=obj.updated_at,
-            actions=actions,
-            fields=fields,
-            link=f"/{cls.object_type}/{object_id}",
-        )
+    @classmethod
+    def get_list_columns(cls, request: ObjectListRequest) -> list[ObjectColumn]:
+        """Column definitions to render for a list request.
+
+        With projection enabled only the requested columns are rendered, since the
+        others' dependencies aren't loaded.
+        """
+        columns = [col_def for col_def in cls.column_definitions if col_def.include_in_list]
+        if cls.uses_projection(request):
+            requested = set(request.column or [])
+            columns = [col_def for col_def in columns if col_def.key in requested]
+        return columns
 
     @classmethod
-    def create_search_filter(cls, search_term: str | None):
-        # Short-circuit if no search term or empty/whitespace
-        if not search_term or not search_term.strip():
-            return None
+    def get_list_load_options(cls, request: ObjectListRequest) -> list[ExecutableOption]:
+        """Loader options for a list request: projected if enabled, else ``load_options``."""
+        if not cls.uses_projection(request):
+            return cls.load_options
+        return cls._projected_options(request, restrict_columns=True)
+
+    @classmethod
+    def get_hydrate_options(
+        cls, request: ObjectListRequest, columns: Sequence[ObjectColumn] | None = None
+    ) -> list[ExecutableOption]:
+        """Loader options for hydrating a page of ids in two-phase execution.
+
+        Built from the declared column dependencies when available, so collections
+        are selectin-loaded; otherwise falls back to ``load_options``. Passing
+        ``columns`` loads exactly what those columns need.
+        """
+        if cls.list_columns is None:
+            return cls.load_options
+        if columns is not None:
+            return cls._projected_options(request, restrict_columns=True, columns=columns)
+        return cls._projected_options(request, restrict_columns=cls.uses_projection(request))
+
+    @classmethod
+    def _projected_options(
+        cls, request: ObjectListRequest, restrict_columns: bool, columns: Sequence[ObjectColumn] | None = None
+    ) -> list[ExecutableOption]:
+        # Sort keys are read back when encoding the next-page cursor
+        column_names = [
+            *(cls.list_columns or ()),
+            *(sort_key.key for sort_key in resolve_sort_keys(cls.model(), request)),
+        ]
+        load_paths = list(cls.list_load_paths)
+        for col_def in cls.get_list_columns(request) if columns is None else columns:
+            column_names.extend(col_def.columns if col_def.columns is not None else (col_def.key,))
+            load_paths.extend(col_def.load)
+        return projection_options(cls.model(), column_names if restrict_columns else None, load_paths)
 
-        # Introspect model to find all string/text columns
-        mapper = inspect(cls.model())
-        conditions = []
+    @classmethod
+    def list_serializer(cls, columns: Sequence[ObjectColumn] | None = None) -> ListSerializer:
+        """Compiled serializer rendering ``columns`` (default: every list column).
 
-        for column in mapper.columns:
-            # Check if column is a string type
-            if isinstance(column.type, sa.String | sa.Text):
-                # Add ILIKE condition for case-insensitive search
-                conditions.append(column.ilike(f"%{search_term}%"))
+        The default serializer is compiled at class creation, projected column
+        subsets on first use.
+        """
+        list_columns = [
+            col_def for col_def in (cls.column_definitions if columns is None else columns) if col_def.include_in_list
+        ]
+        key = tuple(col_def.key for col_def in list_columns)
+        serializer = cls._list_serializers.get(key)
+        if serializer is None:
+            serializer = cls._list_serializers[key] = ListSerializer(cls, list_columns)
+        return serializer
 
-        # Return OR condition if we have any conditions
-        return or_(*conditions) if conditions else None
+    @classmethod
+    def to_list_schema(
+        cls, obj: O, action_registry: ActionRegistry, columns: Sequence[ObjectColumn] | None = None
+    ) -> ObjectListSchema:
+        return cls.list_serializer(columns).to_schema(obj, action_registry)
+
+    @classmethod
+    def create_search_filter(cls, search_term: str | None):
+        if cls.search_columns is None:
+            return ilike_search_filter(cls.model(), search_term)
+        return trigram_search_filter(cls.model(), search_term)
+
+    @classmethod
+    def ranks_search(cls, request: ObjectListRequest) -> bool:
+        """Whether results are ordered by search relevance (searchable object, no explicit sort)."""
+        return cls.search_columns is not None and not request.sorts and bool(request.search and request.search.strip())
 
     @classmethod
     async def query_from_request(cls, session: AsyncSession, request: ObjectListRequest):
@@ -155,25 +220,43 @@ class BaseObject[O: BaseDBModel](ABC):
 
         Scope and soft-delete filtering are applied automatically via SQLAlchemy events.
         """
-        query = select(cls.model())
+        # Apply load options (eager loading, or the projection for requested columns)
+        return cls.build_list_query(request, cls.model()).options(*cls.get_list_load_options(request))
 
-        # Apply load options (eager loading, etc.)
-        query = query.options(*cls.load_options)
+    @classmethod
+    def build_list_query(cls, request: ObjectListRequest, *entities: Any) -> Select:
+        """Select ``entities`` with the request's search, filters, sorts and cursor applied."""
+        query = select(*entities)
 
         # Apply search filter if provided
         search_filter = cls.create_search_filter(request.search)
         if search_filter is not None:
             query = query.where(search_filter)
 
+        # Most relevant matches first; the regular sort keys break ties
+        if cls.search_columns is not None and cls.ranks_search(request):
+            query = query.order_by(*search_rank(cls.model(), cls.search_columns, request.search))
+
         # Apply structured filters and sorts using helper method
         query = cls.apply_request_to_query(query, cls.model(), request)
 
-        # Default sort if no sorts applied
-        if not request.sorts:
-            query = query.order_by(cls.model().created_at.desc())
+        # Keyset pagination: continue after the last row of the previous page
+        if request.cursor:
+            query = cls.apply_list_cursor(query, resolve_sort_keys(cls.model(), request), request)
 
         return query
 
+    @classmethod
+    def apply_list_cursor(cls, query: Select, sort_keys: list[SortKey], request: ObjectListRequest) -> Select:
+        """Restrict ``query`` to rows after ``request.cursor``.
+
+        Raises:
+            ValueError: If the cursor is invalid or the request is ordered by search relevance
+        """
+        if cls.ranks_search(request):
+            raise ValueError("Cursor pagination isn't supported for relevance-ranked search")
+        return apply_cursor(query, sort_keys, request.cursor or "")
+
     @classmethod
     async def get_by_id(cls, session: AsyncSession, object_id: int) -> BaseDBModel:
         """Get object by ID.
@@ -189,23 +272,122 @@ class BaseObject[O: BaseDBModel](ABC):
         return obj
 
     @classmethod
-    async def get_list(cls, session: AsyncSession, request: ObjectListRequest) -> tuple[Sequence[BaseDBModel], int]:
+    async def get_list(
+        cls,
+        session: AsyncSession,
+        request: ObjectListRequest,
+        team_id: int | None = None,
+        campaign_id: int | None = None,
+    ) -> ObjectListPage:
         """Get list of objects with filtering and pagination.
 
+        Uses keyset pagination when ``request.cursor`` is set, otherwise offset
+        pagination. One extra row is fetched to decide whether a next page exists.
+        The total is computed according to ``count_strategy``; ``team_id`` and
+        ``campaign_id`` scope the cached exact counts.
+
         Scope and soft-delete filtering are applied automatically via SQLAlchemy events.
+
+        Raises:
+            ValueError: If the cursor is malformed or doesn't match the requested sorts
         """
-        query = await cls.query_from_request(session, request)
-        total_rows = await session.execute(select(func.count()).select_from(query.subquery()))
-        total = total_rows.scalar_one()
+        sort_keys = resolve_sort_keys(cls.model(), request)
+        two_phase = cls.list_execution == ListExecution.two_phase
+
+        # The total ignores the cursor so it stays stable while paging
+        uncursored = msgspec.structs.replace(request, cursor=None)
+        if two_phase:
+            # Phase 1 selects only the sort keys (ending in id): a narrow, index-friendly page query
+            base_query = cls.build_list_query(uncursored, *(sort_key.column for sort_key in sort_keys))
+        else:
+            base_query = await cls.query_from_request(session, uncursored)
 
         # Apply pagination
-        query = query.offset(request.offset).limit(request.limit)
+        if request.cursor:
+            query = cls.apply_list_cursor(base_query, sort_keys, request)
+        else:
+            query = base_query.offset(request.offset)
+        query = query.limit(request.limit + 1)
 
         # Execute query
         result = await session.execute(query)
-        objects = result.unique().scalars().all()
+        rows: Sequence[Any] = result.all() if two_phase else result.unique().scalars().all()
 
-        return objects, total
+        has_more = len(rows) > request.limit
+        rows = rows[: request.limit]
+        # Relevance order isn't a keyset, so ranked searches page by offset
+        next_cursor = (
+            encode_cursor(sort_keys, rows[-1]) if has_more and rows and not cls.ranks_search(request) else None
+        )
+
+        # Phase 2: hydrate the page's ids with selectin-style loads, preserving order
+        objects: Sequence[BaseDBModel] = (
+            await cls.hydrate(session, [row.id for row in rows], request) if two_phase else rows
+        )
+
+        # A short last offset page pins the total without another query
+        if not has_more and not request.cursor and (objects or request.offset == 0):
+            return ObjectListPage(objects=objects, total=request.offset + len(objects), has_more=False)
+
+        total, total_is_estimate = await cls.get_total(session, base_query, request, team_id, campaign_id)
+        return ObjectListPage(
+            objects=objects,
+            total=total,
+            has_more=has_more,
+            next_cursor=next_cursor,
+            total_is_estimate=total_is_estimate,
+        )
+
+    @classmethod
+    async def hydrate(
+        cls,
+        session: AsyncSession,
+        ids: Sequence[int],
+        request: ObjectListRequest,
+        columns: Sequence[ObjectColumn] | None = None,
+    ) -> list[BaseDBModel]:
+        """Load objects for ``ids`` (with what ``columns`` need) and return them in the same order."""
+        if not ids:
+            return []
+        options = cls.get_hydrate_options(request, columns)
+        query = select(cls.model()).where(cls.model().id.in_(ids)).options(*options)
+        result = await session.execute(query)
+        by_id: dict[int, BaseDBModel] = {obj.id: obj for obj in result.unique().scalars().all()}
+        return [by_id[object_id] for object_id in ids if object_id in by_id]
+
+    @classmethod
+    async def get_total(
+        cls,
+        session: AsyncSession,
+        query: Select,
+        request: ObjectListRequest,
+        team_id: int | None = None,
+        campaign_id: int | None = None,
+    ) -> tuple[int | None, bool]:
+        """Compute the list total for ``query`` using ``count_strategy``.
+
+        Returns:
+            Tuple of (total, is_estimate). Total is None for CountStrategy.none.
+        """
+        if cls.count_strategy == CountStrategy.none:
+            return None, False
+
+        if cls.count_strategy == CountStrategy.estimate and is_estimable(request):
+            estimate = await count_estimate(session, cls.model(), query)
+            if estimate >= ESTIMATE_EXACT_THRESHOLD:
+                return estimate, True
+
+        table = cls.model().__tablename__
+        if team_id is None:
+            # Caching is scoped per team; without one just count
+            return await count_exact(session, query), False
+
+        key = await count_cache_key(session, team_id, campaign_id, table, request)
+        total = count_cache.get(key)
+        if total is None:
+            total = await count_exact(session, query)
+            count_cache.set(key, total)
+        return total, False
 
     @classmethod
     def apply_request_to_query(
@@ -215,14 +397,8 @@ class BaseObject[O: BaseDBModel](ABC):
             for filter_def in request.filters:
                 query = apply_filter(query, model_class, filter_def)
 
-        if request.sorts:
-            for sort_def in request.sorts:
-                column = getattr(model_class, sort_def.column, None)
-                if column:
-                    if sort_def.direction == SortDirection.sort_asc:
-                        query = query.order_by(column.asc())
-                    else:
-                        query = query.order_by(column.desc())
+        # Requested sorts (default created_at DESC) plus an id tiebreaker for a stable total order
+        query = query.order_by(*(sort_key.order_by() for sort_key in resolve_sort_keys(model_class, request)))
 
         return query
 
@@ -0,0 +1,271 @@
+"""Result cache for time-series and widget queries.
+
+Widget data used to be recomputed on every page view, even when nothing in
+the team had changed. ``get_time_series`` now looks results up in a Litestar
+store (``app.stores.get("time_series")``) before querying:
+
+- Keys hold the team, the object type, the invalidation generations of every
+  table the query reads, and a hash of the normalized request (resolved
+  field, aggregation, granularity, window and filters). Relative time ranges
+  are aligned to whole buckets (``align_time_range``), so "last_30_days"
+  keeps hitting the same entry until the current bucket ends.
+- CREATED/UPDATED/DELETED events bump the (team, table) generation in
+  ``result_cache_generations``. The bump happens in the writing transaction,
+  so a reader sees the new generation exactly when it can see the write. Old
+  entries are never read again and age out of the store. The bumped rows stay
+  locked until the write commits; every bump takes them in (team, table)
+  order, so concurrent writers wait on each other instead of deadlocking.
+- The store is pluggable (``TIME_SERIES_CACHE_BACKEND``). ``memory`` is an
+  in-process LRU for a single node. ``postgres`` (``result_cache_entries``)
+  is shared by every node.
+
+Only team-scoped requests are cached; campaign guests always query. Writes
+that bypass ``emit_event`` are picked up when entries expire
+(``CACHE_TTL``).
+
+The same events also ``pg_notify`` the (team, table) channel from
+``table_change_channel``, which Postgres delivers when the write commits;
+live dashboards (app/dashboard/live.py) subscribe to it through Channels.
+"""
+
+import hashlib
+import logging
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+
+import msgspec
+from litestar.stores.base import StorageObject, Store
+from litestar.stores.memory import MemoryStore
+from sqlalchemy import case, delete, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.events.enums import EventType
+from app.events.models import Event
+from app.events.registry import event_consumer
+from app.objects.enums import ObjectTypes
+from app.objects.models import ResultCacheEntry, ResultCacheGeneration
+
+logger = logging.getLogger(__name__)
+
+CACHE_TTL = timedelta(hours=1)
+LRU_MAX_ENTRIES = 1024
+
+# ``team_id`` of the per-table generation bumped by ``invalidate_tables``
+ALL_TEAMS = 0
+
+# Tables with an object type; events on anything else can't change a cached result
+_CACHED_TABLES = frozenset(object_type.value for object_type in ObjectTypes)
+
+
+class LRUMemoryStore(MemoryStore):
+    """``MemoryStore`` that evicts the least recently used entry beyond ``max_entries``."""
+
+    __slots__ = ("_max_entries",)
+
+    def __init__(self, max_entries: int = LRU_MAX_ENTRIES) -> None:
+        super().__init__()
+        self._store: OrderedDict[str, StorageObject] = OrderedDict()
+        self._max_entries = max_entries
+
+    async def set(self, key: str, value: str | bytes, expires_in: int | timedelta | None = None) -> None:
+        await super().set(key, value, expires_in)
+        async with self._lock:
+            self._store.move_to_end(key)
+            while len(self._store) > self._max_entries:
+                self._store.popitem(last=False)
+
+    async def get(self, key: str, renew_for: int | timedelta | None = None) -> bytes | None:
+        value = await super().get(key, renew_for)
+        if value is not None:
+            async with self._lock:
+                if key in self._store:
+                    self._store.move_to_end(key)
+        return value
+
+
+class PostgresResultStore(Store):
+    """Store backed by ``result_cache_entries``, shared across app nodes."""
+
+    def __init__(self, db_session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self.db_session_factory = db_session_factory
+
+    @staticmethod
+    def _live(now: datetime):
+        return or_(ResultCacheEntry.expires_at.is_(None), ResultCacheEntry.expires_at > now)
+
+    async def set(self, key: str, value: str | bytes, expires_in: int | timedelta | None = None) -> None:
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        if expires_in is not None and not isinstance(expires_in, timedelta):
+            expires_in = timedelta(seconds=expires_in)
+        expires_at = datetime.now(tz=UTC) + expires_in if expires_in else None
+        statement = insert(ResultCacheEntry).values(key=key, value=value, expires_at=expires_at)
+        statement = statement.on_conflict_do_update(
+            index_elements=[ResultCacheEntry.key],
+            set_={"value": statement.excluded.value, "expires_at": statement.excluded.expires_at},
+        )
+        async with self.db_session_factory() as db_session:
+            await db_session.execute(statement)
+            await db_session.commit()
+
+    async def get(self, key: str, renew_for: int | timedelta | None = None) -> bytes | None:
+        now = datetime.now(tz=UTC)
+        async with self.db_session_factory() as db_session:
+            if renew_for is None:
+                statement = select(ResultCacheEntry.value).where(ResultCacheEntry.key == key, self._live(now))
+            else:
+                if not isinstance(renew_for, timedelta):
+                    renew_for = timedelta(seconds=renew_for)
+                # Only entries that were set with an expiry are renewed
+                statement = (
+                    update(ResultCacheEntry)
+                    .where(ResultCacheEntry.key == key, self._live(now))
+                    .values(
+                        expires_at=case(
+                            (ResultCacheEntry.expires_at.is_(None), None),
+                            else_=now + renew_for,
+                        )
+                    )
+                    .returning(ResultCacheEntry.value)
+                )
+            value = (await db_session.execute(statement)).scalar_one_or_none()
+            await db_session.commit()
+            return value
+
+    async def delete(self, key: str) -> None:
+        async with self.db_session_factory() as db_session:
+            await db_session.execute(delete(ResultCacheEntry).where(ResultCacheEntry.key == key))
+            await db_session.commit()
+
+    async def delete_all(self) -> None:
+        async with self.db_session_factory() as db_session:
+            await db_session.execute(delete(ResultCacheEntry))
+            await db_session.commit()
+
+    async def exists(self, key: str) -> bool:
+        return await self.get(key) is not None
+
+    async def expires_in(self, key: str) -> int | None:
+        async with self.db_session_factory() as db_session:
+            expires_at = (
+                await db_session.execute(
+                    select(ResultCacheEntry.expires_at).where(
+                        ResultCacheEntry.key == key, self._live(datetime.now(tz=UTC))
+                    )
+                )
+            ).scalar_one_or_none()
+        if expires_at is None:
+            return None
+        return int((expires_at - datetime.now(tz=UTC)).total_seconds())
+
+    async def delete_expired(self) -> int:
+        """Remove expired entries; returns how many were deleted."""
+        async with self.db_session_factory() as db_session:
+            result = await db_session.execute(
+                delete(ResultCacheEntry).where(ResultCacheEntry.expires_at <= datetime.now(tz=UTC))
+            )
+            await db_session.commit()
+            return result.rowcount
+
+
+# ---------------------------------------------------------------------------
+# Invalidation
+# ---------------------------------------------------------------------------
+
+
+def _changed_tables(events: list[Event]) -> list[tuple[int, str]]:
+    """Distinct (team, table) pairs of cached tables that ``events`` change, sorted.
+
+    The generation upsert locks its rows in this order, so it must be the same for every writer.
+    """
+    return sorted(
+        {
+            (event.team_id, event.object_type)
+            for event in events
+            if event.object_type in _CACHED_TABLES and event.team_id is not None
+        }
+    )
+
+
+@event_consumer(EventType.CREATED, EventType.UPDATED, EventType.DELETED, batch=True)
+async def invalidate_time_series_cache(session: AsyncSession, events: list[Event]) -> None:
+    """Bump the generation of each changed table once, in the writing transaction."""
+    changed = _changed_tables(events)
+    if not changed:
+        return
+    statement = insert(ResultCacheGeneration).values(
+        [{"team_id": team_id, "object_type": table, "generation": 1} for team_id, table in changed]
+    )
+    await session.execute(
+        statement.on_conflict_do_update(
+            index_elements=[ResultCacheGeneration.team_id, ResultCacheGeneration.object_type],
+            set_={"generation": ResultCacheGeneration.generation + 1},
+        )
+    )
+
+
+def table_change_channel(team_id: int, table: str) -> str:
+    """Channels (Postgres LISTEN) name notified when ``team_id``'s rows in ``table`` change."""
+    return f"team_{team_id}_{table}"
+
+
+@event_consumer(EventType.CREATED, EventType.UPDATED, EventType.DELETED, batch=True)
+async def notify_table_change(session: AsyncSession, events: list[Event]) -> None:
+    """Notify each changed (team, table) channel with the table name, once the write commits."""
+    for team_id, table in _changed_tables(events):
+        await session.execute(select(func.pg_notify(table_change_channel(team_id, table), table)))
+
+
+async def invalidate_tables(session: AsyncSession, tables: Iterable[str]) -> None:
+    """Invalidate every team's cached results over ``tables`` (for writes that don't emit events).
+
+    Bumps the tables' ``ALL_TEAMS`` generation, which is part of every key.
+    """
+    statement = insert(ResultCacheGeneration).values(
+        [{"team_id": ALL_TEAMS, "object_type": table, "generation": 1} for table in sorted(set(tables))]
+    )
+    await session.execute(
+        statement.on_conflict_do_update(
+            index_elements=[ResultCacheGeneration.team_id, ResultCacheGeneration.object_type],
+            set_={"generation": ResultCacheGeneration.generation + 1},
+        )
+    )
+
+
+# ---------------------------------------------------------------------------
+# Lookup
+# ---------------------------------------------------------------------------
+
+
+async def cache_key(session: AsyncSession, team_id: int, tables: Iterable[str], request: object) -> str:
+    """Key for ``request`` (any msgspec-encodable value) over ``tables`` at their current generations."""
+    tables = sorted(set(tables))
+    rows = await session.execute(
+        select(
+            ResultCacheGeneration.team_id, ResultCacheGeneration.object_type, ResultCacheGeneration.generation
+        ).where(ResultCacheGeneration.team_id.in_([team_id, ALL_TEAMS]), ResultCacheGeneration.object_type.in_(tables))
+    )
+    generations = {(row_team_id, table): generation for row_team_id, table, generation in rows.tuples()}
+    versions = ",".join(
+        f"{table}.{generations.get((team_id, table), 0)}.{generations.get((ALL_TEAMS, table), 0)}" for table in tables
+    )
+    digest = hashlib.sha256(msgspec.json.encode(request)).hexdigest()
+    return f"ts:{team_id}:{versions}:{digest}"
+
+
+async def get_cached[T](store: Store, key: str, type: type[T]) -> T | None:
+    """Decode a cached value, treating a corrupt or outdated entry as a miss."""
+    raw = await store.get(key)
+    if raw is None:
+        return None
+    try:
+        return msgspec.json.decode(raw, type=type)
+    except msgspec.DecodeError:
+        logger.warning("Discarding undecodable result cache entry", extra={"key": key})
+        return None
+
+
+async def set_cached(store: Store, key: str, value: object) -> None:
+    await store.set(key, msgspec.json.encode(value), expires_in=CACHE_TTL)
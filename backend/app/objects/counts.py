@@ -0,0 +1,132 @@
+"""Total-count strategies for object list queries.
+
+Counting the fully filtered list query doubles the database work of every
+table scroll, so each BaseObject picks a CountStrategy:
+
+- exact: ``SELECT count(*)`` over the filtered query, cached for a short TTL.
+  Keys include the table's ``result_cache_generations`` (app/objects/cache.py),
+  which events bump in the writing transaction, so a total is invalidated
+  exactly when the write becomes visible, on every node.
+- estimate: the planner's row estimate from ``EXPLAIN`` for unfiltered or
+  lightly filtered queries (falls back to exact for small or heavily
+  filtered results, where estimates are least reliable).
+- none: no total; callers rely on ``has_more`` from fetching limit + 1 rows.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import msgspec
+from sqlalchemy import ClauseElement, Executable, Select, func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+
+from app.base.models import BaseDBModel
+from app.objects.cache import cache_key
+from app.objects.schemas import ObjectListRequest
+
+logger = logging.getLogger(__name__)
+
+COUNT_CACHE_TTL_SECONDS = 30.0
+COUNT_CACHE_MAX_ENTRIES = 10_000
+
+# Estimates are only trusted for requests with at most this many filters and no search
+ESTIMATE_MAX_FILTERS = 1
+# Below this many estimated rows an exact count is cheap and more useful
+ESTIMATE_EXACT_THRESHOLD = 1_000
+
+
+@dataclass
+class _CachedCount:
+    total: int
+    expires_at: float
+
+
+class CountCache:
+    """In-process TTL cache of exact list totals.
+
+    Keys (from ``count_cache_key``) carry the table's current generations, so
+    an invalidated total is simply never looked up again; there is nothing to
+    evict on writes, regardless of how many filter variants are cached.
+    """
+
+    def __init__(self, ttl: float = COUNT_CACHE_TTL_SECONDS, max_entries: int = COUNT_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: dict[str, _CachedCount] = {}
+
+    def get(self, key: str) -> int | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return entry.total
+
+    def set(self, key: str, total: int) -> None:
+        if len(self._entries) >= self.max_entries:
+            # Drop the oldest insertion; dicts preserve insertion order
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = _CachedCount(total=total, expires_at=time.monotonic() + self.ttl)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+count_cache = CountCache()
+
+
+async def count_cache_key(
+    session: AsyncSession, team_id: int, campaign_id: int | None, table: str, request: ObjectListRequest
+) -> str:
+    """Cache key for a list total: scope, the table's generations and a hash of filters + search."""
+    shape = msgspec.json.encode({"filters": request.filters, "search": request.search})
+    return await cache_key(session, team_id, [table], ("count", campaign_id, hashlib.sha256(shape).hexdigest()))
+
+
+class _Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON) <statement>`` as an executable construct."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler: Any, **kw: Any) -> str:
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kw)}"
+
+
+async def count_exact(session: AsyncSession, query: Select) -> int:
+    result = await session.execute(select(func.count()).select_from(query.order_by(None).subquery()))
+    return result.scalar_one()
+
+
+async def count_estimate(session: AsyncSession, model_class: type[BaseDBModel], query: Select) -> int:
+    """Planner row estimate for ``query``'s WHERE clause.
+
+    Only the filter predicates are explained (no eager loads or ordering).
+    Soft-deleted rows are excluded explicitly because the ORM loader criteria
+    don't apply to the raw EXPLAIN statement.
+    """
+    # An untyped select list keeps the inner statement's result processors off the EXPLAIN output
+    estimate_query = select(literal_column("1")).select_from(model_class).where(model_class.deleted_at.is_(None))
+    if query.whereclause is not None:
+        estimate_query = estimate_query.where(query.whereclause)
+
+    result = await session.execute(_Explain(estimate_query))
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def is_estimable(request: ObjectListRequest) -> bool:
+    """Whether a request is simple enough for planner estimates to be meaningful."""
+    return not (request.search and request.search.strip()) and len(request.filters) <= ESTIMATE_MAX_FILTERS
@@ -66,6 +66,30 @@ class SortDirection(StrEnum):
     sort_desc = auto()
 
 
+class ExportFormat(StrEnum):
+    """File formats for object list exports."""
+
+    csv = auto()
+    ndjson = auto()  # One JSON object per line, typed values
+    arrow = auto()  # Arrow IPC stream, one record batch per chunk
+    parquet = auto()  # One row group per chunk
+
+
+class ListExecution(StrEnum):
+    """How list endpoints fetch a page of objects."""
+
+    single = auto()  # One query with the list's eager loads
+    two_phase = auto()  # Select the page's ids, then hydrate them with selectin loads
+
+
+class CountStrategy(StrEnum):
+    """How list endpoints compute the total row count."""
+
+    exact = auto()  # count(*) over the filtered query (short-TTL cached)
+    estimate = auto()  # Planner row estimate for unfiltered/lightly filtered queries
+    none = auto()  # No total; rely on has_more
+
+
 class TimeRange(StrEnum):
     """Relative time range options for time series queries."""
 
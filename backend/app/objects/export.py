@@ -0,0 +1,320 @@
+"""Streaming exports for object lists (CSV, NDJSON, Arrow IPC, Parquet).
+
+Matching ids are read through a server-side cursor (``yield_per``) in chunks
+of ``EXPORT_CHUNK_SIZE``. Each chunk is hydrated with just the loaders the
+exported columns need, rendered through the columns' ``value`` accessors and
+handed to the format's writer, which yields its bytes before the next chunk is
+fetched. The identity map is cleared after every chunk, so memory stays flat
+regardless of row count.
+
+CSV flattens every value to text. NDJSON, Arrow and Parquet keep types: the
+column schema comes from ``ObjectColumn.type`` (see ``arrow_type``) and each
+chunk becomes one record batch (one Parquet row group). Arrow and Parquet need
+the optional ``pyarrow`` dependency (``pip install manageros[export]``).
+"""
+
+import csv
+import io
+import zlib
+from collections.abc import AsyncIterator, Sequence
+from datetime import date, datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+import msgspec
+
+from app.objects.enums import ExportFormat, FieldType
+from app.objects.schemas import (
+    DateFieldValue,
+    DatetimeFieldValue,
+    FieldValue,
+    ImageFieldValue,
+    ObjectColumn,
+    ObjectFieldValue,
+    ObjectListRequest,
+    TextFieldValue,
+    USDFieldValue,
+)
+from app.utils.db import StreamSessionFactory
+from app.utils.tiptap import tiptap_to_text
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from app.objects.base import BaseObject
+
+EXPORT_CHUNK_SIZE = 500
+
+# gzip container (header + trailer) rather than a raw zlib stream
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+_USD_CENTS = Decimal("0.01")
+
+_MEDIA_TYPES = {
+    ExportFormat.csv: "text/csv; charset=utf-8",
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.arrow: "application/vnd.apache.arrow.stream",
+    ExportFormat.parquet: "application/vnd.apache.parquet",
+}
+
+_EXTENSIONS = {
+    ExportFormat.csv: "csv",
+    ExportFormat.ndjson: "ndjson",
+    ExportFormat.arrow: "arrows",
+    ExportFormat.parquet: "parquet",
+}
+
+# Formats that can be gzipped; Arrow IPC and Parquet compress internally (zstd)
+TEXT_FORMATS = frozenset({ExportFormat.csv, ExportFormat.ndjson})
+
+
+def resolve_export_columns(object_class: type["BaseObject"], request: ObjectListRequest) -> list[ObjectColumn]:
+    """Columns to export: the requested ones in request order, else every list column.
+
+    Raises:
+        ValueError: If a requested column doesn't exist
+    """
+    if not request.column:
+        return [col_def for col_def in object_class.column_definitions if col_def.include_in_list]
+
+    columns = []
+    for key in request.column:
+        col_def = object_class.get_field_metadata(key)
+        if col_def is None:
+            raise ValueError(f"Field '{key}' not found in {object_class.object_type} column definitions")
+        columns.append(col_def)
+    return columns
+
+
+def require_pyarrow(export_format: ExportFormat) -> None:
+    """Fail fast when a columnar format is requested without pyarrow installed.
+
+    Raises:
+        ValueError: If ``export_format`` needs pyarrow and it isn't importable
+    """
+    if export_format in TEXT_FORMATS:
+        return
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise ValueError(f"{export_format} export requires pyarrow (install manageros[export])") from e
+
+
+def format_cell(field_value: FieldValue | None) -> object:
+    """Flatten a wrapped field value into a CSV cell."""
+    match field_value:
+        case None:
+            return ""
+        case ObjectFieldValue():
+            return field_value.label or field_value.value
+        case ImageFieldValue():
+            return field_value.url
+        case TextFieldValue():
+            return tiptap_to_text(field_value.value)
+        case DateFieldValue() | DatetimeFieldValue():
+            value: date | datetime = field_value.value
+            return value.isoformat()
+        case _:
+            return field_value.value
+
+
+def typed_value(field_value: FieldValue | None) -> Any:
+    """Unwrap a field value keeping its type, for NDJSON and Arrow.
+
+    Object references become ``{"id": <sqid>, "label": ...}`` and USD amounts
+    exact cents.
+    """
+    match field_value:
+        case None:
+            return None
+        case ObjectFieldValue():
+            return {"id": field_value.value, "label": field_value.label}
+        case ImageFieldValue():
+            return field_value.url
+        case TextFieldValue():
+            return tiptap_to_text(field_value.value)
+        case USDFieldValue():
+            return Decimal(str(field_value.value)).quantize(_USD_CENTS)
+        case _:
+            return field_value.value
+
+
+def arrow_type(field_type: FieldType) -> "pa.DataType":
+    """Arrow type for a column of ``field_type``."""
+    import pyarrow as pa
+
+    match field_type:
+        case FieldType.Int:
+            return pa.int64()
+        case FieldType.Float:
+            return pa.float64()
+        case FieldType.Bool:
+            return pa.bool_()
+        case FieldType.Enum:
+            return pa.dictionary(pa.int32(), pa.string())
+        case FieldType.Date:
+            return pa.date32()
+        case FieldType.Datetime:
+            return pa.timestamp("us", tz="UTC")
+        case FieldType.USD:
+            return pa.decimal128(12, 2)
+        case FieldType.Object:
+            return pa.struct([("id", pa.string()), ("label", pa.string())])
+        case _:
+            return pa.string()
+
+
+def arrow_schema(columns: Sequence[ObjectColumn]) -> "pa.Schema":
+    import pyarrow as pa
+
+    return pa.schema([pa.field(col_def.key, arrow_type(col_def.type)) for col_def in columns])
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands back what was written since the last ``drain``.
+
+    ``tell`` keeps counting across drains, which Parquet needs for its footer offsets.
+    """
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def _iter_rows(
+    stream_session: StreamSessionFactory,
+    object_class: type["BaseObject"],
+    request: ObjectListRequest,
+    columns: Sequence[ObjectColumn],
+) -> AsyncIterator[list[list[FieldValue | None]]]:
+    """Yield the export's rows (one field value per column) a chunk at a time."""
+    query = object_class.build_list_query(msgspec.structs.replace(request, cursor=None), object_class.model().id)
+    accessors = [col_def.value for col_def in columns]
+    async with stream_session() as session:
+        result = await session.stream(query.execution_options(yield_per=EXPORT_CHUNK_SIZE))
+        async for partition in result.partitions():
+            objects = await object_class.hydrate(session, [row.id for row in partition], request, columns)
+            yield [[value(obj) for value in accessors] for obj in objects]
+            # Nothing is held between chunks
+            session.expunge_all()
+
+
+async def _write_csv(
+    chunks: AsyncIterator[list[list[FieldValue | None]]], columns: Sequence[ObjectColumn]
+) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def drain() -> bytes:
+        data = buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+
+    writer.writerow([col_def.label for col_def in columns])
+    yield drain()
+    async for rows in chunks:
+        writer.writerows([format_cell(field_value) for field_value in row] for row in rows)
+        yield drain()
+
+
+async def _write_ndjson(
+    chunks: AsyncIterator[list[list[FieldValue | None]]], columns: Sequence[ObjectColumn]
+) -> AsyncIterator[bytes]:
+    encoder = msgspec.json.Encoder(decimal_format="number")
+    buffer = bytearray()
+    keys = [col_def.key for col_def in columns]
+    async for rows in chunks:
+        for row in rows:
+            encoder.encode_into(dict(zip(keys, map(typed_value, row), strict=True)), buffer, -1)
+            buffer.extend(b"\n")
+        yield bytes(buffer)
+        buffer.clear()
+
+
+def _record_batch(schema: "pa.Schema", rows: list[list[FieldValue | None]]) -> "pa.RecordBatch":
+    import pyarrow as pa
+
+    arrays = [pa.array([typed_value(row[i]) for row in rows], type=field.type) for i, field in enumerate(schema)]
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+async def _write_arrow(
+    chunks: AsyncIterator[list[list[FieldValue | None]]],
+    columns: Sequence[ObjectColumn],
+    export_format: ExportFormat,
+) -> AsyncIterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = arrow_schema(columns)
+    sink = _ChunkSink()
+    if export_format == ExportFormat.parquet:
+        writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    else:
+        writer = pa.ipc.new_stream(sink, schema, options=pa.ipc.IpcWriteOptions(compression="zstd"))
+
+    async for rows in chunks:
+        if rows:
+            writer.write_batch(_record_batch(schema, rows))
+            yield sink.drain()
+    writer.close()
+    yield sink.drain()
+
+
+async def stream_export(
+    stream_session: StreamSessionFactory,
+    object_class: type["BaseObject"],
+    request: ObjectListRequest,
+    columns: Sequence[ObjectColumn],
+    export_format: ExportFormat = ExportFormat.csv,
+    compress: bool = False,
+) -> AsyncIterator[bytes]:
+    """Yield the export in ``export_format`` chunk by chunk, gzipped if ``compress``.
+
+    Search, filters and sorts apply as for the list endpoint; offset, limit and
+    cursor are ignored.
+    """
+    chunks = _iter_rows(stream_session, object_class, request, columns)
+    match export_format:
+        case ExportFormat.csv:
+            body = _write_csv(chunks, columns)
+        case ExportFormat.ndjson:
+            body = _write_ndjson(chunks, columns)
+        case ExportFormat.arrow | ExportFormat.parquet:
+            body = _write_arrow(chunks, columns, export_format)
+    compressor = zlib.compressobj(wbits=_GZIP_WBITS) if compress else None
+
+    async for data in body:
+        if compressor:
+            data = compressor.compress(data)
+        if data:
+            yield data
+
+    if compressor:
+        yield compressor.flush()
+
+
+def export_media_type(export_format: ExportFormat, compress: bool) -> str:
+    return "application/gzip" if compress else _MEDIA_TYPES[export_format]
+
+
+def export_filename(object_class: type["BaseObject"], export_format: ExportFormat, compress: bool) -> str:
+    return f"{object_class.object_type}_export.{_EXTENSIONS[export_format]}" + (".gz" if compress else "")
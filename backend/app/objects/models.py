@@ -0,0 +1,72 @@
+"""Time-series rollup and result cache models (see app/objects/rollups.py and app/objects/cache.py)."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.base.models import BaseDBModel
+from app.base.scope_mixins import RLSMixin
+
+
+class TimeSeriesRollup(RLSMixin(scope_with_campaign_id=True), BaseDBModel):
+    """Pre-aggregated counts and sums of one object field per time bucket and scope.
+
+    ``field`` is empty for the bucket's record count. ``category`` holds the
+    value of a categorical field (empty for numeric fields); ``row_count``
+    counts matching rows (non-null values for numeric fields) and
+    ``value_sum`` sums numeric values.
+    """
+
+    __tablename__ = "time_series_rollups"
+    __table_args__ = (
+        # Upsert target for incremental maintenance; campaign_id is NULL for team-scoped objects
+        sa.Index(
+            "uq_time_series_rollups_bucket",
+            "team_id",
+            "campaign_id",
+            "object_type",
+            "field",
+            "granularity",
+            "bucket",
+            "category",
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
+        # Read path: one field's buckets in a time window
+        sa.Index("ix_time_series_rollups_lookup", "object_type", "field", "granularity", "bucket"),
+    )
+
+    object_type: Mapped[str] = mapped_column(sa.Text, nullable=False)
+    field: Mapped[str] = mapped_column(sa.Text, nullable=False)
+    granularity: Mapped[str] = mapped_column(sa.Text, nullable=False)
+    bucket: Mapped[datetime] = mapped_column(sa.DateTime(timezone=True), nullable=False)
+    category: Mapped[str] = mapped_column(sa.Text, nullable=False, default="")
+    row_count: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, default=0)
+    value_sum: Mapped[Decimal | None] = mapped_column(sa.Numeric, nullable=True)
+
+
+class ResultCacheGeneration(BaseDBModel.registry.generate_base()):
+    """Invalidation counter for cached time-series results of one team's table (see app/objects/cache.py).
+
+    Bumped in the writing transaction by an event consumer, so readers see the
+    new generation exactly when the write becomes visible. Not RLS-scoped:
+    campaign-scoped writers bump their team's counter too.
+    """
+
+    __tablename__ = "result_cache_generations"
+
+    team_id: Mapped[int] = mapped_column(sa.Integer, primary_key=True)
+    object_type: Mapped[str] = mapped_column(sa.Text, primary_key=True)
+    generation: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, default=1)
+
+
+class ResultCacheEntry(BaseDBModel.registry.generate_base()):
+    """Cached time-series results shared by every app node (``PostgresResultStore``)."""
+
+    __tablename__ = "result_cache_entries"
+
+    key: Mapped[str] = mapped_column(sa.Text, primary_key=True)
+    value: Mapped[bytes] = mapped_column(sa.LargeBinary, nullable=False)
+    expires_at: Mapped[datetime | None] = mapped_column(sa.DateTime(timezone=True), nullable=True, index=True)
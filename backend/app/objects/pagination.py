@@ -0,0 +1,174 @@
+"""Keyset (cursor) pagination for object list queries.
+
+Offset pagination makes Postgres scan and discard every skipped row, so deep
+pages get linearly slower. Keyset pagination instead remembers the sort key
+values of the last row on a page and asks for rows strictly "after" them:
+
+    WHERE (sort_col, id) > (:last_sort_value, :last_id)
+
+The cursor handed to clients is opaque: a base64url-encoded JSON payload
+containing the sort signature and the last row's key values.
+"""
+
+import base64
+import binascii
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+import msgspec
+from sqlalchemy import Select, and_, false, or_, true, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.base.models import BaseDBModel
+from app.objects.enums import SortDirection
+from app.objects.schemas import ObjectListRequest
+from app.utils.sqids import Sqid
+
+
+class CursorPayload(msgspec.Struct, array_like=True):
+    """Wire format of a list cursor (kept compact via array_like)."""
+
+    keys: list[tuple[str, SortDirection]]  # Sort signature the cursor was issued for
+    values: list[Any]  # Sort key values of the last row, tiebreaker id last
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """A resolved ORDER BY key: the model attribute plus its direction."""
+
+    key: str
+    column: InstrumentedAttribute
+    direction: SortDirection
+
+    @property
+    def ascending(self) -> bool:
+        return self.direction == SortDirection.sort_asc
+
+    @property
+    def nullable(self) -> bool:
+        return any(getattr(col, "nullable", True) for col in self.column.property.columns)
+
+    def order_by(self) -> ColumnElement:
+        return self.column.asc() if self.ascending else self.column.desc()
+
+
+def resolve_sort_keys(model_class: type[BaseDBModel], request: ObjectListRequest) -> list[SortKey]:
+    """Resolve the request's sorts into concrete keys, always ending with ``id``.
+
+    Unknown columns are skipped (mirroring ``apply_request_to_query``). When no
+    sort is given the default ``created_at DESC`` ordering is used. The ``id``
+    tiebreaker takes the direction of the last sort key so that uniform
+    orderings can use a single row-value comparison.
+    """
+    keys: list[SortKey] = []
+    for sort_def in request.sorts:
+        column = getattr(model_class, sort_def.column, None)
+        if column is None:
+            continue
+        keys.append(SortKey(key=sort_def.column, column=column, direction=sort_def.direction))
+
+    if not keys:
+        keys.append(SortKey(key="created_at", column=model_class.created_at, direction=SortDirection.sort_desc))
+
+    if keys[-1].key != "id":
+        keys.append(SortKey(key="id", column=model_class.id, direction=keys[-1].direction))
+
+    return keys
+
+
+def _encode_value(value: Any) -> Any:
+    # TextEnum persists the enum *name*, so compare against that rather than the value
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, Sqid):
+        return int(value)
+    return value
+
+
+def _decode_value(sort_key: SortKey, value: Any) -> Any:
+    """Restore a JSON value to the column's Python type so it binds correctly."""
+    if value is None:
+        return None
+    try:
+        python_type = sort_key.column.type.python_type
+    except NotImplementedError:
+        return value
+    if issubclass(python_type, Enum):
+        return value
+    try:
+        return msgspec.convert(value, type=python_type, strict=False)
+    except msgspec.ValidationError as e:
+        raise ValueError(f"Invalid cursor value for '{sort_key.key}'") from e
+
+
+def encode_cursor(sort_keys: list[SortKey], obj: BaseDBModel) -> str:
+    """Build the opaque cursor pointing just after ``obj``."""
+    payload = CursorPayload(
+        keys=[(k.key, k.direction) for k in sort_keys],
+        values=[_encode_value(getattr(obj, k.key)) for k in sort_keys],
+    )
+    return base64.urlsafe_b64encode(msgspec.json.encode(payload)).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(sort_keys: list[SortKey], cursor: str) -> list[Any]:
+    """Decode a cursor and return its key values.
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for different sorts
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = msgspec.json.decode(raw, type=CursorPayload)
+    except (binascii.Error, ValueError, msgspec.DecodeError) as e:
+        raise ValueError("Malformed cursor") from e
+
+    if payload.keys != [(k.key, k.direction) for k in sort_keys] or len(payload.values) != len(sort_keys):
+        raise ValueError("Cursor does not match the requested sort order")
+
+    return [_decode_value(k, v) for k, v in zip(sort_keys, payload.values, strict=True)]
+
+
+def _after(sort_key: SortKey, value: Any) -> ColumnElement[bool]:
+    """Rows strictly after ``value`` for a single key.
+
+    Follows Postgres default NULL placement: NULLS LAST for ASC, NULLS FIRST for DESC.
+    """
+    col = sort_key.column
+    if sort_key.ascending:
+        if value is None:
+            return false()
+        return or_(col > value, col.is_(None)) if sort_key.nullable else col > value
+    if value is None:
+        return col.is_not(None)
+    return col < value
+
+
+def _equal(sort_key: SortKey, value: Any) -> ColumnElement[bool]:
+    return sort_key.column.is_(None) if value is None else sort_key.column == value
+
+
+def keyset_predicate(sort_keys: list[SortKey], values: list[Any]) -> ColumnElement[bool]:
+    """Build the ``WHERE`` clause selecting rows after the cursor position.
+
+    Uniform, non-nullable orderings use a row-value comparison that Postgres can
+    satisfy with a composite index range scan. Mixed directions or nullable keys
+    fall back to the expanded form ``(a > :a) OR (a = :a AND b > :b) OR ...``.
+    """
+    uniform = len({k.direction for k in sort_keys}) == 1
+    if uniform and all(v is not None for v in values) and not any(k.nullable for k in sort_keys):
+        row = tuple_(*(k.column for k in sort_keys))
+        return row > tuple(values) if sort_keys[0].ascending else row < tuple(values)
+
+    clauses: list[ColumnElement[bool]] = []
+    prefix: list[ColumnElement[bool]] = []
+    for sort_key, value in zip(sort_keys, values, strict=True):
+        clauses.append(and_(true(), *prefix, _after(sort_key, value)))
+        prefix.append(_equal(sort_key, value))
+    return or_(*clauses)
+
+
+def apply_cursor(query: Select, sort_keys: list[SortKey], cursor: str) -> Select:
+    """Restrict ``query`` to rows after ``cursor``."""
+    return query.where(keyset_predicate(sort_keys, decode_cursor(sort_keys, cursor)))
@@ -0,0 +1,461 @@
+"""Pre-aggregated time-series rollups for ``/o/{object_type}/data``.
+
+Objects that declare ``rollup_fields`` get hourly and daily rows in
+``time_series_rollups``, bucketed on ``created_at`` like the raw query: per
+scope and bucket the record count (``field == ""``), and per declared field
+either a row count per stored value (Enum/String fields) or the non-null count
+and sum (numeric fields).
+
+CREATED, UPDATED and DELETED events keep the rollups current with additive
+upserts, so concurrent writers never overwrite each other's counts. Writes
+that don't go through ``emit_event`` (direct attribute changes, bulk updates)
+are caught up by the nightly ``reconcile_time_series_rollups`` task, which
+rebuilds every rollup from the raw tables.
+
+Team-scoped requests without filters or relationship fields, on a declared
+field, with an aggregation the rollups can answer (not min/max) read the
+rollups instead of scanning the raw table. Campaign guests always read the
+raw table, which their policy scopes row by row. Hour granularity reads the hourly rows; anything
+coarser re-buckets the daily rows. Unlike the raw query, which cuts at the
+exact start and end timestamps, the window covers whole rollup buckets (hours
+or days).
+"""
+
+import logging
+from collections import defaultdict
+from collections.abc import Sequence
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+import sqlalchemy as sa
+from sqlalchemy import bindparam, cast, delete, func, literal, null, select, type_coerce
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.dialects.postgresql.base import PGDialect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.base.models import BaseDBModel
+from app.events.enums import EventType
+from app.events.models import Event
+from app.events.registry import event_consumer
+from app.objects.cache import invalidate_tables
+from app.objects.enums import AggregationType, FieldType, Granularity
+from app.objects.models import TimeSeriesRollup
+from app.objects.schemas import CategoricalDataPoint, FilterDefinition, NumericalDataPoint, ObjectColumn
+from app.objects.services import (
+    categorical_data_points,
+    fold_top_categories,
+    get_date_trunc_format,
+    numerical_data_points,
+    time_bucket_series,
+)
+from app.utils.textenum import TextEnum
+
+if TYPE_CHECKING:
+    from app.objects.base import BaseObject
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_GRANULARITIES = (Granularity.hour, Granularity.day)
+
+# ``field`` of the per-bucket record count rows
+RECORD_COUNT_FIELD = ""
+
+NUMERIC_FIELD_TYPES = (FieldType.Int, FieldType.Float, FieldType.USD)
+CATEGORICAL_FIELD_TYPES = (FieldType.Enum, FieldType.String)
+
+# Binds category values the way the postgres driver would
+_DIALECT = PGDialect()
+
+# Aggregations that can't be derived from counts and sums
+_RAW_ONLY_AGGREGATIONS = (AggregationType.max, AggregationType.min)
+
+
+def rollup_object_classes() -> list[type["BaseObject"]]:
+    """Registered object types that declare rollup fields."""
+    from app.objects.base import BaseObject
+
+    return [object_class for object_class in BaseObject.registry.get_all_types().values() if object_class.rollup_fields]
+
+
+def _object_class_for_table(tablename: str) -> type["BaseObject"] | None:
+    for object_class in rollup_object_classes():
+        if object_class.model().__tablename__ == tablename:
+            return object_class
+    return None
+
+
+def _is_numeric(object_class: type["BaseObject"], field: str) -> bool:
+    """Whether ``field`` rolls up as count + sum (numeric) or per-value counts (categorical).
+
+    Raises:
+        ValueError: If the field's type can't be rolled up
+    """
+    col_def = object_class.get_field_metadata(field)
+    if col_def is None:
+        raise ValueError(f"Rollup field '{field}' not found in {object_class.object_type} column definitions")
+    if col_def.type in NUMERIC_FIELD_TYPES:
+        return True
+    if col_def.type in CATEGORICAL_FIELD_TYPES:
+        return False
+    raise ValueError(f"Rollup field '{field}' has unsupported type {col_def.type}")
+
+
+def uses_rollups(
+    object_class: type["BaseObject"],
+    field_metadata: ObjectColumn,
+    aggregation: AggregationType,
+    filters: Sequence[FilterDefinition],
+    campaign_scoped: bool = False,
+) -> bool:
+    """Whether a time-series request can be answered from the rollups."""
+    if campaign_scoped:
+        return False
+    if filters or field_metadata.query_relationship or field_metadata.key not in object_class.rollup_fields:
+        return False
+    if _is_numeric(object_class, field_metadata.key):
+        return aggregation not in (*_RAW_ONLY_AGGREGATIONS, AggregationType.mode)
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Maintenance
+# ---------------------------------------------------------------------------
+
+
+def _table(model_class: type[BaseDBModel]) -> sa.Table:
+    """The model's Core table (``__table__`` is typed as any FromClause)."""
+    table = model_class.__table__
+    if not isinstance(table, sa.Table):
+        raise TypeError(f"{model_class.__name__} is not mapped to a table")
+    return table
+
+
+def _stored_text(column: sa.ColumnElement, value: Any) -> str:
+    """``value`` as ``column::text`` renders it in SQL (e.g. the enum name for TextEnum).
+
+    Event changes that went through JSON carry an enum's value ("draft"), which
+    TextEnum would bind unchanged; it's looked up on the enum class first.
+    """
+    if isinstance(column.type, TextEnum) and isinstance(value, str) and not isinstance(value, Enum):
+        enum_class: type[Enum] = column.type.enum_class
+        try:
+            value = enum_class(value)
+        except ValueError:
+            value = enum_class[value]
+    if isinstance(column.type, sa.TypeDecorator):
+        value = column.type.process_bind_param(value, _DIALECT)
+    return str(value)
+
+
+def _value_deltas(
+    object_class: type["BaseObject"], field: str, value: Any, sign: int
+) -> list[tuple[str, str, int, Decimal | None]]:
+    if value is None:
+        return []
+    if _is_numeric(object_class, field):
+        return [(field, "", sign, sign * Decimal(str(value)))]
+    return [(field, _stored_text(object_class.model().__table__.c[field], value), sign, None)]
+
+
+def rollup_deltas(object_class: type["BaseObject"], event: Event, obj: BaseDBModel) -> list[dict[str, Any]]:
+    """Rollup changes for an event, as (field, category, row_count, value_sum) parameter sets.
+
+    Deltas on the same row are merged and no-ops dropped.
+    """
+    deltas: list[tuple[str, str, int, Decimal | None]] = []
+    match event.event_type:
+        case EventType.CREATED | EventType.DELETED:
+            sign = 1 if event.event_type == EventType.CREATED else -1
+            deltas.append((RECORD_COUNT_FIELD, "", sign, None))
+            for field in object_class.rollup_fields:
+                deltas += _value_deltas(object_class, field, getattr(obj, field), sign)
+        case EventType.UPDATED:
+            changes = (event.event_data or {}).get("changes", {})
+            for field in object_class.rollup_fields:
+                if field in changes:
+                    deltas += _value_deltas(object_class, field, changes[field]["old"], -1)
+                    deltas += _value_deltas(object_class, field, changes[field]["new"], 1)
+
+    merged: dict[tuple[str, str], list] = defaultdict(lambda: [0, None])
+    for field, category, row_count, value_sum in deltas:
+        entry = merged[field, category]
+        entry[0] += row_count
+        if value_sum is not None:
+            entry[1] = (entry[1] or 0) + value_sum
+    return [
+        {"field": field, "category": category, "row_count": row_count, "value_sum": value_sum}
+        for (field, category), (row_count, value_sum) in merged.items()
+        if row_count or value_sum
+    ]
+
+
+def _upsert(statement: Insert) -> Insert:
+    """Add the additive ON CONFLICT clause to an insert into ``time_series_rollups``."""
+    table = _table(TimeSeriesRollup)
+    excluded = statement.excluded
+    return statement.on_conflict_do_update(
+        index_elements=["team_id", "campaign_id", "object_type", "field", "granularity", "bucket", "category"],
+        set_={
+            "row_count": table.c.row_count + excluded.row_count,
+            "value_sum": func.coalesce(table.c.value_sum + excluded.value_sum, table.c.value_sum, excluded.value_sum),
+            "updated_at": func.now(),
+        },
+    )
+
+
+def _campaign_id_column(source: sa.Table) -> sa.ColumnElement:
+    return source.c.campaign_id if "campaign_id" in source.c else cast(null(), sa.Integer)
+
+
+@cache
+def _delta_statement() -> Insert:
+    """Upsert one delta into its hour/day bucket.
+
+    The object's scope and ``created_at`` come with each delta rather than
+    from its row, which a DELETED event's flush may already have removed.
+    """
+    bucket = func.date_trunc(
+        bindparam("bucket_granularity", type_=sa.Text),
+        bindparam("object_created_at", type_=sa.DateTime(timezone=True)),
+    )
+    return _upsert(insert(_table(TimeSeriesRollup)).values(bucket=bucket))
+
+
+async def _load_created_at(session: AsyncSession, model_class: type[BaseDBModel], objs: Sequence[BaseDBModel]) -> None:
+    """Load ``created_at`` for objects inserted this flush (a server default, unloaded until read) in one query."""
+    unloaded = {obj.id: obj for obj in objs if "created_at" not in sa.inspect(obj).dict}
+    if not unloaded:
+        return
+    stmt = (
+        select(model_class.id, model_class.created_at)
+        .where(model_class.id.in_(unloaded))
+        .execution_options(include_deleted=True)
+    )
+    for object_id, created_at in (await session.execute(stmt)).all():
+        set_committed_value(unloaded[object_id], "created_at", created_at)
+
+
+async def apply_rollup_deltas(
+    session: AsyncSession,
+    object_class: type["BaseObject"],
+    changes: Sequence[tuple[BaseDBModel, list[dict[str, Any]]]],
+) -> None:
+    """Apply each object's deltas, for every rollup granularity, in one executemany."""
+    model_class = object_class.model()
+    await _load_created_at(session, model_class, [obj for obj, _deltas in changes])
+    params = []
+    for obj, deltas in changes:
+        loaded = sa.inspect(obj).dict
+        if "created_at" not in loaded:
+            # The row is gone and was never read; the nightly rebuild settles its deltas
+            logger.warning(f"Skipping rollup deltas for {object_class.object_type}#{obj.id}: created_at not loaded")
+            continue
+        scope = {
+            "team_id": loaded["team_id"],
+            "campaign_id": loaded.get("campaign_id"),
+            "object_type": object_class.object_type.value,
+            "object_created_at": loaded["created_at"],
+        }
+        params += [
+            {**scope, **delta, "granularity": granularity.value, "bucket_granularity": granularity.value}
+            for delta in deltas
+            for granularity in ROLLUP_GRANULARITIES
+        ]
+    if params:
+        await session.execute(_delta_statement(), params)
+
+
+@event_consumer(EventType.CREATED, EventType.UPDATED, EventType.DELETED, batch=True)
+async def maintain_time_series_rollups(session: AsyncSession, events: list[Event], objs: list[BaseDBModel]) -> None:
+    """Apply a batch of object changes to their time-series rollups.
+
+    CREATED deltas read the object's final state, so later UPDATED events for
+    an object created in the same batch are already counted and skipped.
+    Runs in a savepoint so a failure leaves the request's transaction usable;
+    the nightly rebuild repairs any missed delta.
+    """
+    changes: dict[type[BaseObject], list[tuple[BaseDBModel, list[dict[str, Any]]]]] = defaultdict(list)
+    created: set[tuple[str, int]] = set()
+    for event, obj in zip(events, objs, strict=True):
+        object_class = _object_class_for_table(event.object_type)
+        if object_class is None:
+            continue
+        if event.event_type == EventType.CREATED:
+            created.add((event.object_type, event.object_id))
+        elif event.event_type == EventType.UPDATED and (event.object_type, event.object_id) in created:
+            continue
+        if deltas := rollup_deltas(object_class, event, obj):
+            changes[object_class].append((obj, deltas))
+    if not changes:
+        return
+    async with session.begin_nested():
+        for object_class, object_changes in changes.items():
+            await apply_rollup_deltas(session, object_class, object_changes)
+
+
+def _rebuild_statements(object_class: type["BaseObject"]) -> list[Insert]:
+    source = _table(object_class.model())
+    campaign_id = _campaign_id_column(source)
+    live = source.c.deleted_at.is_(None)
+
+    aggregates: list[tuple[str, sa.ColumnElement, sa.ColumnElement, sa.ColumnElement, list]] = [
+        (RECORD_COUNT_FIELD, literal(""), func.count(), cast(null(), sa.Numeric), [])
+    ]
+    for field in object_class.rollup_fields:
+        column = source.c[field]
+        if _is_numeric(object_class, field):
+            aggregates.append((field, literal(""), func.count(column), cast(func.sum(column), sa.Numeric), []))
+        else:
+            aggregates.append((field, cast(column, sa.Text), func.count(), cast(null(), sa.Numeric), [column]))
+
+    statements = []
+    for granularity in ROLLUP_GRANULARITIES:
+        bucket = func.date_trunc(granularity.value, source.c.created_at)
+        for field, category, row_count, value_sum, group_by in aggregates:
+            rows = (
+                select(
+                    source.c.team_id,
+                    campaign_id,
+                    literal(object_class.object_type.value),
+                    literal(field),
+                    literal(granularity.value),
+                    bucket,
+                    category,
+                    row_count,
+                    value_sum,
+                )
+                .where(live, *(column.is_not(None) for column in group_by))
+                .group_by(source.c.team_id, campaign_id, bucket, *group_by)
+            )
+            statements.append(
+                insert(_table(TimeSeriesRollup)).from_select(
+                    [
+                        "team_id",
+                        "campaign_id",
+                        "object_type",
+                        "field",
+                        "granularity",
+                        "bucket",
+                        "category",
+                        "row_count",
+                        "value_sum",
+                    ],
+                    rows,
+                )
+            )
+    return statements
+
+
+async def rebuild_rollups(session: AsyncSession, object_class: type["BaseObject"]) -> int:
+    """Recompute an object type's rollups from its table; returns the number of rollup rows.
+
+    Only rows visible to the session are rebuilt (the whole table in system mode).
+    """
+    await session.execute(delete(TimeSeriesRollup).where(TimeSeriesRollup.object_type == object_class.object_type))
+    inserted = 0
+    for statement in _rebuild_statements(object_class):
+        result = await session.execute(statement)
+        inserted += result.rowcount
+    # Results cached from the previous rollups may be stale now
+    await invalidate_tables(session, [object_class.model().__tablename__])
+    return inserted
+
+
+# ---------------------------------------------------------------------------
+# Read path
+# ---------------------------------------------------------------------------
+
+
+async def query_rollup_time_series(
+    session: AsyncSession,
+    object_class: type["BaseObject"],
+    field_name: str,
+    start_date: datetime,
+    end_date: datetime,
+    granularity: Granularity,
+    aggregation: AggregationType,
+    top_n: int | None = None,
+) -> tuple[list[NumericalDataPoint] | list[CategoricalDataPoint], int]:
+    """``query_time_series_data`` answered from the rollups (see ``uses_rollups``)."""
+    rollup = TimeSeriesRollup
+    source_granularity = Granularity.hour if granularity == Granularity.hour else Granularity.day
+    window = (
+        rollup.object_type == object_class.object_type.value,
+        rollup.granularity == source_granularity.value,
+        rollup.bucket >= func.date_trunc(source_granularity.value, start_date),
+        rollup.bucket <= end_date,
+    )
+    time_bucket = func.date_trunc(get_date_trunc_format(granularity), rollup.bucket)
+    time_series = time_bucket_series(granularity, start_date, end_date)
+
+    total_query = select(func.coalesce(func.sum(rollup.row_count), 0)).where(
+        *window, rollup.field == RECORD_COUNT_FIELD
+    )
+    total_count = int((await session.execute(total_query)).scalar_one())
+
+    if not _is_numeric(object_class, field_name):
+        agg_subquery = (
+            select(
+                time_bucket.label("time_bucket"),
+                # Categories are stored as their column's SQL text; decode them like the raw column
+                type_coerce(rollup.category, object_class.model().__table__.c[field_name].type).label("category_value"),
+                cast(func.sum(rollup.row_count), sa.BigInteger).label("count"),
+            )
+            .where(*window, rollup.field == field_name)
+            .group_by(time_bucket, rollup.category)
+            .having(func.sum(rollup.row_count) > 0)
+            .subquery()
+        )
+        if top_n is not None:
+            agg_subquery = fold_top_categories(agg_subquery, top_n)
+        value_columns = [agg_subquery.c.category_value, func.coalesce(agg_subquery.c.count, 0).label("count")]
+        if top_n is not None:
+            value_columns.append(agg_subquery.c.is_other)
+        final_query = (
+            select(time_series.c.time_bucket, *value_columns)
+            .select_from(time_series)
+            .outerjoin(agg_subquery, time_series.c.time_bucket == agg_subquery.c.time_bucket)
+            .order_by(time_series.c.time_bucket)
+        )
+        result = await session.execute(final_query)
+        return categorical_data_points(result.all()), total_count
+
+    is_field = rollup.field == field_name
+    value_count = func.sum(rollup.row_count).filter(is_field)
+    value_sum = func.sum(rollup.value_sum).filter(is_field)
+    match aggregation:
+        case AggregationType.avg:
+            agg_value = value_sum / func.nullif(value_count, 0)
+        case AggregationType.count_:
+            agg_value = value_count
+        case _:
+            agg_value = value_sum
+
+    agg_subquery = (
+        select(
+            time_bucket.label("time_bucket"),
+            agg_value.label("agg_value"),
+            cast(func.sum(rollup.row_count).filter(rollup.field == RECORD_COUNT_FIELD), sa.BigInteger).label(
+                "record_count"
+            ),
+        )
+        .where(*window, rollup.field.in_([RECORD_COUNT_FIELD, field_name]))
+        .group_by(time_bucket)
+        .subquery()
+    )
+    final_query = (
+        select(
+            time_series.c.time_bucket,
+            func.coalesce(agg_subquery.c.agg_value, 0).label("agg_value"),
+            func.coalesce(agg_subquery.c.record_count, 0).label("record_count"),
+        )
+        .select_from(time_series)
+        .outerjoin(agg_subquery, time_series.c.time_bucket == agg_subquery.c.time_bucket)
+        .order_by(time_series.c.time_bucket)
+    )
+    result = await session.execute(final_query)
+    return numerical_data_points(result.all()), total_count
@@ -1,28 +1,46 @@
 import logging
-from collections.abc import Sequence
+from typing import cast
 
+import msgspec
 from litestar import Router, get, post
+from litestar.exceptions import ValidationException
+from litestar.response import Stream
+from litestar.stores.base import Store
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.base.models import BaseDBModel
+from app.actions.registry import ActionRegistry
 from app.objects.base import ObjectRegistry
-from app.objects.enums import ObjectTypes
+from app.objects.enums import ExportFormat, ObjectTypes
+from app.objects.export import (
+    TEXT_FORMATS,
+    export_filename,
+    export_media_type,
+    require_pyarrow,
+    resolve_export_columns,
+    stream_export,
+)
+from app.objects.rollups import query_rollup_time_series, uses_rollups
 from app.objects.schemas import (
-    CategoricalTimeSeriesData,
+    CategoricalDataPoint,
     NumericalDataPoint,
-    NumericalTimeSeriesData,
     ObjectListRequest,
     ObjectListResponse,
+    ObjectListSchema,
     ObjectSchemaResponse,
+    TimeSeriesBatchRequest,
+    TimeSeriesBatchResponse,
     TimeSeriesDataRequest,
     TimeSeriesDataResponse,
 )
 from app.objects.services import (
+    TimeSeriesSpec,
     determine_granularity,
     get_default_aggregation,
-    query_time_series_data,
+    query_time_series_batch,
     resolve_time_range,
 )
+from app.objects.time_series import get_time_series, time_series_data
+from app.utils.db import StreamSessionFactory
 from app.utils.discovery import discover_and_import
 
 logger = logging.getLogger(__name__)
@@ -49,21 +67,61 @@ async def list_objects(
     data: ObjectListRequest,
     transaction: AsyncSession,
     object_registry: ObjectRegistry,
+    action_registry: ActionRegistry,
+    team_id: int | None,
+    campaign_id: int | None,
 ) -> ObjectListResponse:
     logger.info(f"data:{data}")
     object_service = object_registry.get_class(object_type)
-    objects: Sequence[BaseDBModel]
-    objects, total = await object_service.get_list(transaction, data)
+    try:
+        page = await object_service.get_list(transaction, data, team_id=team_id, campaign_id=campaign_id)
+    except ValueError as e:
+        raise ValidationException(detail=str(e)) from e
 
     # Convert objects to schemas
-    object_schemas = [object_service.to_list_schema(obj) for obj in objects]
+    columns = object_service.get_list_columns(data)
+    # Rows go out pre-encoded: msgspec writes Raw bytes in place of the list
+    object_rows = msgspec.Raw(object_service.list_serializer(columns).encode(page.objects, action_registry))
 
     return ObjectListResponse(
-        objects=object_schemas,
-        total=total,
+        objects=cast(list[ObjectListSchema], object_rows),
+        total=page.total,
         limit=data.limit,
         offset=data.offset,
         actions=object_service.get_top_level_actions(),
+        next_cursor=page.next_cursor,
+        has_more=page.has_more,
+        total_is_estimate=page.total_is_estimate,
+    )
+
+
+@post("/{object_type:str}/export", operation_id="export_objects", status_code=200)
+async def export_objects(
+    object_type: ObjectTypes,
+    data: ObjectListRequest,
+    object_registry: ObjectRegistry,
+    stream_session: StreamSessionFactory,
+    format: ExportFormat = ExportFormat.csv,
+    gzip: bool = False,
+) -> Stream:
+    """Stream the filtered/sorted object list as CSV, NDJSON, Arrow IPC or Parquet.
+
+    ``?gzip=true`` compresses the text formats (csv, ndjson).
+    """
+    object_service = object_registry.get_class(object_type)
+    if gzip and format not in TEXT_FORMATS:
+        raise ValidationException(detail=f"gzip is not supported for {format} exports")
+    try:
+        require_pyarrow(format)
+        columns = resolve_export_columns(object_service, data)
+    except ValueError as e:
+        raise ValidationException(detail=str(e)) from e
+
+    filename = export_filename(object_service, format, gzip)
+    return Stream(
+        stream_export(stream_session, object_service, data, columns, format, compress=gzip),
+        media_type=export_media_type(format, gzip),
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
 
 
@@ -73,66 +131,100 @@ async def get_time_series_data(
     data: TimeSeriesDataRequest,
     transaction: AsyncSession,
     object_registry: ObjectRegistry,
+    time_series_cache: Store,
+    team_id: int | None,
+    campaign_id: int | None,
 ) -> TimeSeriesDataResponse:
     logger.info(f"Time series request for {object_type}: {data}")
 
-    # Get object service
     object_service = object_registry.get_class(object_type)
+    # Campaign guests see a subset of the team's rows, so only team-scoped results are cached
+    cache_team_id = team_id if campaign_id is None else None
+    return await get_time_series(
+        transaction, object_service, data, time_series_cache, cache_team_id, campaign_scoped=campaign_id is not None
+    )
 
-    # Validate field exists and get metadata
-    object_service.validate_field_exists(data.field)
-    field_metadata = object_service.get_field_metadata(data.field)
 
-    if field_metadata is None:
-        raise ValueError(f"Field {data.field} not found")
+@post("/{object_type:str}/data/batch", operation_id="get_time_series_data_batch")
+async def get_time_series_data_batch(
+    object_type: ObjectTypes,
+    data: TimeSeriesBatchRequest,
+    transaction: AsyncSession,
+    object_registry: ObjectRegistry,
+    campaign_id: int | None,
+) -> TimeSeriesBatchResponse:
+    """Several series over one time range and filter set.
 
-    field_type = field_metadata.type
+    Series the rollups cover are read from them; the rest are computed
+    together from one scan of the object's table.
+    """
+    logger.info(f"Time series batch request for {object_type}: {data}")
 
-    # Resolve time range
-    start_date, end_date = resolve_time_range(data.time_range, data.start_date, data.end_date)
+    object_service = object_registry.get_class(object_type)
+    if not data.series:
+        raise ValidationException(detail="At least one series is required")
 
-    # Determine granularity
+    start_date, end_date = resolve_time_range(data.time_range, data.start_date, data.end_date)
     granularity = determine_granularity(data.granularity, start_date, end_date)
 
-    # Determine aggregation type
-    aggregation = data.aggregation or get_default_aggregation(field_type)
-
-    # Query data
-    data_points, total_records = await query_time_series_data(
-        session=transaction,
-        model_class=object_service.model(),
-        field_name=data.field,
-        field_type=field_type,
-        start_date=start_date,
-        end_date=end_date,
-        granularity=granularity,
-        aggregation=aggregation,
-        filters=data.filters,
-        query_relationship=field_metadata.query_relationship,
-        query_column=field_metadata.query_column,
-    )
-
-    # Wrap data in appropriate discriminated union type
-    # Note: query_time_series_data now always returns complete data with gaps filled via SQL
-    if isinstance(data_points, list) and len(data_points) > 0:
-        if isinstance(data_points[0], NumericalDataPoint):
-            time_series_data = NumericalTimeSeriesData(data_points=data_points)  # type: ignore
+    items = []
+    for item in data.series:
+        object_service.validate_field_exists(item.field)
+        field_metadata = object_service.get_field_metadata(item.field)
+        if field_metadata is None:
+            raise ValueError(f"Field {item.field} not found")
+        items.append((item, field_metadata, item.aggregation or get_default_aggregation(field_metadata.type)))
+
+    results: dict[int, tuple[list[NumericalDataPoint] | list[CategoricalDataPoint], int]] = {}
+    raw_items: list[tuple[int, TimeSeriesSpec]] = []
+    for index, (item, field_metadata, aggregation) in enumerate(items):
+        if uses_rollups(object_service, field_metadata, aggregation, data.filters, campaign_id is not None):
+            results[index] = await query_rollup_time_series(
+                session=transaction,
+                object_class=object_service,
+                field_name=item.field,
+                start_date=start_date,
+                end_date=end_date,
+                granularity=granularity,
+                aggregation=aggregation,
+            )
         else:
-            # Categorical data
-            time_series_data = CategoricalTimeSeriesData(data_points=data_points)  # type: ignore
-    else:
-        # Empty data, default to numerical
-        time_series_data = NumericalTimeSeriesData(data_points=[])
-
-    return TimeSeriesDataResponse(
-        data=time_series_data,
-        field_name=data.field,
-        field_type=field_type,
-        aggregation_type=aggregation,
-        granularity_used=granularity,
-        start_date=start_date,
-        end_date=end_date,
-        total_records=total_records,
+            spec = TimeSeriesSpec(
+                field_name=item.field,
+                field_type=field_metadata.type,
+                aggregation=aggregation,
+                query_relationship=field_metadata.query_relationship,
+                query_column=field_metadata.query_column,
+            )
+            raw_items.append((index, spec))
+
+    if raw_items:
+        raw_series, total_records = await query_time_series_batch(
+            session=transaction,
+            model_class=object_service.model(),
+            specs=[spec for _index, spec in raw_items],
+            start_date=start_date,
+            end_date=end_date,
+            granularity=granularity,
+            filters=data.filters,
+        )
+        for (index, _spec), data_points in zip(raw_items, raw_series, strict=True):
+            results[index] = (data_points, total_records)
+
+    return TimeSeriesBatchResponse(
+        series=[
+            TimeSeriesDataResponse(
+                data=time_series_data(results[index][0]),
+                field_name=item.field,
+                field_type=field_metadata.type,
+                aggregation_type=aggregation,
+                granularity_used=granularity,
+                start_date=start_date,
+                end_date=end_date,
+                total_records=results[index][1],
+            )
+            for index, (item, field_metadata, aggregation) in enumerate(items)
+        ]
     )
 
 
@@ -142,7 +234,9 @@ object_router = Router(
     route_handlers=[
         get_object_schema,
         list_objects,
+        export_objects,
         get_time_series_data,
+        get_time_series_data_batch,
     ],
     tags=["objects"],
 )
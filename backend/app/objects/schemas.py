@@ -1,6 +1,6 @@
 """Object schemas and DTOs."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Any, Literal
@@ -234,6 +234,10 @@ class ObjectColumn:
     query_relationship: str | None = None  # Relationship to join (e.g., "assigned_roster")
     query_column: str | None = None  # Column to query from joined table (e.g., "name")
 
+    # Projection dependencies for list queries (see app/objects/projection.py)
+    columns: tuple[str, ...] | None = None  # Model columns `value` reads (defaults to key)
+    load: tuple[str, ...] = ()  # Relationship paths `value` reads (e.g., "campaign.brand")
+
 
 class ColumnDefinitionSchema(BaseSchema):
     """External API schema for column definitions.
@@ -291,16 +295,31 @@ class ObjectListRequest(BaseSchema):
     sorts: list[SortDefinition] = []
     search: str | None = None
     column: list[str] | None = None
+    cursor: str | None = None  # Opaque keyset cursor from a previous response (offset is ignored when set)
 
 
 class ObjectListResponse(BaseSchema):
     """Response schema for object lists."""
 
     objects: list[ObjectListSchema]
-    total: int
+    total: int | None  # None when the object type's count strategy is "none"
     limit: int
     offset: int
     actions: list[ActionDTO] = []
+    next_cursor: str | None = None  # Cursor for the following page, None on the last page
+    has_more: bool = False
+    total_is_estimate: bool = False  # True when total is a planner estimate
+
+
+@dataclass
+class ObjectListPage:
+    """A page of ORM objects returned by BaseObject.get_list."""
+
+    objects: Sequence[Any]
+    total: int | None
+    has_more: bool = False
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 class ObjectSchemaResponse(BaseSchema):
@@ -325,6 +344,10 @@ class TimeSeriesDataRequest(BaseSchema):
     aggregation: AggregationType | None = None  # Aggregation type (auto-determined if None)
     filters: list[FilterDefinition] = []  # Reuse existing filter system
     fill_missing: bool = True  # Deprecated: gaps are now always filled via SQL (kept for API compatibility)
+    since_bucket: datetime | None = None  # Delta refresh: only return buckets from the one containing this on
+    top_n: int | None = None  # Categorical: keep the N most frequent categories, fold the rest into "Other"
+    max_points: int | None = None  # Numerical: downsample to at most this many points (LTTB, minimum 3)
+    approximate: bool = False  # Sample large tables (TABLESAMPLE SYSTEM) and scale up, trading accuracy for speed
 
 
 class NumericalDataPoint(BaseSchema):
@@ -358,6 +381,14 @@ class CategoricalTimeSeriesData(BaseSchema, tag="categorical"):
 TimeSeriesData = NumericalTimeSeriesData | CategoricalTimeSeriesData
 
 
+class TimeSeriesSampling(BaseSchema):
+    """How an ``approximate`` response was sampled."""
+
+    sample_percent: float  # Share of the table's pages read
+    sampled_records: int  # Records aggregated before scaling up
+    error_margin: float | None  # Relative error of total_records at ~95% confidence (None if nothing was sampled)
+
+
 class TimeSeriesDataResponse(BaseSchema):
     """Response schema for time series data queries."""
 
@@ -368,4 +399,31 @@ class TimeSeriesDataResponse(BaseSchema):
     granularity_used: Granularity
     start_date: datetime
     end_date: datetime
-    total_records: int  # Total records considered (after filters)
+    total_records: int  # Total records considered (after filters); only the returned buckets' for a delta
+    since_bucket: datetime | None = None  # Set on delta responses: first returned bucket (replaces buckets >= it)
+    sampling: TimeSeriesSampling | None = None  # Set when values were estimated from a sample
+    approximate_suggested: bool = False  # The window is large enough that ``approximate`` would pay off
+
+
+class TimeSeriesBatchItem(BaseSchema):
+    """One series of a batch time series request."""
+
+    field: str  # Column name to aggregate
+    aggregation: AggregationType | None = None  # Aggregation type (auto-determined if None)
+
+
+class TimeSeriesBatchRequest(BaseSchema):
+    """Several series over one time range and filter set, computed in a single scan."""
+
+    series: list[TimeSeriesBatchItem]
+    time_range: TimeRange | None = None  # Relative time range
+    start_date: datetime | None = None  # Absolute start (overrides time_range)
+    end_date: datetime | None = None  # Absolute end (overrides time_range)
+    granularity: Granularity = Granularity.automatic  # Time bucket size
+    filters: list[FilterDefinition] = []  # Shared by every series
+
+
+class TimeSeriesBatchResponse(BaseSchema):
+    """Response schema for batch time series queries, one entry per requested series."""
+
+    series: list[TimeSeriesDataResponse]
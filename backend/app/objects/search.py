@@ -0,0 +1,77 @@
+"""Free-text search for object list queries.
+
+Objects that declare ``search_columns`` get an index-backed search: each
+declared column is matched with ``ILIKE '%term%'`` (substring) or the pg_trgm
+word-similarity operator ``%>`` (typo tolerant), both of which a GIN
+``gin_trgm_ops`` index on those columns can answer. Results are ranked by the
+best similarity across the columns when the request has no explicit sort.
+
+Under RLS (the application role) Postgres only turns a user condition into an
+index condition when its operator is LEAKPROOF, which ILIKE and ``%>`` aren't,
+so a plain ``WHERE`` would filter a scan of the whole scope. The match runs in
+``search_<table>(term)`` instead (see the 5b7d2e9c41a3 migration): a function
+owned by the table owner, which RLS doesn't apply to, that applies the
+policy's team/campaign scope itself and returns matching ids from the GIN
+index. The list query keeps ``id IN (...)`` of those, under its own policy.
+
+Objects that haven't opted in keep the legacy behaviour: ``ILIKE`` across
+every String/Text column, which always scans the table.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy import func, inspect, or_, select
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.base.models import BaseDBModel
+
+# Trigram matching needs at least one full trigram to be selective (applied in search_<table>)
+MIN_FUZZY_TERM_LENGTH = 3
+
+
+def _search_term(search_term: str | None) -> str | None:
+    if not search_term or not search_term.strip():
+        return None
+    return search_term.strip()
+
+
+def ilike_search_filter(model_class: type[BaseDBModel], search_term: str | None) -> ColumnElement[bool] | None:
+    """Legacy search: ``ILIKE '%term%'`` ORed across every String/Text column."""
+    if _search_term(search_term) is None:
+        return None
+
+    conditions = [
+        column.ilike(f"%{search_term}%")
+        for column in inspect(model_class).columns
+        if isinstance(column.type, sa.String | sa.Text)
+    ]
+    return or_(*conditions) if conditions else None
+
+
+def trigram_search_filter(model_class: type[BaseDBModel], search_term: str | None) -> ColumnElement[bool] | None:
+    """Rows ``search_<table>`` matches: substring, or word similarity from ``MIN_FUZZY_TERM_LENGTH`` characters."""
+    term = _search_term(search_term)
+    if term is None:
+        return None
+
+    matches = getattr(func, f"search_{model_class.__tablename__}")(term).column_valued("id")
+    return model_class.id.in_(select(matches))
+
+
+def search_rank(model_class: type[BaseDBModel], columns: Sequence[str], search_term: str | None) -> list[ColumnElement]:
+    """ORDER BY terms ranking rows by relevance to ``search_term``, best first.
+
+    Rows are ordered by the best word similarity across ``columns`` (how well
+    the term matches part of a value), then by the best whole-value similarity
+    so that e.g. a name equal to the term beats a description mentioning it.
+    """
+    term = _search_term(search_term)
+    if term is None:
+        return []
+
+    ranks: list[ColumnElement] = []
+    for similarity in (func.word_similarity, func.similarity):
+        scores = [similarity(term, getattr(model_class, name)) for name in columns]
+        ranks.append((func.greatest(*scores) if len(scores) > 1 else scores[0]).desc())
+    return ranks
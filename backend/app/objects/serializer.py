@@ -0,0 +1,80 @@
+"""Compiled list-row serializers.
+
+``BaseObject.to_list_schema`` used to re-walk ``column_definitions``, look up
+the action group and rebuild per-class constants for every row. A
+``ListSerializer`` resolves all of that once per object type and column set,
+so serializing a page is a single pass that only calls the per-column value
+accessors and builds the structs. ``encode`` writes the page straight to JSON
+bytes with the serializer's own encoder, which ``list_objects`` embeds in its
+response as is.
+"""
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import msgspec
+
+from app.actions.registry import ActionRegistry
+from app.base.models import BaseDBModel
+from app.objects.schemas import ObjectColumn, ObjectFieldDTO, ObjectListSchema
+from app.utils.sqids import sqid_enc_hook, sqid_encode
+
+if TYPE_CHECKING:
+    from app.objects.base import BaseObject
+
+
+class ListSerializer:
+    """Serializes objects of one type into ``ObjectListSchema`` rows for a fixed column set.
+
+    ``columns`` are rendered as given; callers filter on ``include_in_list``.
+    """
+
+    def __init__(self, object_class: type["BaseObject"], columns: Sequence[ObjectColumn]):
+        self.object_type = object_class.object_type
+        self.action_group_type = object_class.action_group
+        self.fields = tuple((col_def.key, col_def.label, col_def.editable, col_def.value) for col_def in columns)
+        self._title = object_class.title_field
+        self._subtitle = object_class.subtitle_field
+        self._link_prefix = f"/{self.object_type}/"
+        # Same Sqid handling as the app's type_encoders
+        self._encoder = msgspec.json.Encoder(enc_hook=sqid_enc_hook)
+
+    def serialize(self, objects: Sequence[BaseDBModel], action_registry: ActionRegistry) -> list[ObjectListSchema]:
+        """Render ``objects``; availability checks get the request's dependencies from ``action_registry``."""
+        # Action groups register after objects, so resolve per call (once per page)
+        action_group = action_registry.get_class(self.action_group_type) if self.action_group_type else None
+        object_type, fields, title, subtitle = self.object_type, self.fields, self._title, self._subtitle
+        link_prefix = self._link_prefix
+
+        # Availability is evaluated for the whole page at once (shared deps, memoized checks)
+        page_actions = action_group.get_available_actions_batch(objects) if action_group else [[]] * len(objects)
+
+        rows = []
+        for obj, actions in zip(objects, page_actions, strict=True):
+            object_id = sqid_encode(obj.id)
+            rows.append(
+                ObjectListSchema(
+                    id=object_id,
+                    object_type=object_type,
+                    title=title(obj),
+                    subtitle=subtitle(obj),
+                    # Only stateful models have a state column
+                    state=getattr(obj, "state", None),
+                    created_at=obj.created_at,
+                    updated_at=obj.updated_at,
+                    actions=actions,
+                    fields=[
+                        ObjectFieldDTO(key=key, value=value(obj), label=label, editable=editable)
+                        for key, label, editable, value in fields
+                    ],
+                    link=link_prefix + object_id,
+                )
+            )
+        return rows
+
+    def to_schema(self, obj: BaseDBModel, action_registry: ActionRegistry) -> ObjectListSchema:
+        return self.serialize([obj], action_registry)[0]
+
+    def encode(self, objects: Sequence[BaseDBModel], action_registry: ActionRegistry) -> bytes:
+        """``serialize`` straight to a JSON array."""
+        return self._encoder.encode(self.serialize(objects, action_registry))
@@ -1,11 +1,17 @@
 import logging
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-from typing import assert_never
+from typing import Any, assert_never
 
-from sqlalchemy import Select, and_, func, select
+import sqlalchemy as sa
+from sqlalchemy import Row, Select, Subquery, and_, case, cast, func, literal, select, tablesample, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.base.models import BaseDBModel
+from app.objects.counts import count_estimate
 from app.objects.enums import (
     AggregationType,
     FieldType,
@@ -21,7 +27,6 @@ from app.objects.schemas import (
     FilterDefinition,
     NumericalDataPoint,
     ObjectFilterDefinition,
-    ObjectListRequest,
     RangeFilterDefinition,
     SortDefinition,
     TextFilterDefinition,
@@ -31,6 +36,14 @@ from app.utils.tracing import trace_operation
 
 logger = logging.getLogger(__name__)
 
+# Breakdown key for the categories folded together by ``top_n``
+OTHER_CATEGORY = "Other"
+
+# Rows an approximate (sampled) time series aims to aggregate
+APPROXIMATE_SAMPLE_ROWS = 100_000
+# Fixed TABLESAMPLE seed, so refreshes of an unchanged table read the same pages
+_SAMPLE_SEED = 0
+
 
 def apply_filter(query: Select, model_class: type[BaseDBModel], filter_def: FilterDefinition) -> Select:
     column = getattr(model_class, filter_def.column, None)
@@ -124,70 +137,6 @@ def apply_sorts(query: Select, model_class: type[BaseDBModel], sorts: list[SortD
     return query
 
 
-@trace_operation("export_objects_to_csv")
-async def export_to_csv(
-    session: AsyncSession,
-    model_class: type[BaseDBModel],
-    request: ObjectListRequest,
-    columns: list[str] | None = None,
-) -> tuple[str, str]:
-    """Export objects to CSV with filters and sorts applied."""
-    import csv
-    import io
-
-    from sqlalchemy import select
-
-    # Build base query
-    stmt = select(model_class)
-
-    # Apply filters
-    for filter_def in request.filters:
-        stmt = apply_filter(stmt, model_class, filter_def)
-
-    # Apply sorts
-    stmt = apply_sorts(stmt, model_class, request.sorts)
-
-    # Execute query
-    result = await session.execute(stmt)
-    objects = list(result.scalars().all())
-
-    if not objects:
-        return "", f"{model_class.__name__.lower()}_export.csv"
-
-    # Generate CSV
-    output = io.StringIO()
-
-    # Determine columns to export
-    if columns:
-        fieldnames = columns
-    elif request.column:
-        fieldnames = request.column
-    elif hasattr(objects[0], "to_dict"):
-        # Fallback to all attributes
-        fieldnames = list(objects[0].to_dict().keys())
-    else:
-        # Last resort - use __dict__ keys
-        fieldnames = [k for k in objects[0].__dict__.keys() if not k.startswith("_")]
-
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
-    writer.writeheader()
-
-    for obj in objects:
-        if hasattr(obj, "to_dict"):
-            row_data = obj.to_dict()
-        else:
-            row_data = {k: getattr(obj, k, None) for k in fieldnames}
-
-        # Only include requested columns
-        row = {k: row_data.get(k) for k in fieldnames}
-        writer.writerow(row)
-
-    csv_content = output.getvalue()
-    filename = f"{model_class.__name__.lower()}_export.csv"
-
-    return csv_content, filename
-
-
 # ============================================================================
 # Time Series Functions
 # ============================================================================
@@ -356,6 +305,53 @@ def get_series_interval(granularity: Granularity) -> str:
             assert_never(granularity)
 
 
+def _add_months(moment: datetime, months: int) -> datetime:
+    month_index = moment.month - 1 + months
+    return moment.replace(year=moment.year + month_index // 12, month=month_index % 12 + 1)
+
+
+def bucket_bounds(moment: datetime, granularity: Granularity) -> tuple[datetime, datetime]:
+    """Start of the UTC ``granularity`` bucket containing ``moment`` and the start of the next one.
+
+    Mirrors ``date_trunc`` (weeks start on Monday).
+    """
+    moment = moment.astimezone(UTC)
+    day = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    match granularity:
+        case Granularity.hour:
+            start = moment.replace(minute=0, second=0, microsecond=0)
+            return start, start + timedelta(hours=1)
+        case Granularity.day:
+            return day, day + timedelta(days=1)
+        case Granularity.week:
+            start = day - timedelta(days=day.weekday())
+            return start, start + timedelta(weeks=1)
+        case Granularity.month:
+            start = day.replace(day=1)
+            return start, _add_months(start, 1)
+        case Granularity.quarter:
+            start = day.replace(month=(day.month - 1) // 3 * 3 + 1, day=1)
+            return start, _add_months(start, 3)
+        case Granularity.year:
+            start = day.replace(month=1, day=1)
+            return start, _add_months(start, 12)
+        case Granularity.automatic:
+            raise ValueError("Granularity must be resolved before aligning to buckets")
+        case _:
+            assert_never(granularity)
+
+
+def align_time_range(start_date: datetime, end_date: datetime, granularity: Granularity) -> tuple[datetime, datetime]:
+    """Widen a window to whole buckets: from its first bucket's start to just before its last bucket ends.
+
+    Relative ranges ("last_30_days") resolve against the current time; aligned,
+    every request within the same bucket covers the same window.
+    """
+    start, _ = bucket_bounds(start_date, granularity)
+    _, end = bucket_bounds(end_date, granularity)
+    return start, end - timedelta(microseconds=1)
+
+
 def _infer_field_type_from_column(column) -> FieldType:
     """Infer FieldType from a SQLAlchemy column type.
 
@@ -387,281 +383,546 @@ def _infer_field_type_from_column(column) -> FieldType:
         return FieldType.String
 
 
-@trace_operation("query_time_series")
-async def query_time_series_data(
+def time_bucket_series(granularity: Granularity, start_date: datetime, end_date: datetime) -> Subquery:
+    """Every ``granularity`` bucket from ``start_date`` to ``end_date`` as a ``time_bucket`` column.
+
+    Time-series queries outer-join their aggregates onto this to fill gaps.
+    """
+    # date_trunc aligns both ends to the granularity boundary
+    trunc_format = get_date_trunc_format(granularity)
+    return select(
+        func.generate_series(
+            func.date_trunc(trunc_format, start_date),
+            func.date_trunc(trunc_format, end_date),
+            text(f"interval '{get_series_interval(granularity)}'"),
+        ).label("time_bucket")
+    ).subquery()
+
+
+def fold_top_categories(agg_subquery: Subquery, top_n: int) -> Subquery:
+    """Keep the ``top_n`` categories with the most records in the window, and fold the rest.
+
+    ``agg_subquery`` has one (time_bucket, category_value, count) row per bucket
+    and category, optionally with a ``total_records`` column. The result has
+    the same columns plus ``is_other``: each bucket's tail categories become a
+    single row with a NULL ``category_value`` and ``is_other`` set, so the long
+    tail never leaves the database.
+    """
+    c = agg_subquery.c
+    # Rank categories by their count over the whole window (NULL categories last, never folded)
+    category_rank = func.dense_rank().over(
+        order_by=(c.category_value.is_(None), func.sum(c.count).desc(), c.category_value)
+    )
+    ranks = (
+        select(
+            c.category_value,
+            and_(c.category_value.is_not(None), category_rank > top_n).label("is_other"),
+        )
+        .group_by(c.category_value)
+        .subquery()
+    )
+    category_value = case((~ranks.c.is_other, c.category_value))
+    extra_columns = [func.max(c.total_records).label("total_records")] if "total_records" in c else []
+    return (
+        select(
+            c.time_bucket,
+            category_value.label("category_value"),
+            ranks.c.is_other,
+            cast(func.sum(c.count), sa.BigInteger).label("count"),
+            *extra_columns,
+        )
+        .join(ranks, c.category_value.is_not_distinct_from(ranks.c.category_value))
+        .group_by(c.time_bucket, category_value, ranks.c.is_other)
+        .subquery()
+    )
+
+
+def categorical_data_points(rows: Sequence[Row]) -> list[CategoricalDataPoint]:
+    """Fold (time_bucket, category_value, count[, is_other]) rows into one data point per bucket."""
+    # Note: generate_series ensures all time buckets exist
+    breakdown_dict: dict[datetime, dict[str, int]] = {}
+    for row in rows:
+        bucket_time = row.time_bucket
+
+        # Initialize bucket if needed
+        if bucket_time not in breakdown_dict:
+            breakdown_dict[bucket_time] = {}
+
+        if getattr(row, "is_other", None):
+            breakdown = breakdown_dict[bucket_time]
+            breakdown[OTHER_CATEGORY] = breakdown.get(OTHER_CATEGORY, 0) + row._mapping["count"]
+        # Only add category if it has data (skip NULL categories from LEFT JOIN)
+        elif row.category_value is not None:
+            category = str(row.category_value)
+            breakdown_dict[bucket_time][category] = row._mapping["count"]
+
+    return [
+        CategoricalDataPoint(
+            timestamp=bucket,
+            breakdowns=breakdowns,
+            total_count=sum(breakdowns.values()),
+        )
+        for bucket, breakdowns in sorted(breakdown_dict.items())
+    ]
+
+
+def numerical_data_points(rows: Sequence[Row]) -> list[NumericalDataPoint]:
+    """Convert (time_bucket, agg_value, record_count) rows into data points."""
+    return [
+        NumericalDataPoint(
+            timestamp=row.time_bucket,
+            value=float(row.agg_value) if row.agg_value is not None else None,
+            count=row.record_count,
+        )
+        for row in rows
+    ]
+
+
+def downsample_lttb(data_points: list[NumericalDataPoint], max_points: int) -> list[NumericalDataPoint]:
+    """Reduce ``data_points`` to ``max_points`` with Largest-Triangle-Three-Buckets.
+
+    The first and last points are kept. The points between are split into
+    ``max_points - 2`` even buckets, and from each the point forming the largest
+    triangle with the previously kept point and the next bucket's average is
+    kept, which preserves peaks and troughs. Empty values count as 0.
+    """
+    if max_points < 3 or len(data_points) <= max_points:
+        return data_points
+
+    xs = [point.timestamp.timestamp() for point in data_points]
+    ys = [float(point.value or 0) for point in data_points]
+    bucket_size = (len(data_points) - 2) / (max_points - 2)
+
+    sampled = [data_points[0]]
+    previous = 0
+    for i in range(max_points - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+
+        # Average of the next bucket (just the last point, for the final bucket)
+        next_end = min(int((i + 2) * bucket_size) + 1, len(data_points))
+        avg_x = sum(xs[end:next_end]) / (next_end - end)
+        avg_y = sum(ys[end:next_end]) / (next_end - end)
+
+        best, best_area = start, -1.0
+        prev_x, prev_y = xs[previous], ys[previous]
+        for j in range(start, end):
+            area = abs((prev_x - avg_x) * (ys[j] - prev_y) - (prev_x - xs[j]) * (avg_y - prev_y))
+            if area > best_area:
+                best, best_area = j, area
+        sampled.append(data_points[best])
+        previous = best
+
+    sampled.append(data_points[-1])
+    return sampled
+
+
+async def estimate_time_series_rows(
     session: AsyncSession,
     model_class: type[BaseDBModel],
-    field_name: str,
-    field_type: FieldType,
     start_date: datetime,
     end_date: datetime,
-    granularity: Granularity,
-    aggregation: AggregationType,
     filters: list[FilterDefinition],
-    query_relationship: str | None = None,
-    query_column: str | None = None,
-) -> tuple[list[NumericalDataPoint] | list[CategoricalDataPoint], int]:
-    """Query time series data with aggregation."""
-    from sqlalchemy import text
+) -> int:
+    """Planner estimate of the rows a time-series query over the window aggregates."""
+    query = select(model_class).where(model_class.created_at >= start_date, model_class.created_at <= end_date)
+    for filter_def in filters:
+        query = apply_filter(query, model_class, filter_def)
+    return await count_estimate(session, model_class, query)
 
-    # Get the column reference and determine if we need to join
-    join_relationship = None
-    if query_relationship and query_column:
-        # Get the relationship to join
-        relationship_attr = getattr(model_class, query_relationship, None)
-        if relationship_attr is None:
-            raise ValueError(f"Relationship {query_relationship} not found on {model_class.__name__}")
 
-        # Get the related model class
-        if not hasattr(relationship_attr.property, "mapper"):
-            raise ValueError(f"{query_relationship} is not a valid relationship on {model_class.__name__}")
+def approximate_sample_percent(estimated_rows: int) -> float | None:
+    """Share of pages to sample so about ``APPROXIMATE_SAMPLE_ROWS`` rows are read; None if all are."""
+    if estimated_rows <= APPROXIMATE_SAMPLE_ROWS:
+        return None
+    return 100.0 * APPROXIMATE_SAMPLE_ROWS / estimated_rows
 
-        related_model = relationship_attr.property.mapper.class_
 
-        # Get the column from the related model
-        column = getattr(related_model, query_column, None)
-        if column is None:
-            raise ValueError(f"Column {query_column} not found on {related_model.__name__}")
+def sampling_error_margin(sampled_records: int) -> float | None:
+    """Relative error of a scaled-up count at ~95% confidence, treating sampled rows as independent.
 
-        join_relationship = relationship_attr
+    TABLESAMPLE SYSTEM samples whole pages, and rows on a page tend to be
+    created together, so per-bucket values are noisier than this suggests.
+    """
+    if sampled_records == 0:
+        return None
+    return 1.96 / math.sqrt(sampled_records)
 
-        # Override field_type based on the actual column type being queried
-        # This ensures we use the correct aggregation logic (categorical vs numerical)
-        field_type = _infer_field_type_from_column(column)
-    else:
+
+def scale_sampled_data_points(
+    data_points: list[NumericalDataPoint] | list[CategoricalDataPoint],
+    factor: float,
+    aggregation: AggregationType,
+) -> list[NumericalDataPoint] | list[CategoricalDataPoint]:
+    """Scale counts (and sum/count values) aggregated over a sample up to the whole table.
+
+    Averages, minimums and maximums are estimated by the sample as they are.
+    """
+    scaled: list = []
+    for point in data_points:
+        if isinstance(point, NumericalDataPoint):
+            value = point.value
+            if value is not None and aggregation in (AggregationType.sum, AggregationType.count_):
+                value *= factor
+            scaled.append(NumericalDataPoint(timestamp=point.timestamp, value=value, count=round(point.count * factor)))
+        else:
+            breakdowns = {category: round(count * factor) for category, count in point.breakdowns.items()}
+            scaled.append(
+                CategoricalDataPoint(
+                    timestamp=point.timestamp, breakdowns=breakdowns, total_count=sum(breakdowns.values())
+                )
+            )
+    return scaled
+
+
+def _log_query_sql(message: str, statement: Select, **extra: object) -> None:
+    """Log ``statement`` with its values inlined, at DEBUG only.
+
+    Rendering literal SQL compiles the statement outside the compiled cache,
+    so it's skipped unless the output is actually logged.
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    from sqlalchemy.dialects import postgresql
+
+    compiled = statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    logger.debug(message, extra={**extra, "sql": str(compiled)})
+
+
+def _time_series_column(
+    model_class: type[BaseDBModel],
+    field_name: str,
+    field_type: FieldType,
+    query_relationship: str | None,
+    query_column: str | None,
+) -> tuple[Any, Any, FieldType]:
+    """Resolve the aggregated column, the relationship to join (if any) and the effective field type."""
+    if not (query_relationship and query_column):
         # Direct column access (original behavior)
         column = getattr(model_class, field_name, None)
         if column is None:
             raise ValueError(f"Column {field_name} not found on {model_class.__name__}")
+        return column, None, field_type
 
-    # Get timestamp column (default to created_at)
-    timestamp_column = model_class.created_at
+    # Get the relationship to join
+    relationship_attr = getattr(model_class, query_relationship, None)
+    if relationship_attr is None:
+        raise ValueError(f"Relationship {query_relationship} not found on {model_class.__name__}")
 
-    # Get date_trunc format and series interval
-    trunc_format = get_date_trunc_format(granularity)
-    series_interval = get_series_interval(granularity)
+    # Get the related model class
+    if not hasattr(relationship_attr.property, "mapper"):
+        raise ValueError(f"{query_relationship} is not a valid relationship on {model_class.__name__}")
 
-    # Build base query
-    query = select(model_class)
+    related_model = relationship_attr.property.mapper.class_
 
-    # Apply filters
-    for filter_def in filters:
-        query = apply_filter(query, model_class, filter_def)
+    # Get the column from the related model
+    column = getattr(related_model, query_column, None)
+    if column is None:
+        raise ValueError(f"Column {query_column} not found on {related_model.__name__}")
+
+    # Override field_type based on the actual column type being queried
+    # This ensures we use the correct aggregation logic (categorical vs numerical)
+    return column, relationship_attr, _infer_field_type_from_column(column)
+
+
+def _numerical_aggregate(column, aggregation: AggregationType):
+    match aggregation:
+        case AggregationType.sum:
+            return func.sum(column)
+        case AggregationType.avg:
+            return func.avg(column)
+        case AggregationType.max:
+            return func.max(column)
+        case AggregationType.min:
+            return func.min(column)
+        case AggregationType.count_:
+            return func.count(column)
+        case _:
+            return func.sum(column)  # default fallback
 
-    # Add time range filter
-    query = query.where(timestamp_column >= start_date, timestamp_column <= end_date)
 
-    # Count total records
-    count_query = select(func.count()).select_from(query.subquery())
+@trace_operation("query_time_series")
+async def query_time_series_data(
+    session: AsyncSession,
+    model_class: type[BaseDBModel],
+    field_name: str,
+    field_type: FieldType,
+    start_date: datetime,
+    end_date: datetime,
+    granularity: Granularity,
+    aggregation: AggregationType,
+    filters: list[FilterDefinition],
+    query_relationship: str | None = None,
+    query_column: str | None = None,
+    top_n: int | None = None,
+    sample_percent: float | None = None,
+) -> tuple[list[NumericalDataPoint] | list[CategoricalDataPoint], int]:
+    """Query time series data with aggregation.
+
+    With ``top_n``, categorical breakdowns keep only the most frequent categories
+    (see ``fold_top_categories``). With ``sample_percent``, only that share of
+    the table's pages is read (``TABLESAMPLE SYSTEM``); counts and values are
+    the sample's, see ``scale_sampled_data_points``.
+    """
+    source = model_class
+    if sample_percent is not None:
+        source = aliased(
+            model_class, tablesample(model_class.__table__, func.system(sample_percent), seed=literal(_SAMPLE_SEED))
+        )
 
-    # Compile and log the count query
-    from sqlalchemy.dialects import postgresql
+    # Get the column reference and determine if we need to join
+    column, join_relationship, field_type = _time_series_column(
+        source, field_name, field_type, query_relationship, query_column
+    )
 
-    compiled_count = count_query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
-    logger.info(
-        "Count query SQL",
-        extra={"model": model_class.__name__, "sql": str(compiled_count)},
+    # Get timestamp column (default to created_at)
+    timestamp_column = source.created_at
+    time_bucket_expr = func.date_trunc(get_date_trunc_format(granularity), timestamp_column)
+
+    # Handle categorical vs numerical aggregation
+    categorical = is_categorical_field(field_type) or aggregation == AggregationType.mode
+    if categorical:
+        # For categorical: GROUP BY time_bucket and field value, then count
+        agg_columns = [column.label("category_value"), func.count().label("count")]
+        group_by = [time_bucket_expr, column]
+    else:
+        # For numerical: apply aggregation function
+        agg_func = _numerical_aggregate(column, aggregation)
+        agg_columns = [agg_func.label("agg_value"), func.count().label("record_count")]
+        group_by = [time_bucket_expr]
+
+    # Build aggregation directly from the filtered table. The window sum adds up
+    # every group's row count, so the total comes out of the same scan.
+    agg_query = (
+        select(
+            time_bucket_expr.label("time_bucket"),
+            *agg_columns,
+            func.sum(func.count()).over().label("total_records"),
+        )
+        .select_from(source)  # Explicitly specify FROM clause for RLS
+        .where(timestamp_column >= start_date, timestamp_column <= end_date)
+        .group_by(*group_by)
+    )
+
+    # Add join if needed for relationship fields. An outer join keeps rows without
+    # a related object in the total; their NULL category isn't reported.
+    if join_relationship is not None:
+        agg_query = agg_query.outerjoin(join_relationship)
+
+    # Apply filters to aggregation query
+    for filter_def in filters:
+        agg_query = apply_filter(agg_query, source, filter_def)
+
+    agg_subquery = agg_query.subquery()
+    if categorical and top_n is not None:
+        agg_subquery = fold_top_categories(agg_subquery, top_n)
+
+    # Join with time series to fill gaps
+    time_series = time_bucket_series(granularity, start_date, end_date)
+    if categorical:
+        value_columns = [
+            agg_subquery.c.category_value,
+            func.coalesce(agg_subquery.c.count, 0).label("count"),
+        ]
+        if top_n is not None:
+            value_columns.append(agg_subquery.c.is_other)
+    else:
+        # Timestamp aggregations can't default to 0, so empty buckets stay NULL
+        agg_value = agg_subquery.c.agg_value
+        if field_type not in (FieldType.Date, FieldType.Datetime):
+            agg_value = func.coalesce(agg_value, 0)
+        value_columns = [
+            agg_value.label("agg_value"),
+            func.coalesce(agg_subquery.c.record_count, 0).label("record_count"),
+        ]
+
+    final_query = (
+        select(time_series.c.time_bucket, *value_columns, agg_subquery.c.total_records)
+        .select_from(time_series)
+        .outerjoin(
+            agg_subquery,
+            time_series.c.time_bucket == agg_subquery.c.time_bucket,
+        )
+        .order_by(time_series.c.time_bucket)
     )
+    _log_query_sql("Time series query SQL", final_query, model=model_class.__name__, field=field_name)
 
-    total_result = await session.execute(count_query)
-    total_count = total_result.scalar_one()
+    result = await session.execute(final_query)
+    rows = result.all()
+    # Every aggregated row carries the total; gap rows have NULL
+    total_count = next((int(row.total_records) for row in rows if row.total_records is not None), 0)
 
     logger.info(
-        "Time series query - record count",
+        "Time series query",
         extra={
             "model": model_class.__name__,
             "field": field_name,
             "total_count": total_count,
+            "num_rows": len(rows),
             "start_date": start_date,
             "end_date": end_date,
             "granularity": granularity,
         },
     )
 
-    # Generate time series using generate_series
-    # Use date_trunc on start_date to align to granularity boundary
-    time_series = select(
-        func.generate_series(
-            func.date_trunc(trunc_format, start_date),
-            func.date_trunc(trunc_format, end_date),
-            text(f"interval '{series_interval}'"),
-        ).label("time_bucket")
-    ).subquery()
+    if categorical:
+        return categorical_data_points(rows), total_count
+    return numerical_data_points(rows), total_count
 
-    # Handle categorical vs numerical aggregation
-    if is_categorical_field(field_type) or aggregation == AggregationType.mode:
-        # For categorical: GROUP BY time_bucket and field value, then count
-        # Build aggregation directly from the filtered table
-        time_bucket_expr = func.date_trunc(trunc_format, timestamp_column)
-
-        agg_query = (
-            select(
-                time_bucket_expr.label("time_bucket"),
-                column.label("category_value"),
-                func.count().label("count"),
-            )
-            .select_from(model_class)  # Explicitly specify FROM clause for RLS
-            .where(timestamp_column >= start_date, timestamp_column <= end_date)
-            .group_by(time_bucket_expr, column)
-        )
-
-        # Add join if needed for relationship fields
-        if join_relationship is not None:
-            agg_query = agg_query.join(join_relationship)
-
-        # Apply filters to aggregation query
-        for filter_def in filters:
-            agg_query = apply_filter(agg_query, model_class, filter_def)
 
-        agg_subquery = agg_query.subquery()
+@dataclass(frozen=True)
+class TimeSeriesSpec:
+    """One series of a batched time-series query (see ``query_time_series_batch``)."""
 
-        # Join with time series to fill gaps
-        final_query = (
-            select(
-                time_series.c.time_bucket,
-                agg_subquery.c.category_value,
-                func.coalesce(agg_subquery.c.count, 0).label("count"),
-            )
-            .select_from(time_series)
-            .outerjoin(
-                agg_subquery,
-                time_series.c.time_bucket == agg_subquery.c.time_bucket,
-            )
-            .order_by(time_series.c.time_bucket)
-        )
+    field_name: str
+    field_type: FieldType
+    aggregation: AggregationType
+    query_relationship: str | None = None
+    query_column: str | None = None
 
-        result = await session.execute(final_query)
-        rows = result.all()
-
-        # Convert to CategoricalBreakdown format
-        # Note: generate_series ensures all time buckets exist
-        breakdown_dict: dict[datetime, dict[str, int]] = {}
-        for row in rows:
-            bucket_time = row.time_bucket
-
-            # Initialize bucket if needed
-            if bucket_time not in breakdown_dict:
-                breakdown_dict[bucket_time] = {}
-
-            # Only add category if it has data (skip NULL categories from LEFT JOIN)
-            if row.category_value is not None:
-                category = str(row.category_value)
-                breakdown_dict[bucket_time][category] = row.count
-
-        categorical_data = [
-            CategoricalDataPoint(
-                timestamp=bucket,
-                breakdowns=breakdowns,
-                total_count=sum(breakdowns.values()),
-            )
-            for bucket, breakdowns in sorted(breakdown_dict.items())
-        ]
 
-        return categorical_data, total_count
+@trace_operation("query_time_series_batch")
+async def query_time_series_batch(
+    session: AsyncSession,
+    model_class: type[BaseDBModel],
+    specs: Sequence[TimeSeriesSpec],
+    start_date: datetime,
+    end_date: datetime,
+    granularity: Granularity,
+    filters: list[FilterDefinition],
+) -> tuple[list[list[NumericalDataPoint] | list[CategoricalDataPoint]], int]:
+    """``query_time_series_data`` for several series sharing a time range and filters.
 
-    else:
-        # For numerical: apply aggregation function
-        match aggregation:
-            case AggregationType.sum:
-                agg_func = func.sum(column)
-            case AggregationType.avg:
-                agg_func = func.avg(column)
-            case AggregationType.max:
-                agg_func = func.max(column)
-            case AggregationType.min:
-                agg_func = func.min(column)
-            case AggregationType.count:
-                agg_func = func.count(column)
-            case _:
-                agg_func = func.sum(column)  # default fallback
-
-        # Build aggregation directly from the filtered table
-        time_bucket_expr = func.date_trunc(trunc_format, timestamp_column)
-
-        agg_query = (
-            select(
-                time_bucket_expr.label("time_bucket"),
-                agg_func.label("agg_value"),
-                func.count().label("record_count"),
+    Every series is computed from a single scan: numerical aggregates are
+    grouped by time bucket, and each categorical column gets its own
+    (time bucket, value) grouping set. Returns the series in ``specs``
+    order and the number of matching records, which all series share.
+    """
+    timestamp_column = model_class.created_at
+    time_bucket_expr = func.date_trunc(get_date_trunc_format(granularity), timestamp_column)
+
+    joins: dict[str, Any] = {}
+    category_columns: dict[tuple[str | None, str], Any] = {}
+    # Per spec: ("category", index into category_columns) or ("value", field type)
+    layout: list[tuple[str, Any]] = []
+    value_columns = []
+    for index, spec in enumerate(specs):
+        column, join_relationship, field_type = _time_series_column(
+            model_class, spec.field_name, spec.field_type, spec.query_relationship, spec.query_column
+        )
+        if join_relationship is not None and spec.query_relationship is not None:
+            joins.setdefault(spec.query_relationship, join_relationship)
+
+        if is_categorical_field(field_type) or spec.aggregation == AggregationType.mode:
+            # Two series over the same column share its grouping set
+            key = (spec.query_relationship, column.key)
+            category_columns.setdefault(key, column)
+            layout.append(("category", list(category_columns).index(key)))
+        else:
+            value_columns.append(_numerical_aggregate(column, spec.aggregation).label(f"value_{index}"))
+            layout.append(("value", field_type))
+
+    categories = list(category_columns.values())
+    agg_query = (
+        select(
+            time_bucket_expr.label("time_bucket"),
+            *(column.label(f"category_{k}") for k, column in enumerate(categories)),
+            # grouping() is 0 in the rows grouped by that column, 1 elsewhere
+            *(func.grouping(column).label(f"grouping_{k}") for k, column in enumerate(categories)),
+            *value_columns,
+            func.count().label("record_count"),
+        )
+        .select_from(model_class)  # Explicitly specify FROM clause for RLS
+        .where(timestamp_column >= start_date, timestamp_column <= end_date)
+    )
+    if categories:
+        agg_query = agg_query.group_by(
+            func.grouping_sets(
+                tuple_(time_bucket_expr),
+                *(tuple_(time_bucket_expr, column) for column in categories),
             )
-            .select_from(model_class)  # Explicitly specify FROM clause for RLS
-            .where(timestamp_column >= start_date, timestamp_column <= end_date)
-            .group_by(time_bucket_expr)
         )
+    else:
+        agg_query = agg_query.group_by(time_bucket_expr)
 
-        # Add join if needed for relationship fields
-        if join_relationship is not None:
-            agg_query = agg_query.join(join_relationship)
-
-        # Apply filters to aggregation query
-        for filter_def in filters:
-            agg_query = apply_filter(agg_query, model_class, filter_def)
-
-        agg_subquery = agg_query.subquery()
-
-        # Determine the default value for COALESCE based on field type
-        # For datetime/date fields, use NULL; for numeric fields, use 0
-        if field_type in (FieldType.Date, FieldType.Datetime):
-            # For timestamp aggregations, we can't use 0, so use NULL
-            default_agg_value = None
-        else:
-            # For numeric fields, use 0
-            default_agg_value = 0
+    # Outer joins keep rows without a related object in the total, as in query_time_series_data
+    for join_relationship in joins.values():
+        agg_query = agg_query.outerjoin(join_relationship)
 
-        # Join with time series to fill gaps using COALESCE
-        # Only COALESCE the agg_value if it's numeric, otherwise leave as NULL
-        if default_agg_value is not None:
-            agg_value_expr = func.coalesce(agg_subquery.c.agg_value, default_agg_value).label("agg_value")
-        else:
-            agg_value_expr = agg_subquery.c.agg_value.label("agg_value")
+    for filter_def in filters:
+        agg_query = apply_filter(agg_query, model_class, filter_def)
 
-        final_query = (
-            select(
-                time_series.c.time_bucket,
-                agg_value_expr,
-                func.coalesce(agg_subquery.c.record_count, 0).label("record_count"),
-            )
-            .select_from(time_series)
-            .outerjoin(
-                agg_subquery,
-                time_series.c.time_bucket == agg_subquery.c.time_bucket,
-            )
-            .order_by(time_series.c.time_bucket)
-        )
+    agg_subquery = agg_query.subquery()
 
-        # Compile and log the final query
-        from sqlalchemy.dialects import postgresql
-
-        compiled_final = final_query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
-        logger.info(
-            "Final aggregation query SQL",
-            extra={
-                "model": model_class.__name__,
-                "field": field_name,
-                "sql": str(compiled_final),
-            },
+    # Join with time series to fill gaps; gap buckets come back as one all-NULL row
+    time_series = time_bucket_series(granularity, start_date, end_date)
+    final_query = (
+        select(
+            time_series.c.time_bucket,
+            *(c for c in agg_subquery.c if c.key != "time_bucket"),
         )
+        .select_from(time_series)
+        .outerjoin(agg_subquery, time_series.c.time_bucket == agg_subquery.c.time_bucket)
+        .order_by(time_series.c.time_bucket)
+    )
+    _log_query_sql("Time series batch query SQL", final_query, model=model_class.__name__)
 
-        result = await session.execute(final_query)
-        rows = result.all()
-
-        logger.info(
-            "Time series query - numerical results",
-            extra={
-                "model": model_class.__name__,
-                "field": field_name,
-                "num_rows": len(rows),
-                "sample_rows": rows[:3] if rows else [],
-            },
-        )
+    rows = (await session.execute(final_query)).all()
 
-        data_points = [
-            NumericalDataPoint(
-                timestamp=row.time_bucket,
-                value=float(row.agg_value) if row.agg_value is not None else None,
-                count=row.record_count,
+    bucket_rows: dict[datetime, Row | None] = {}
+    breakdowns: list[dict[datetime, dict[str, int]]] = [{} for _ in categories]
+    for row in rows:
+        bucket_rows.setdefault(row.time_bucket, None)
+        if row.record_count is None:
+            continue
+        grouped_by = next((k for k in range(len(categories)) if getattr(row, f"grouping_{k}") == 0), None)
+        if grouped_by is None:
+            bucket_rows[row.time_bucket] = row
+        elif (category := getattr(row, f"category_{grouped_by}")) is not None:
+            breakdowns[grouped_by].setdefault(row.time_bucket, {})[str(category)] = row.record_count
+
+    total_count = sum(row.record_count for row in bucket_rows.values() if row is not None)
+
+    series: list[list[NumericalDataPoint] | list[CategoricalDataPoint]] = []
+    for index, (kind, detail) in enumerate(layout):
+        if kind == "category":
+            series.append(
+                [
+                    CategoricalDataPoint(
+                        timestamp=bucket,
+                        breakdowns=breakdowns[detail].get(bucket, {}),
+                        total_count=sum(breakdowns[detail].get(bucket, {}).values()),
+                    )
+                    for bucket in bucket_rows
+                ]
             )
-            for row in rows
-        ]
+            continue
+        # Timestamp aggregations can't default to 0, so empty buckets stay NULL
+        default = None if detail in (FieldType.Date, FieldType.Datetime) else 0
+        points = []
+        for bucket, row in bucket_rows.items():
+            value = getattr(row, f"value_{index}") if row is not None else None
+            if value is None:
+                value = default
+            points.append(
+                NumericalDataPoint(
+                    timestamp=bucket,
+                    value=float(value) if value is not None else None,
+                    count=row.record_count if row is not None else 0,
+                )
+            )
+        series.append(points)
 
-        return data_points, total_count
+    logger.info(
+        "Time series batch query",
+        extra={
+            "model": model_class.__name__,
+            "fields": [spec.field_name for spec in specs],
+            "total_count": total_count,
+            "num_rows": len(rows),
+            "start_date": start_date,
+            "end_date": end_date,
+            "granularity": granularity,
+        },
+    )
+    return series, total_count
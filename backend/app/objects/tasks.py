@@ -0,0 +1,66 @@
+"""Background tasks for object time-series rollups and the result cache."""
+
+import logging
+from datetime import UTC, datetime
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.objects.models import ResultCacheEntry
+from app.objects.rollups import rebuild_rollups, rollup_object_classes
+from app.queue.registry import scheduled_task
+from app.queue.transactions import with_transaction
+from app.queue.types import AppContext
+from app.utils.discovery import discover_and_import
+
+__all__ = ["purge_expired_result_cache", "reconcile_time_series_rollups"]
+
+logger = logging.getLogger(__name__)
+
+# Object classes register on import; the worker doesn't load the object routes
+discover_and_import(["objects.py"], base_path="app")
+
+
+@scheduled_task(cron="30 3 * * *", timeout=1800)
+@with_transaction
+async def reconcile_time_series_rollups(ctx: AppContext, transaction: AsyncSession) -> dict:
+    """Rebuild every time-series rollup from the raw tables.
+
+    Runs daily at 3:30 AM UTC. Event-driven maintenance misses writes that
+    bypass ``emit_event``; the rebuild brings those back in line.
+
+    Args:
+        ctx: SAQ task context
+        transaction: Database session with active transaction (injected by decorator)
+
+    Returns:
+        Dictionary of rollup rows written per object type
+    """
+    result = {}
+    for object_class in rollup_object_classes():
+        result[str(object_class.object_type)] = await rebuild_rollups(transaction, object_class)
+
+    logger.info(f"Time-series rollup reconciliation completed: {result}")
+    return result
+
+
+@scheduled_task(cron="15 * * * *", timeout=300)
+@with_transaction
+async def purge_expired_result_cache(ctx: AppContext, transaction: AsyncSession) -> dict:
+    """Delete expired entries from the shared time-series result cache.
+
+    Runs hourly. Only the ``postgres`` cache backend writes
+    ``result_cache_entries``; with the in-memory LRU this is a no-op.
+
+    Args:
+        ctx: SAQ task context
+        transaction: Database session with active transaction (injected by decorator)
+
+    Returns:
+        Dictionary with the number of deleted entries
+    """
+    result = await transaction.execute(
+        delete(ResultCacheEntry).where(ResultCacheEntry.expires_at <= datetime.now(tz=UTC))
+    )
+    logger.info(f"Purged {result.rowcount} expired result cache entries")
+    return {"deleted": result.rowcount}
@@ -0,0 +1,237 @@
+"""Single-series time-series queries shared by the object and dashboard routes."""
+
+from datetime import datetime
+
+import msgspec
+from litestar.exceptions import ValidationException
+from litestar.stores.base import Store
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.objects.base import BaseObject
+from app.objects.cache import cache_key, get_cached, set_cached
+from app.objects.counts import CountCache
+from app.objects.rollups import query_rollup_time_series, uses_rollups
+from app.objects.schemas import (
+    CategoricalDataPoint,
+    CategoricalTimeSeriesData,
+    FilterDefinition,
+    NumericalDataPoint,
+    NumericalTimeSeriesData,
+    ObjectColumn,
+    TimeSeriesData,
+    TimeSeriesDataRequest,
+    TimeSeriesDataResponse,
+    TimeSeriesSampling,
+)
+from app.objects.services import (
+    align_time_range,
+    approximate_sample_percent,
+    bucket_bounds,
+    determine_granularity,
+    downsample_lttb,
+    estimate_time_series_rows,
+    get_default_aggregation,
+    query_time_series_data,
+    resolve_time_range,
+    sampling_error_margin,
+    scale_sampled_data_points,
+)
+from app.utils.configure import config
+
+# Planner estimates only move with table statistics: reuse one per window and filter set for a minute
+ROW_ESTIMATE_TTL_SECONDS = 60.0
+_row_estimates = CountCache(ttl=ROW_ESTIMATE_TTL_SECONDS)
+
+
+def time_series_data(data_points: list[NumericalDataPoint] | list[CategoricalDataPoint]) -> TimeSeriesData:
+    """Wrap data points in the appropriate discriminated union type."""
+    # Note: the time series queries always return complete data with gaps filled via SQL
+    if isinstance(data_points, list) and len(data_points) > 0:
+        if isinstance(data_points[0], NumericalDataPoint):
+            return NumericalTimeSeriesData(data_points=data_points)  # type: ignore
+        # Categorical data
+        return CategoricalTimeSeriesData(data_points=data_points)  # type: ignore
+    # Empty data, default to numerical
+    return NumericalTimeSeriesData(data_points=[])
+
+
+def source_tables(object_service: type[BaseObject], field_metadata: ObjectColumn) -> list[str]:
+    """Tables whose writes can change the series (the object's, plus a queried relationship's)."""
+    model_class = object_service.model()
+    tables = [model_class.__tablename__]
+    if field_metadata.query_relationship:
+        relationship_attr = getattr(model_class, field_metadata.query_relationship, None)
+        if relationship_attr is not None and hasattr(relationship_attr.property, "mapper"):
+            tables.append(relationship_attr.property.mapper.class_.__tablename__)
+    return tables
+
+
+async def estimated_rows(
+    session: AsyncSession,
+    object_service: type[BaseObject],
+    start_date: datetime,
+    end_date: datetime,
+    filters: list[FilterDefinition],
+) -> int:
+    """``estimate_time_series_rows``, cached per object type, window and filters.
+
+    The estimate comes from table statistics, not the rows a scope can see, so
+    it's shared across teams.
+    """
+    key = msgspec.json.encode(
+        (
+            str(object_service.object_type),
+            start_date,
+            end_date,
+            sorted(msgspec.json.encode(filter_def).decode() for filter_def in filters),
+        )
+    ).decode()
+    estimate = _row_estimates.get(key)
+    if estimate is None:
+        estimate = await estimate_time_series_rows(session, object_service.model(), start_date, end_date, filters)
+        _row_estimates.set(key, estimate)
+    return estimate
+
+
+async def get_time_series(
+    session: AsyncSession,
+    object_service: type[BaseObject],
+    data: TimeSeriesDataRequest,
+    cache: Store | None = None,
+    team_id: int | None = None,
+    refresh: bool = False,
+    campaign_scoped: bool = False,
+) -> TimeSeriesDataResponse:
+    """Answer a ``/o/{object_type}/data`` request from the cache, the rollups or the raw table.
+
+    Results are cached in ``cache`` per ``team_id`` (see app/objects/cache.py);
+    without either, every call queries. ``refresh`` recomputes and re-caches
+    the result even if it's already cached. ``campaign_scoped`` requests (campaign
+    guests) never read the rollups, which are kept per team. With ``since_bucket`` only the buckets
+    from the one containing it onwards are computed and returned. ``top_n``
+    caps categorical breakdowns and ``max_points`` downsamples numerical series.
+    Raw-table queries over windows the planner expects to exceed
+    ``TIME_SERIES_APPROXIMATE_THRESHOLD`` rows report ``approximate_suggested``;
+    with ``approximate`` they read a sample of the table instead, sized from the
+    same estimate (see ``estimated_rows``).
+    """
+    # Validate field exists and get metadata
+    object_service.validate_field_exists(data.field)
+    field_metadata = object_service.get_field_metadata(data.field)
+
+    if field_metadata is None:
+        raise ValueError(f"Field {data.field} not found")
+
+    field_type = field_metadata.type
+
+    if data.top_n is not None and data.top_n < 1:
+        raise ValidationException(detail="top_n must be at least 1")
+    if data.max_points is not None and data.max_points < 3:
+        raise ValidationException(detail="max_points must be at least 3")
+
+    # Resolve time range
+    start_date, end_date = resolve_time_range(data.time_range, data.start_date, data.end_date)
+
+    # Determine granularity
+    granularity = determine_granularity(data.granularity, start_date, end_date)
+
+    # Relative ranges resolve against "now": align them to whole buckets so the
+    # window (and its cache key) only moves when a new bucket starts
+    if data.start_date is None or data.end_date is None:
+        start_date, end_date = align_time_range(start_date, end_date, granularity)
+
+    # Determine aggregation type
+    aggregation = data.aggregation or get_default_aggregation(field_type)
+
+    # Delta refresh: recompute only the buckets from the client's watermark on
+    query_start = start_date
+    if data.since_bucket is not None:
+        query_start = max(start_date, bucket_bounds(data.since_bucket, granularity)[0])
+
+    key = None
+    if cache is not None and team_id is not None:
+        request = (
+            str(object_service.object_type),
+            data.field,
+            aggregation,
+            granularity,
+            start_date,
+            query_start,
+            end_date,
+            data.top_n,
+            data.max_points,
+            data.approximate,
+            # Filters are ANDed, so their order doesn't matter
+            sorted(msgspec.json.encode(filter_def).decode() for filter_def in data.filters),
+        )
+        key = await cache_key(session, team_id, source_tables(object_service, field_metadata), request)
+        if not refresh and (cached := await get_cached(cache, key, TimeSeriesDataResponse)) is not None:
+            return cached
+
+    sampling = None
+    approximate_suggested = False
+
+    # Query data: pre-aggregated rollups when they cover the request, else the raw table
+    if query_start > end_date:
+        data_points, total_records = [], 0
+    elif uses_rollups(object_service, field_metadata, aggregation, data.filters, campaign_scoped):
+        data_points, total_records = await query_rollup_time_series(
+            session=session,
+            object_class=object_service,
+            field_name=data.field,
+            start_date=query_start,
+            end_date=end_date,
+            granularity=granularity,
+            aggregation=aggregation,
+            top_n=data.top_n,
+        )
+    else:
+        model_class = object_service.model()
+        row_estimate = await estimated_rows(session, object_service, query_start, end_date, data.filters)
+        approximate_suggested = row_estimate > config.TIME_SERIES_APPROXIMATE_THRESHOLD
+        sample_percent = approximate_sample_percent(row_estimate) if data.approximate else None
+        data_points, total_records = await query_time_series_data(
+            session=session,
+            model_class=model_class,
+            field_name=data.field,
+            field_type=field_type,
+            start_date=query_start,
+            end_date=end_date,
+            granularity=granularity,
+            aggregation=aggregation,
+            filters=data.filters,
+            query_relationship=field_metadata.query_relationship,
+            query_column=field_metadata.query_column,
+            top_n=data.top_n,
+            sample_percent=sample_percent,
+        )
+        if sample_percent is not None:
+            sampling = TimeSeriesSampling(
+                sample_percent=sample_percent,
+                sampled_records=total_records,
+                error_margin=sampling_error_margin(total_records),
+            )
+            factor = 100 / sample_percent
+            data_points = scale_sampled_data_points(data_points, factor, aggregation)
+            total_records = round(total_records * factor)
+    if data.max_points is not None and (
+        numerical := [point for point in data_points if isinstance(point, NumericalDataPoint)]
+    ):
+        data_points = downsample_lttb(numerical, data.max_points)
+
+    response = TimeSeriesDataResponse(
+        data=time_series_data(data_points),
+        field_name=data.field,
+        field_type=field_type,
+        aggregation_type=aggregation,
+        granularity_used=granularity,
+        start_date=start_date,
+        end_date=end_date,
+        total_records=total_records,
+        since_bucket=query_start if data.since_bucket is not None else None,
+        sampling=sampling,
+        approximate_suggested=approximate_suggested,
+    )
+    if cache is not None and key is not None:
+        await set_cached(cache, key, response)
+    return response
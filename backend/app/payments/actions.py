@@ -9,7 +9,7 @@ from app.actions.state_actions import BaseUpdateStateAction
 from app.payments.enums import InvoiceActions, InvoiceStates
 from app.payments.models import Invoice
 from app.payments.schemas import InvoiceCreateSchema, InvoiceUpdateSchema
-from app.utils.db import create_model, update_model
+from app.utils.db import create_model, delete_model, update_model
 
 invoice_actions = action_group_factory(ActionGroupType.InvoiceActions, model_type=Invoice)
 
@@ -28,7 +28,7 @@ class DeleteInvoice(BaseObjectAction[Invoice, EmptyActionData]):
     async def execute(
         cls, obj: Invoice, data: EmptyActionData, transaction: AsyncSession, deps
     ) -> ActionExecutionResponse:
-        await transaction.delete(obj)
+        await delete_model(session=transaction, model_instance=obj, user_id=deps.user, team_id=obj.team_id)
         return ActionExecutionResponse(
             message="Deleted invoice",
         )
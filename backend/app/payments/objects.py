@@ -36,6 +36,9 @@ class InvoiceObject(BaseObject[Invoice]):
     # Action groups
     action_group = ActionGroupType.InvoiceActions
 
+    # Pre-aggregated time series (time_series_rollups)
+    rollup_fields = ("amount_due", "amount_paid")
+
     column_definitions = [
         ObjectColumn(
             key="id",
@@ -11,6 +11,8 @@ To add a new task:
 4. Done! It's automatically registered via auto-discovery.
 """
 
+import asyncio
+from contextlib import suppress
 from datetime import UTC
 from typing import cast
 
@@ -63,6 +65,20 @@ async def queue_startup(ctx: AppContext) -> None:
 
     ctx["db_sessionmaker"] = async_sessionmaker(engine, expire_on_commit=False)
 
+    # Admin-role sessions, for the few tasks that run DDL (event partition maintenance)
+    admin_engine = create_async_engine(
+        config.ADMIN_ASYNC_DB_URL,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=0,
+        max_overflow=2,
+        pool_timeout=30,
+        connect_args={
+            "connect_timeout": 10,
+            "application_name": "manageros-worker-admin",
+        },
+    )
+    ctx["admin_sessionmaker"] = async_sessionmaker(admin_engine, expire_on_commit=False)
+
     # Inject S3 client
     s3_client = provide_s3_client(config)
     ctx["s3_client"] = s3_client
@@ -74,6 +90,28 @@ async def queue_startup(ctx: AppContext) -> None:
     ctx["config"] = config
     ctx["queue"] = ctx["worker"].queue
 
+    # Deliver outbox events (app/events/dispatcher.py) for as long as the worker runs
+    if config.EVENT_DISPATCH_MODE == "outbox":
+        from litestar.channels import ChannelsPlugin
+        from litestar.channels.backends.psycopg import PsycoPgChannelsBackend
+
+        from app.events.dispatcher import run_outbox_dispatcher
+
+        channels = ChannelsPlugin(backend=PsycoPgChannelsBackend(config.ADMIN_DB_URL), arbitrary_channels_allowed=True)
+        await channels.__aenter__()
+        ctx["channels"] = channels
+        ctx["outbox_dispatcher"] = asyncio.create_task(run_outbox_dispatcher(ctx["db_sessionmaker"], channels))
+
+
+async def queue_shutdown(ctx: AppContext) -> None:
+    """Stop the outbox dispatcher and its channels connection when the worker stops."""
+    if dispatcher := ctx.get("outbox_dispatcher"):
+        dispatcher.cancel()
+        with suppress(asyncio.CancelledError):
+            await dispatcher
+    if channels := ctx.get("channels"):
+        await channels.__aexit__(None, None, None)
+
 
 def get_queue_config() -> list[QueueConfig]:
     """
@@ -99,6 +137,7 @@ def get_queue_config() -> list[QueueConfig]:
             cron_tz=UTC,
             # Worker lifecycle hooks
             startup=cast(ReceivesContext, queue_startup),  # Inject dependencies when worker starts
+            shutdown=cast(ReceivesContext, queue_shutdown),
             # Worker configuration
             concurrency=10,  # Number of concurrent tasks
             # Connection pool settings for Postgres - zero persistent for Aurora scale-to-zero
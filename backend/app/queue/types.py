@@ -1,7 +1,9 @@
 """Type definitions for queue context and tasks."""
 
-from typing import Required
+import asyncio
+from typing import NotRequired, Required
 
+from litestar.channels import ChannelsPlugin
 from saq.queue import Queue
 from saq.types import Context
 from sqlalchemy.ext.asyncio import async_sessionmaker
@@ -23,7 +25,12 @@ class AppContext(Context):
     """
 
     db_sessionmaker: Required[async_sessionmaker]
+    # Sessions as the admin (migration) role; only for tasks that run DDL
+    admin_sessionmaker: Required[async_sessionmaker]
     config: Required[Config]
     s3_client: Required[S3Client]
     openai_client: Required[OpenAIClient]
     queue: Required[Queue]
+    # Set when EVENT_DISPATCH_MODE is "outbox"
+    channels: NotRequired[ChannelsPlugin]
+    outbox_dispatcher: NotRequired[asyncio.Task[None]]
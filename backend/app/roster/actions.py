@@ -1,5 +1,3 @@
-from datetime import UTC
-
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -17,7 +15,7 @@ from app.addresses.models import Address
 from app.roster.enums import RosterActions
 from app.roster.models import Roster
 from app.roster.schemas import RosterCreateSchema, RosterUpdateSchema
-from app.utils.db import update_model
+from app.utils.db import delete_model, update_model
 
 # Create roster action group
 roster_actions = action_group_factory(
@@ -41,11 +39,13 @@ class DeleteRoster(BaseObjectAction[Roster, EmptyActionData]):
     async def execute(
         cls, obj: Roster, data: EmptyActionData, transaction: AsyncSession, deps
     ) -> ActionExecutionResponse:
-        from datetime import datetime
-
-        # Soft delete by setting deleted_at
-        obj.deleted_at = datetime.now(tz=UTC)
-        await transaction.flush()
+        await delete_model(
+            session=transaction,
+            model_instance=obj,
+            user_id=deps.user,
+            team_id=obj.team_id,
+            soft=True,
+        )
         return ActionExecutionResponse(
             message="Deleted roster member",
         )
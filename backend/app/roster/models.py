@@ -30,6 +30,23 @@ class Roster(
     """Talent/influencer with their own login - part of the object platform."""
 
     __tablename__ = "roster"
+    # Backs RosterObject.search_columns (ILIKE and trigram similarity)
+    __table_args__ = (
+        sa.Index(
+            "ix_roster_search_trgm",
+            "name",
+            "email",
+            "instagram_handle",
+            "tiktok_handle",
+            postgresql_using="gin",
+            postgresql_ops={
+                "name": "gin_trgm_ops",
+                "email": "gin_trgm_ops",
+                "instagram_handle": "gin_trgm_ops",
+                "tiktok_handle": "gin_trgm_ops",
+            },
+        ),
+    )
 
     user_id: Mapped[Sqid] = mapped_column(
         sa.ForeignKey("users.id", ondelete="CASCADE"),
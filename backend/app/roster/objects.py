@@ -40,6 +40,12 @@ class RosterObject(BaseObject[Roster]):
     # Load options
     load_options = [joinedload(Roster.user), joinedload(Roster.profile_photo)]
 
+    # Projection for requested list columns
+    list_columns = ("name", "instagram_handle")
+
+    # Trigram-indexed search (ix_roster_search_trgm)
+    search_columns = ("name", "email", "instagram_handle", "tiktok_handle")
+
     column_definitions = [
         ObjectColumn(
             key="name",
@@ -99,6 +105,7 @@ class RosterObject(BaseObject[Roster]):
             editable=False,
             nullable=True,
             include_in_list=True,
+            load=("profile_photo",),
         ),
         ObjectColumn(
             key="facebook_handle",
@@ -35,6 +35,8 @@ class DeleteTeam(BaseObjectAction[Team, EmptyActionData]):
     )
     should_redirect_to_parent = False
 
+    availability_inputs = ("is_deleted",)
+
     @classmethod
     def is_available(
         cls,
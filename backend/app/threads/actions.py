@@ -26,6 +26,8 @@ class UpdateMessage(BaseObjectAction[Message, MessageUpdateSchema]):
     priority = 10
     icon = ActionIcon.edit
 
+    availability_inputs = ("user_id",)
+
     @classmethod
     def is_available(
         cls,
@@ -78,6 +80,8 @@ class DeleteMessage(BaseObjectAction[Message, EmptyActionData]):
     confirmation_message = "Are you sure you want to delete this message?"
     should_redirect_to_parent = True
 
+    availability_inputs = ("user_id",)
+
     @classmethod
     def is_available(
         cls,
@@ -77,6 +77,9 @@ class Message(
     # Content (stored as TipTap JSON format)
     content: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
 
+    # Event this message was posted for (app/events/consumers.py); a coalesced event rewrites it
+    event_id: Mapped[int | None] = mapped_column(sa.Integer, nullable=True, index=True)
+
     # Relationships
     thread: Mapped["Thread"] = relationship("Thread", back_populates="messages")
     user: Mapped["User | None"] = relationship("User")
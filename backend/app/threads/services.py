@@ -1,11 +1,12 @@
 import logging
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import cast
 
 from litestar.channels import ChannelsPlugin
 from litestar.stores.base import Store
 from litestar.stores.memory import MemoryStore
-from sqlalchemy import func, select
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.threads.models import Message, Thread, ThreadReadStatus
@@ -79,6 +80,36 @@ async def get_or_create_thread(
     return thread
 
 
+@trace_operation("get_or_create_threads")
+async def get_or_create_threads(
+    transaction: AsyncSession,
+    threadables: Iterable[tuple[str, int, int]],
+) -> dict[tuple[str, int], Thread]:
+    """Threads for several (threadable_type, threadable_id, team_id) objects: one lookup, one flush for new ones."""
+    team_ids = {(threadable_type, threadable_id): team_id for threadable_type, threadable_id, team_id in threadables}
+    if not team_ids:
+        return {}
+
+    stmt = select(Thread).where(tuple_(Thread.threadable_type, Thread.threadable_id).in_(list(team_ids)))
+    result = await transaction.execute(stmt)
+    threads = {(thread.threadable_type, thread.threadable_id): thread for thread in result.scalars()}
+
+    missing = [key for key in team_ids if key not in threads]
+    for threadable_type, threadable_id in missing:
+        thread = Thread(
+            threadable_type=threadable_type,
+            threadable_id=threadable_id,
+            team_id=team_ids[threadable_type, threadable_id],
+        )
+        transaction.add(thread)
+        threads[threadable_type, threadable_id] = thread
+    if missing:
+        await transaction.flush()
+        logger.info(f"Created {len(missing)} new thread(s)")
+
+    return threads
+
+
 async def get_unread_count(
     session: AsyncSession,
     thread_id: int,
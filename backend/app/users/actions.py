@@ -28,6 +28,8 @@ class UpdateUser(BaseObjectAction[User, UserUpdateSchema]):
     priority = 50
     icon = ActionIcon.edit
 
+    availability_inputs = ("id",)
+
     @classmethod
     def is_available(cls, obj: User | None, deps: ActionDeps) -> bool:
         # Users can only edit their own profile
@@ -6,6 +6,7 @@ from typing import Protocol, runtime_checkable
 
 import boto3
 from dotenv import load_dotenv
+from sqlalchemy.engine import make_url
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +62,13 @@ class ConfigProtocol(Protocol):
     OPENAI_ORG_ID: str | None
     OPENAI_MODEL: str
     LOG_LEVEL: str
+    TIME_SERIES_CACHE_BACKEND: str
+    TIME_SERIES_APPROXIMATE_THRESHOLD: int
+    DASHBOARD_PREWARM_CONCURRENCY: int
+    DASHBOARD_PREWARM_BUDGET_SECONDS: float
+    EVENT_DISPATCH_MODE: str
+    EVENT_COALESCE_SECONDS: float
+    EVENT_RETENTION_MONTHS: int
 
     # OpenTelemetry Configuration
     BETTERSTACK_OTLP_INGESTING_HOST: str
@@ -87,6 +95,9 @@ class ConfigProtocol(Protocol):
     @property
     def ADMIN_DB_URL(self) -> str: ...
 
+    @property
+    def ADMIN_ASYNC_DB_URL(self) -> str: ...
+
     @property
     def SQLALCHEMY_DB_URL(self) -> str: ...
 
@@ -147,6 +158,22 @@ class Config:
     # Logging Configuration
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO").upper()
 
+    # Time-series result cache store: "memory" (per-process LRU) or "postgres" (shared by all nodes)
+    TIME_SERIES_CACHE_BACKEND: str = os.getenv("TIME_SERIES_CACHE_BACKEND", "memory")
+    # Planner-estimated row count above which time-series responses suggest ``approximate``
+    TIME_SERIES_APPROXIMATE_THRESHOLD: int = int(os.getenv("TIME_SERIES_APPROXIMATE_THRESHOLD", "1000000"))
+
+    # Default dashboard prewarming (app/dashboard/tasks.py): widgets rendered at once, and total time per run
+    DASHBOARD_PREWARM_CONCURRENCY: int = int(os.getenv("DASHBOARD_PREWARM_CONCURRENCY", "4"))
+    DASHBOARD_PREWARM_BUDGET_SECONDS: float = float(os.getenv("DASHBOARD_PREWARM_BUDGET_SECONDS", "900"))
+
+    # Event consumers marked ``outbox=True``: "inline" (in the request) or "outbox" (worker, after commit)
+    EVENT_DISPATCH_MODE: str = os.getenv("EVENT_DISPATCH_MODE", "inline")
+    # Consecutive UPDATED events by one actor on one object within this many seconds merge into one (0 disables)
+    EVENT_COALESCE_SECONDS: float = float(os.getenv("EVENT_COALESCE_SECONDS", "10"))
+    # Months of events kept in Postgres before their partition is archived to object storage
+    EVENT_RETENTION_MONTHS: int = int(os.getenv("EVENT_RETENTION_MONTHS", "12"))
+
     # OpenTelemetry Configuration
     BETTERSTACK_OTLP_INGESTING_HOST: str = os.getenv("BETTERSTACK_OTLP_INGESTING_HOST", "")
     BETTERSTACK_OTLP_SOURCE_TOKEN: str = os.getenv("BETTERSTACK_OTLP_SOURCE_TOKEN", "")
@@ -216,6 +243,14 @@ class Config:
         admin_password = os.getenv("DB_ADMIN_PASSWORD", "postgres")
         return self._build_database_url(admin_user, admin_password)
 
+    @property
+    def ADMIN_ASYNC_DB_URL(self) -> str:
+        """ADMIN_DB_URL with the +psycopg driver, for async work that needs the admin role.
+
+        Used by the worker for event partition maintenance (app/events/partitions.py).
+        """
+        return make_url(self.ADMIN_DB_URL).set(drivername="postgresql+psycopg").render_as_string(hide_password=False)
+
     @property
     def SQLALCHEMY_DB_URL(self) -> str:
         """SQLAlchemy async database URL for application runtime (arive user with RLS enforced).
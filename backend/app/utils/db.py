@@ -1,24 +1,31 @@
 """Database utility functions for common operations."""
 
 import logging
+from collections.abc import AsyncGenerator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from typing import Any
 
 from litestar import Request
 from litestar.exceptions import NotFoundException
 from msgspec import structs
-from sqlalchemy import select, text
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import event, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.auth.enums import ScopeType
 from app.base.models import BaseDBModel
 from app.base.schemas import BaseSchema
 from app.events.enums import EventType
-from app.events.schemas import CreatedEventData, UpdatedEventData, make_field_changes
+from app.events.schemas import CreatedEventData, DeletedEventData, UpdatedEventData, make_field_changes
 from app.events.service import emit_event
 from app.utils.configure import config
+from app.utils.db_filters import soft_delete_filter
 
 logger = logging.getLogger(__name__)
 
+# Opens an RLS-scoped session outside the request transaction: for work that outlives the
+# handler or runs concurrently with it (see provide_stream_session)
+StreamSessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
 
 async def _emit_created_event(
     session: AsyncSession,
@@ -71,6 +78,26 @@ async def _emit_updated_event(
         )
 
 
+async def _emit_deleted_event(
+    session: AsyncSession,
+    obj: BaseDBModel,
+    user_id: int,
+    team_id: int,
+    track_fields: list[str] | None,
+) -> None:
+    """Helper to emit a DELETED event for an object about to be removed."""
+    final_values = {field: getattr(obj, field, None) for field in track_fields or []}
+
+    await emit_event(
+        session=session,
+        event_type=EventType.DELETED,
+        obj=obj,
+        user_id=user_id,
+        team_id=team_id,
+        event_data=DeletedEventData(final_values=final_values),
+    )
+
+
 async def get_or_404[T: BaseDBModel](
     session: AsyncSession,
     model_class: type[T],
@@ -267,9 +294,10 @@ async def set_rls_variables(session: AsyncSession, request: Request) -> None:
     - app.is_system_mode: Set to true for admin/system operations that bypass RLS
 
     Note: Must be called within an active transaction (after begin()).
-    SET LOCAL is transaction-scoped and doesn't support parameter binding.
-    We use f-strings with validated integer IDs, which is safe since PostgreSQL
-    expects numeric literals for SET LOCAL with integer values.
+    SET LOCAL doesn't support parameter binding, so scope ids are set with
+    ``set_config(..., is_local => true)``, its transaction-scoped equivalent. The
+    ids are bound parameters, so every team/campaign shares one cached statement
+    instead of compiling (and caching) a new SQL string per id.
 
     Application-level filters are set via session.info in provide_transaction().
     """
@@ -298,15 +326,76 @@ async def set_rls_variables(session: AsyncSession, request: Request) -> None:
     if scope_type == ScopeType.TEAM.value:
         team_id = request.session.get("team_id")
         if team_id:
-            await session.execute(text(f"SET LOCAL app.team_id = {team_id}"))
+            await session.execute(text("SELECT set_config('app.team_id', :team_id, true)"), {"team_id": str(team_id)})
         else:
             raise ValueError("scope_type is TEAM but no team_id in session")
 
     elif scope_type == ScopeType.CAMPAIGN.value:
         campaign_id = request.session.get("campaign_id")
         if campaign_id:
-            await session.execute(text(f"SET LOCAL app.campaign_id = {campaign_id}"))
+            await session.execute(
+                text("SELECT set_config('app.campaign_id', :campaign_id, true)"), {"campaign_id": str(campaign_id)}
+            )
         else:
             raise ValueError("scope_type is CAMPAIGN but no campaign_id in session")
     else:
         raise ValueError(f"Invalid scope_type in session: {scope_type}")
+
+
+def team_session_factory(session_maker: async_sessionmaker[AsyncSession], team_id: int) -> StreamSessionFactory:
+    """Open transactions that RLS scopes to ``team_id``, from a system-mode session maker.
+
+    Background workers connect in system mode; this turns it off for each
+    transaction and sets ``app.team_id``, so queries see exactly what a
+    team-scoped request would.
+    """
+
+    @asynccontextmanager
+    async def team_session() -> AsyncGenerator[AsyncSession]:
+        async with session_maker() as session, session.begin():
+            event.listen(session.sync_session, "do_orm_execute", soft_delete_filter)
+            await session.execute(text("SELECT set_config('app.is_system_mode', 'false', true)"))
+            await session.execute(text("SELECT set_config('app.team_id', :team_id, true)"), {"team_id": str(team_id)})
+            yield session
+
+    return team_session
+
+
+async def delete_model(
+    session: AsyncSession,
+    model_instance: BaseDBModel,
+    user_id: int,
+    team_id: int | None,
+    soft: bool = False,
+    should_track: bool = True,
+    track_fields: list[str] | None = None,
+) -> None:
+    """Delete a model instance, with optional event tracking.
+
+    Args:
+        session: Database session
+        model_instance: The object to delete
+        user_id: User who is deleting the object
+        team_id: Team ID for the event (skipped when None)
+        soft: Set deleted_at instead of removing the row
+        should_track: Whether to emit a DELETED event (default: True)
+        track_fields: Optional list of field names to record in event data
+    """
+    # Emit before deleting so the event still references a live row
+    if should_track and team_id is not None:
+        try:
+            await _emit_deleted_event(
+                session=session,
+                obj=model_instance,
+                user_id=user_id,
+                team_id=team_id,
+                track_fields=track_fields,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to emit DELETED event: {e}")
+
+    if soft:
+        model_instance.soft_delete()
+        await session.flush()
+    else:
+        await session.delete(model_instance)
@@ -0,0 +1,57 @@
+"""SQLAlchemy compiled-statement cache metrics.
+
+SQLAlchemy caches each statement's compiled SQL keyed by its structure, not
+its bound values, so a list or time-series query with the same columns,
+operations and sorts compiles once per process. Statements whose SQL text
+embeds values (``text(f"...")``, ``literal_binds``) miss every time and crowd
+useful entries out of the engine's LRU (``query_cache_size``).
+
+``instrument_statement_cache`` records the cache outcome of every executed
+statement as the ``db.client.statement_cache`` OpenTelemetry counter
+(attribute ``cache.result``), and keeps in-process totals for tests and
+benchmarks (``statement_cache_stats``).
+"""
+
+from collections import Counter
+
+from opentelemetry import metrics
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.interfaces import CacheStats
+
+meter = metrics.get_meter(__name__)
+
+_cache_counter = meter.create_counter(
+    "db.client.statement_cache",
+    unit="{statement}",
+    description="Executed statements by compiled-cache outcome",
+)
+
+_RESULTS = {
+    CacheStats.CACHE_HIT: "hit",
+    CacheStats.CACHE_MISS: "miss",
+    CacheStats.CACHING_DISABLED: "disabled",
+    CacheStats.NO_CACHE_KEY: "no_key",
+    CacheStats.NO_DIALECT_SUPPORT: "unsupported",
+}
+
+_stats: Counter[str] = Counter()
+
+
+def _record_cache_result(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is None:
+        return
+    result = _RESULTS.get(context.cache_hit, "unknown")
+    _stats[result] += 1
+    _cache_counter.add(1, {"cache.result": result})
+
+
+def instrument_statement_cache() -> None:
+    """Count compiled-cache hits/misses for every engine in the process (idempotent)."""
+    if not event.contains(Engine, "after_cursor_execute", _record_cache_result):
+        event.listen(Engine, "after_cursor_execute", _record_cache_result)
+
+
+def statement_cache_stats() -> dict[str, int]:
+    """In-process totals of executed statements by cache outcome since startup."""
+    return dict(_stats)
@@ -1,11 +1,13 @@
 import logging
 from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 
 import aiohttp
 from litestar import Litestar, Request
 from litestar.datastructures import State
 from litestar.exceptions import ClientException
 from litestar.status_codes import HTTP_409_CONFLICT
+from litestar.stores.base import Store
 from sqlalchemy import event
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
@@ -15,11 +17,13 @@ from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.client.s3_client import S3Dep
 from app.emails.client import BaseEmailClient
 from app.emails.service import EmailService
+from app.events.service import buffered_events
 from app.objects.base import ObjectRegistry
+from app.objects.cache import LRUMemoryStore, PostgresResultStore
 from app.sessions.store import PostgreSQLSessionStore
 from app.threads.services import ThreadViewerStore
 from app.utils.configure import ConfigProtocol, config
-from app.utils.db import set_rls_variables
+from app.utils.db import StreamSessionFactory, set_rls_variables
 from app.utils.db_filters import soft_delete_filter
 
 logger = logging.getLogger(__name__)
@@ -30,24 +34,35 @@ def provide_viewer_store(request: Request) -> ThreadViewerStore:
     return ThreadViewerStore(store=request.app.stores.get("viewers"))
 
 
-async def provide_transaction(db_session: AsyncSession, request: Request) -> AsyncGenerator[AsyncSession]:
-    """Provide a database transaction with PostgreSQL RLS for multi-tenant isolation.
+def provide_time_series_cache(request: Request) -> Store:
+    """Provide the time-series result cache store (see app/objects/cache.py)."""
+    return request.app.stores.get("time_series")
 
-    Security is enforced via PostgreSQL Row-Level Security (RLS) policies at the database level.
-    This provides strong isolation guarantees that cannot be bypassed at the application layer.
-    """
 
-    def _raiseload_listener(execute_state):
-        execute_state.statement = execute_state.statement.options(raiseload("*"))
+def _raiseload_listener(execute_state):
+    execute_state.statement = execute_state.statement.options(raiseload("*"))
+
 
+def _attach_session_listeners(db_session: AsyncSession) -> None:
     # Attach event listeners once per session
     if not db_session.sync_session.info.get("_listeners_attached"):
         event.listen(db_session.sync_session, "do_orm_execute", soft_delete_filter)
         event.listen(db_session.sync_session, "do_orm_execute", _raiseload_listener)
         db_session.sync_session.info["_listeners_attached"] = True
 
+
+async def provide_transaction(db_session: AsyncSession, request: Request) -> AsyncGenerator[AsyncSession]:
+    """Provide a database transaction with PostgreSQL RLS for multi-tenant isolation.
+
+    Security is enforced via PostgreSQL Row-Level Security (RLS) policies at the database level.
+    This provides strong isolation guarantees that cannot be bypassed at the application layer.
+
+    Events emitted during the request are buffered and written together just before commit.
+    """
+    _attach_session_listeners(db_session)
+
     try:
-        async with db_session.begin():
+        async with db_session.begin(), buffered_events(db_session):
             await set_rls_variables(db_session, request)
             yield db_session
 
@@ -55,6 +70,27 @@ async def provide_transaction(db_session: AsyncSession, request: Request) -> Asy
         raise ClientException(status_code=HTTP_409_CONFLICT, detail=str(exc)) from exc
 
 
+def provide_stream_session(state: State, request: Request) -> StreamSessionFactory:
+    """Provide a factory for RLS-scoped transactions that outlive the route handler.
+
+    Litestar cleans up dependencies (committing ``transaction``, closing ``db_session``)
+    before a streamed response body is sent, so streaming responses open their own
+    session from the SQLAlchemy plugin's session maker while they iterate. Dashboard
+    rendering uses the same factory to run widget queries concurrently, one
+    connection each.
+    """
+    session_maker: async_sessionmaker[AsyncSession] = state["session_maker_class"]
+
+    @asynccontextmanager
+    async def stream_session() -> AsyncGenerator[AsyncSession]:
+        async with session_maker() as session, session.begin():
+            _attach_session_listeners(session)
+            await set_rls_variables(session, request)
+            yield session
+
+    return stream_session
+
+
 async def on_startup(app: Litestar) -> None:
     logger.info(
         "Arive API starting (env=%s, debug=%s)",
@@ -104,6 +140,28 @@ def create_postgres_session_store() -> PostgreSQLSessionStore:
     return PostgreSQLSessionStore(session_factory)
 
 
+def create_time_series_cache_store(config: ConfigProtocol) -> Store:
+    """Provide the time-series result cache: an in-process LRU, or a table shared by every node."""
+    match config.TIME_SERIES_CACHE_BACKEND:
+        case "memory":
+            return LRUMemoryStore()
+        case "postgres":
+            engine = create_async_engine(
+                config.ASYNC_DATABASE_URL,
+                poolclass=AsyncAdaptedQueuePool,
+                pool_size=0,  # Zero persistent connections for Aurora scale-to-zero
+                max_overflow=5,
+                pool_timeout=10,
+                connect_args={
+                    "connect_timeout": 10,
+                    "application_name": "manageros-result-cache",
+                },
+            )
+            return PostgresResultStore(async_sessionmaker(engine, expire_on_commit=False, autoflush=False))
+        case backend:
+            raise ValueError(f"Unknown TIME_SERIES_CACHE_BACKEND: {backend}")
+
+
 def provide_object_registry(s3_client: S3Dep, config: ConfigProtocol) -> ObjectRegistry:
     """Provide the ObjectRegistry singleton with dependencies."""
     return ObjectRegistry(s3_client=s3_client, config=config)
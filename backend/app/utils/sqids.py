@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 import sqids as _sqids
@@ -26,8 +27,9 @@ def sqid_decode(value: str) -> int:
     return decoded[0]
 
 
+@lru_cache(maxsize=65_536)
 def sqid_encode(value: int) -> str:
-    """Encode integer ID to SQID string."""
+    """Encode integer ID to SQID string (memoized; encoding is pure Python and hot in list rendering)."""
     return sqid_encoder.encode([value])
 
 
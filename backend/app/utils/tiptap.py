@@ -76,3 +76,24 @@ def text_to_tiptap(plain_text: str) -> dict[str, Any]:
         paragraphs = [paragraph(text(""))]
 
     return doc(*paragraphs)
+
+
+def tiptap_to_text(document: dict[str, Any]) -> str:
+    """
+    Convert a TipTap document to plain text.
+
+    Block nodes (paragraphs, headings, list items) become separate lines; marks are dropped.
+
+    Args:
+        document: TipTap document or node
+
+    Returns:
+        Plain text string
+    """
+    if document.get("type") == "text":
+        return document.get("text", "")
+
+    children = [tiptap_to_text(node) for node in document.get("content", [])]
+    if any(node.get("type") != "text" for node in document.get("content", [])):
+        return "\n".join(child for child in children if child)
+    return "".join(children)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Microbenchmark event consumer dispatch: per-event signature inspection vs the compiled index.
+
+Resolves consumers and builds their arguments for in-memory events on each
+threadable model, for the four event types the thread consumers
+(app/events/consumers.py) handle. The cache, count and rollup consumers are
+registered too, as in the app. Consumers aren't called, so this measures
+dispatch overhead only. The "legacy" path reproduces the previous
+``trigger_consumers``: a linear ``model_filters`` scan and an
+``inspect.signature`` call per consumer per event.
+
+No database is needed.
+
+Usage:
+    python scripts/benchmark_event_dispatch.py [--events 1000] [--runs 200]
+"""
+
+import argparse
+import inspect
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.utils.discovery import discover_and_import
+
+discover_and_import(["models.py", "models/**/*.py"], base_path="app")
+
+import app.events.consumers  # noqa: E402, F401
+import app.objects.cache  # noqa: E402, F401
+import app.objects.counts  # noqa: E402, F401
+import app.objects.rollups  # noqa: E402, F401
+from app.events.consumers import THREADABLE_MODELS  # noqa: E402
+from app.events.enums import EventType  # noqa: E402
+from app.events.models import Event  # noqa: E402
+from app.events.registry import _registry  # noqa: E402
+
+EVENT_TYPES = [EventType.CREATED, EventType.UPDATED, EventType.DELETED, EventType.STATE_CHANGED]
+
+
+def build_events(count: int) -> list[tuple[Event, object]]:
+    events = []
+    for i in range(count):
+        model = THREADABLE_MODELS[i % len(THREADABLE_MODELS)]
+        event = Event(
+            id=i,
+            actor_id=1,
+            object_type=model.__tablename__,
+            object_id=i,
+            event_type=EVENT_TYPES[i % len(EVENT_TYPES)],
+            event_data=None,
+            team_id=1,
+        )
+        events.append((event, model(id=i)))
+    return events
+
+
+def legacy_dispatch(event: Event, obj: object, dependencies: dict) -> list[tuple[Callable, dict]]:
+    """The pre-compilation ``get_consumers`` + ``trigger_consumers`` argument filtering."""
+    calls = []
+    for reg in _registry._registry.get(event.event_type, []):
+        if reg.model_filters is not None and not any(
+            event.object_type == model.__tablename__ for model in reg.model_filters
+        ):
+            continue
+        params = inspect.signature(reg.consumer).parameters
+        candidate_args = {"session": None, "event": event, "obj": obj, **dependencies}
+        calls.append((reg.consumer, {name: val for name, val in candidate_args.items() if name in params}))
+    return calls
+
+
+def compiled_dispatch(event: Event, obj: object, dependencies: dict) -> list[tuple[Callable, dict]]:
+    values = {"session": None, "event": event, "obj": obj, "events": [event], "objs": [obj]}
+    return [(reg.consumer, reg.adapt_arguments(values, dependencies)) for reg in _registry.get_registrations(event)]
+
+
+def median_ms(fn: Callable[[], object], runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main(count: int, runs: int) -> None:
+    events = build_events(count)
+    dependencies = {"channels": object()}
+
+    # Batch consumers take events/objs lists, so only the resolved consumers are comparable
+    for event, obj in events:
+        legacy = [consumer for consumer, _ in legacy_dispatch(event, obj, dependencies)]
+        assert legacy == [consumer for consumer, _ in compiled_dispatch(event, obj, dependencies)]
+
+    results = {
+        "legacy": median_ms(lambda: [legacy_dispatch(e, o, dependencies) for e, o in events], runs),
+        "compiled": median_ms(lambda: [compiled_dispatch(e, o, dependencies) for e, o in events], runs),
+    }
+
+    consumers = sum(len(_registry.get_registrations(event)) for event, _ in events) / count
+    print(f"{count} events, {consumers:.1f} consumers/event, median of {runs} runs\n")
+    print(f"{'path':>10} {'ms/batch':>10} {'us/event':>10}")
+    for name, ms in results.items():
+        print(f"{name:>10} {ms:>10.3f} {ms * 1000 / count:>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=1000)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+    main(args.events, args.runs)
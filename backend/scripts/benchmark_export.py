@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Measure the streaming object export per format at different table sizes.
+
+Seeds a throwaway team with deliverables inside a transaction that is rolled
+back at the end, then drains ``stream_export`` in each format for growing
+row counts and reports wall time, bytes produced and the ``tracemalloc``
+peak. With the server-side cursor the peak should stay flat as the row count
+grows. Arrow and Parquet need pyarrow installed.
+
+Usage:
+    python scripts/benchmark_export.py [--rows 10000 50000] [--formats csv ndjson arrow parquet]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import tracemalloc
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.utils.discovery import discover_and_import
+
+discover_and_import(["models.py", "models/**/*.py"], base_path="app")
+discover_and_import(["actions.py", "actions/**/*.py"], base_path="app")
+
+from app.deliverables.objects import DeliverableObject  # noqa: E402
+from app.objects.enums import ExportFormat  # noqa: E402
+from app.objects.export import resolve_export_columns, stream_export  # noqa: E402
+from app.objects.schemas import ObjectListRequest  # noqa: E402
+from app.utils.configure import config  # noqa: E402
+
+
+async def seed(session: AsyncSession, rows: int) -> None:
+    team_id = (
+        await session.execute(text("INSERT INTO teams (name) VALUES ('Export Benchmark') RETURNING id"))
+    ).scalar_one()
+    await session.execute(
+        text("""
+            INSERT INTO deliverables (
+                title, content, platforms, count, posting_date, approval_required, state, team_id,
+                created_at, updated_at
+            )
+            SELECT
+                'Deliverable ' || g,
+                repeat('Caption text ', 20),
+                'INSTAGRAM',
+                1,
+                now() - (g || ' minutes')::interval,
+                TRUE,
+                'DRAFT',
+                :team_id,
+                now() - (g || ' minutes')::interval,
+                now()
+            FROM generate_series(1, :rows) AS g
+        """),
+        {"team_id": team_id, "rows": rows},
+    )
+    await session.execute(text("ANALYZE deliverables"))
+    await session.execute(text(f"SET LOCAL app.team_id = '{team_id}'"))
+
+
+async def main(row_counts: list[int], formats: list[ExportFormat]) -> None:
+    engine = create_async_engine(config.ASYNC_DATABASE_URL)
+    request = ObjectListRequest()
+    columns = resolve_export_columns(DeliverableObject, request)
+
+    print(f"{'format':>8} {'rows':>8} {'seconds':>9} {'MiB out':>9} {'peak MiB':>9}")
+    for rows in row_counts:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            async with session.begin() as transaction:
+                await seed(session, rows)
+
+                @asynccontextmanager
+                async def stream_session():
+                    yield session
+
+                for export_format in formats:
+                    tracemalloc.start()
+                    start = time.perf_counter()
+                    size = 0
+                    body = stream_export(stream_session, DeliverableObject, request, columns, export_format)
+                    async for chunk in body:
+                        size += len(chunk)
+                    elapsed = time.perf_counter() - start
+                    _, peak = tracemalloc.get_traced_memory()
+                    tracemalloc.stop()
+                    print(f"{export_format:>8} {rows:>8} {elapsed:>9.2f} {size / 2**20:>9.1f} {peak / 2**20:>9.1f}")
+
+                await transaction.rollback()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 50_000])
+    parser.add_argument("--formats", type=ExportFormat, nargs="+", default=list(ExportFormat))
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.formats))
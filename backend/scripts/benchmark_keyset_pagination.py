@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Benchmark offset vs keyset (cursor) pagination on the deliverables list.
+
+Seeds a throwaway team with deliverables inside a transaction that is rolled
+back at the end, then times the list page query at increasing page depths.
+Offset latency grows with depth; keyset latency should stay flat.
+
+Usage:
+    python scripts/benchmark_keyset_pagination.py [--rows 60000] [--limit 50] [--runs 5]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import msgspec
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.utils.discovery import discover_and_import
+
+discover_and_import(["models.py", "models/**/*.py"], base_path="app")
+
+from app.deliverables.objects import DeliverableObject  # noqa: E402
+from app.objects.pagination import encode_cursor, resolve_sort_keys  # noqa: E402
+from app.objects.schemas import ObjectListRequest  # noqa: E402
+from app.utils.configure import config  # noqa: E402
+
+PAGES = [1, 10, 100, 500, 1000]
+
+
+async def seed(session: AsyncSession, rows: int) -> int:
+    team_id = (
+        await session.execute(text("INSERT INTO teams (name) VALUES ('Keyset Benchmark') RETURNING id"))
+    ).scalar_one()
+    await session.execute(
+        text("""
+            INSERT INTO deliverables (
+                title, platforms, count, posting_date, approval_required, state, team_id, created_at, updated_at
+            )
+            SELECT
+                'Deliverable ' || g,
+                (ARRAY['INSTAGRAM', 'TIKTOK', 'YOUTUBE', 'FACEBOOK'])[1 + g % 4],
+                1,
+                now() - (g || ' minutes')::interval,
+                TRUE,
+                (ARRAY['DRAFT', 'IN_REVIEW', 'APPROVED', 'POSTED'])[1 + g % 4],
+                :team_id,
+                -- Coarse timestamps so many rows share created_at and the id tiebreaker matters
+                date_trunc('hour', now() - (g || ' minutes')::interval),
+                now()
+            FROM generate_series(1, :rows) AS g
+        """),
+        {"team_id": team_id, "rows": rows},
+    )
+    await session.execute(text("ANALYZE deliverables"))
+    await session.execute(text(f"SET LOCAL app.team_id = '{team_id}'"))
+    return team_id
+
+
+async def time_query(session: AsyncSession, request: ObjectListRequest, offset: int, runs: int) -> float:
+    """Median milliseconds for fetching one page."""
+    samples = []
+    for _ in range(runs):
+        query = await DeliverableObject.query_from_request(session, request)
+        if not request.cursor:
+            query = query.offset(offset)
+        query = query.limit(request.limit)
+
+        start = time.perf_counter()
+        result = await session.execute(query)
+        result.unique().scalars().all()
+        samples.append((time.perf_counter() - start) * 1000)
+        session.expunge_all()
+    return statistics.median(samples)
+
+
+async def cursor_for_page(session: AsyncSession, request: ObjectListRequest, page: int) -> str | None:
+    """Cursor pointing at the last row of the previous page."""
+    if page == 1:
+        return None
+    query = await DeliverableObject.query_from_request(session, request)
+    result = await session.execute(query.offset((page - 1) * request.limit - 1).limit(1))
+    obj = result.unique().scalar_one()
+    return encode_cursor(resolve_sort_keys(DeliverableObject.model(), request), obj)
+
+
+async def main(rows: int, limit: int, runs: int) -> None:
+    engine = create_async_engine(config.ASYNC_DATABASE_URL)
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        async with session.begin() as transaction:
+            print(f"Seeding {rows:,} deliverables...")
+            await seed(session, rows)
+
+            request = ObjectListRequest(limit=limit)
+            print(f"\n{'page':>6} {'offset ms':>12} {'keyset ms':>12}")
+            for page in PAGES:
+                if (page - 1) * limit >= rows:
+                    break
+                offset_ms = await time_query(session, request, (page - 1) * limit, runs)
+                cursor = await cursor_for_page(session, request, page)
+                keyset_ms = await time_query(session, msgspec.structs.replace(request, cursor=cursor), 0, runs)
+                print(f"{page:>6} {offset_ms:>12.2f} {keyset_ms:>12.2f}")
+
+            await transaction.rollback()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=60_000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.limit, args.runs))
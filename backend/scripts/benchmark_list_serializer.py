@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Microbenchmark list-row serialization: per-row column walk vs the compiled serializer.
+
+Builds a page of in-memory deliverables (with campaign and owner loaded, as
+a list request would) and times rendering it to ``ObjectListSchema`` rows and
+to JSON bytes. The "legacy" path reproduces the previous
+``BaseObject.to_list_schema`` loop, including un-memoized sqid encoding;
+"compiled (cold)" clears the sqid memo before every run.
+
+No database is needed.
+
+Usage:
+    python scripts/benchmark_list_serializer.py [--rows 200] [--runs 200]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import msgspec
+
+from app.utils.discovery import discover_and_import
+
+discover_and_import(["models.py", "models/**/*.py"], base_path="app")
+discover_and_import(["actions.py", "actions/**/*.py"], base_path="app")
+
+from app.actions.registry import ActionRegistry  # noqa: E402
+from app.campaigns.models import Campaign  # noqa: E402
+from app.deliverables.enums import DeliverableStates, SocialMediaPlatforms  # noqa: E402
+from app.deliverables.models import Deliverable  # noqa: E402
+from app.deliverables.objects import DeliverableObject  # noqa: E402
+from app.objects.schemas import ObjectFieldDTO, ObjectListRequest, ObjectListSchema  # noqa: E402
+from app.roster.models import Roster  # noqa: E402
+from app.utils import sqids  # noqa: E402
+from app.utils.configure import config  # noqa: E402
+
+encoder = msgspec.json.Encoder()
+
+
+def build_page(rows: int) -> list[Deliverable]:
+    now = datetime.now(tz=UTC)
+    owner = Roster(id=7, name="Jordan Lee")
+    campaign = Campaign(id=42, name="Spring Launch", assigned_roster=owner)
+    return [
+        Deliverable(
+            id=1000 + i,
+            title=f"Deliverable {i}",
+            content="Caption text " * 20,
+            platforms=SocialMediaPlatforms.INSTAGRAM,
+            state=DeliverableStates.DRAFT,
+            posting_date=now,
+            created_at=now,
+            updated_at=now,
+            campaign=campaign,
+        )
+        for i in range(rows)
+    ]
+
+
+def legacy_to_list_schema(obj: Deliverable, columns) -> ObjectListSchema:
+    """The pre-compilation ``BaseObject.to_list_schema`` body."""
+    cls = DeliverableObject
+    fields = []
+    for col_def in columns:
+        if not col_def.include_in_list:
+            continue
+        fields.append(
+            ObjectFieldDTO(key=col_def.key, value=col_def.value(obj), label=col_def.label, editable=col_def.editable)
+        )
+    actions = []
+    if cls.action_group:
+        actions = ActionRegistry().get_class(cls.action_group).get_available_actions(obj=obj)
+    object_id = sqids.sqid_encode.__wrapped__(obj.id)
+    return ObjectListSchema(
+        id=object_id,
+        object_type=cls.object_type,
+        title=cls.title_field(obj),
+        subtitle=cls.subtitle_field(obj),
+        state=getattr(obj, "state", None),
+        created_at=obj.created_at,
+        updated_at=obj.updated_at,
+        actions=actions,
+        fields=fields,
+        link=f"/{cls.object_type}/{object_id}",
+    )
+
+
+def median_ms(fn: Callable[[], object], runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main(rows: int, runs: int) -> None:
+    # Availability checks only read the object, but ActionDeps needs every field
+    action_registry = ActionRegistry(
+        user=1,
+        team_id=1,
+        campaign_id=None,
+        request=None,
+        transaction=None,
+        s3_client=None,
+        task_queues=None,
+        channels=None,
+        config=config,
+        email_service=None,
+    )
+    page = build_page(rows)
+    columns = DeliverableObject.get_list_columns(ObjectListRequest())
+    serializer = DeliverableObject.list_serializer(columns)
+
+    def legacy_schemas():
+        return [legacy_to_list_schema(obj, columns) for obj in page]
+
+    def legacy_bytes():
+        return encoder.encode(legacy_schemas())
+
+    def compiled_bytes():
+        return serializer.encode(page, action_registry)
+
+    assert legacy_bytes() == compiled_bytes()
+
+    results = {
+        "legacy schemas": median_ms(legacy_schemas, runs),
+        "compiled schemas": median_ms(lambda: serializer.serialize(page, action_registry), runs),
+        "compiled (cold)": median_ms(
+            lambda: (sqids.sqid_encode.cache_clear(), serializer.serialize(page, action_registry)), runs
+        ),
+        "legacy bytes": median_ms(legacy_bytes, runs),
+        "compiled bytes": median_ms(compiled_bytes, runs),
+    }
+
+    print(f"{rows} rows x {len(columns)} columns, median of {runs} runs\n")
+    print(f"{'path':>18} {'ms/page':>10} {'us/row':>10}")
+    for name, ms in results.items():
+        print(f"{name:>18} {ms:>10.3f} {ms * 1000 / rows:>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+    main(args.rows, args.runs)
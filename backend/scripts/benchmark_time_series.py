@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Compare the raw time-series query with and without a separate count statement.
+
+Seeds a throwaway team with deliverables spread over two years, inside a
+transaction that is rolled back at the end, then times
+``query_time_series_data`` (one statement; the total is a window sum over
+the bucket counts) against the previous shape, which first ran
+``SELECT count(*)`` over the same filtered rows and then aggregated them.
+Both paths get a filter so the rollups don't apply.
+
+Usage:
+    python scripts/benchmark_time_series.py [--rows 100000 500000] [--runs 10]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.utils.discovery import discover_and_import
+
+discover_and_import(["models.py", "models/**/*.py"], base_path="app")
+
+from app.deliverables.models import Deliverable  # noqa: E402
+from app.objects.enums import AggregationType, FieldType, Granularity  # noqa: E402
+from app.objects.schemas import RangeFilterDefinition  # noqa: E402
+from app.objects.services import apply_filter, query_time_series_data  # noqa: E402
+from app.utils.configure import config  # noqa: E402
+
+# Matches every seeded row, but forces the raw path
+FILTERS = [RangeFilterDefinition(column="count", start=1)]
+
+CASES = [
+    ("platforms", FieldType.Enum, AggregationType.count_, Granularity.week),
+    ("count", FieldType.Int, AggregationType.sum, Granularity.day),
+]
+
+
+async def seed(session: AsyncSession, rows: int) -> None:
+    team_id = (
+        await session.execute(text("INSERT INTO teams (name) VALUES ('Time Series Benchmark') RETURNING id"))
+    ).scalar_one()
+    await session.execute(
+        text("""
+            INSERT INTO deliverables (
+                title, platforms, count, posting_date, approval_required, state, team_id, created_at, updated_at
+            )
+            SELECT
+                'Deliverable ' || g,
+                (ARRAY['INSTAGRAM', 'TIKTOK', 'YOUTUBE', 'FACEBOOK'])[1 + g % 4],
+                1 + g % 3,
+                now(),
+                TRUE,
+                'DRAFT',
+                :team_id,
+                now() - (g * interval '730 days') / :rows,
+                now()
+            FROM generate_series(1, :rows) AS g
+        """),
+        {"team_id": team_id, "rows": rows},
+    )
+    await session.execute(text("ANALYZE deliverables"))
+    await session.execute(text(f"SET LOCAL app.team_id = '{team_id}'"))
+
+
+async def separate_count(session: AsyncSession, start: datetime, end: datetime) -> int:
+    """The count statement the previous implementation ran before aggregating."""
+    query = select(Deliverable)
+    for filter_def in FILTERS:
+        query = apply_filter(query, Deliverable, filter_def)
+    query = query.where(Deliverable.created_at >= start, Deliverable.created_at <= end)
+    return (await session.execute(select(func.count()).select_from(query.subquery()))).scalar_one()
+
+
+async def median_ms(fn, runs: int) -> float:
+    await fn()  # warm the plan and the buffer cache
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+async def main(row_counts: list[int], runs: int) -> None:
+    engine = create_async_engine(config.ASYNC_DATABASE_URL)
+    end = datetime.now(tz=UTC)
+    start = end - timedelta(days=730)
+
+    print(f"{'case':>26} {'rows':>8} {'two-pass ms':>12} {'single ms':>10} {'speedup':>8}")
+    for rows in row_counts:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            async with session.begin() as transaction:
+                await seed(session, rows)
+
+                for field, field_type, aggregation, granularity in CASES:
+
+                    async def single_pass():
+                        return await query_time_series_data(
+                            session, Deliverable, field, field_type, start, end, granularity, aggregation, FILTERS
+                        )
+
+                    async def two_pass():
+                        await separate_count(session, start, end)
+                        return await single_pass()
+
+                    _points, total = await single_pass()
+                    assert total == await separate_count(session, start, end)
+
+                    two_pass_ms = await median_ms(two_pass, runs)
+                    single_ms = await median_ms(single_pass, runs)
+                    case = f"{field} {aggregation} by {granularity}"
+                    print(
+                        f"{case:>26} {rows:>8} {two_pass_ms:>12.1f} {single_ms:>10.1f} {two_pass_ms / single_ms:>7.2f}x"
+                    )
+
+                await transaction.rollback()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 500_000])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.runs))
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Benchmark single-query vs two-phase (page ids, then hydrate) list execution.
+
+Seeds a throwaway team with deliverables, each linked to a few media rows,
+inside a transaction that is rolled back at the end. Then fetches random list
+pages through ``DeliverableObject.get_list`` in both execution modes and
+reports p50/p95 latency. Totals are disabled so only the page fetch is timed.
+
+Usage:
+    python scripts/benchmark_two_phase_list.py [--rows 50000] [--media-per-row 3] [--limit 50] [--samples 200]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.utils.discovery import discover_and_import
+
+discover_and_import(["models.py", "models/**/*.py"], base_path="app")
+
+from app.deliverables.objects import DeliverableObject  # noqa: E402
+from app.objects.enums import CountStrategy, ListExecution  # noqa: E402
+from app.objects.schemas import ObjectListRequest  # noqa: E402
+from app.utils.configure import config  # noqa: E402
+
+
+async def seed(session: AsyncSession, rows: int, media_per_row: int) -> int:
+    team_id = (
+        await session.execute(text("INSERT INTO teams (name) VALUES ('Two-phase Benchmark') RETURNING id"))
+    ).scalar_one()
+    await session.execute(
+        text("""
+            INSERT INTO deliverables (
+                title, content, platforms, count, posting_date, approval_required, state, team_id,
+                created_at, updated_at
+            )
+            SELECT
+                'Deliverable ' || g,
+                repeat('Caption text ', 20),
+                (ARRAY['INSTAGRAM', 'TIKTOK', 'YOUTUBE', 'FACEBOOK'])[1 + g % 4],
+                1,
+                now() - (g || ' minutes')::interval,
+                TRUE,
+                (ARRAY['DRAFT', 'IN_REVIEW', 'APPROVED', 'POSTED'])[1 + g % 4],
+                :team_id,
+                now() - (g || ' minutes')::interval,
+                now()
+            FROM generate_series(1, :rows) AS g
+        """),
+        {"team_id": team_id, "rows": rows},
+    )
+    await session.execute(
+        text("""
+            WITH new_media AS (
+                INSERT INTO media (file_key, file_name, file_type, file_size, mime_type, team_id)
+                SELECT 'bench/' || :team_id || '/' || g, 'photo_' || g || '.jpg', 'image', 1024, 'image/jpeg', :team_id
+                FROM generate_series(1, :rows * :media_per_row) AS g
+                RETURNING id
+            ),
+            numbered_media AS (
+                SELECT id, row_number() OVER (ORDER BY id) - 1 AS n FROM new_media
+            ),
+            numbered_deliverables AS (
+                SELECT id, row_number() OVER (ORDER BY id) - 1 AS n FROM deliverables WHERE team_id = :team_id
+            )
+            INSERT INTO deliverable_media (deliverable_id, media_id, team_id)
+            SELECT d.id, m.id, :team_id
+            FROM numbered_media m
+            JOIN numbered_deliverables d ON d.n = m.n / :media_per_row
+        """),
+        {"team_id": team_id, "rows": rows, "media_per_row": media_per_row},
+    )
+    for table in ("deliverables", "media", "deliverable_media"):
+        await session.execute(text(f"ANALYZE {table}"))
+    await session.execute(text(f"SET LOCAL app.team_id = '{team_id}'"))
+    return team_id
+
+
+async def time_pages(session: AsyncSession, team_id: int, offsets: list[int], limit: int) -> list[float]:
+    """Milliseconds for each ``get_list`` call, one per offset."""
+    samples = []
+    for offset in offsets:
+        request = ObjectListRequest(limit=limit, offset=offset)
+        start = time.perf_counter()
+        await DeliverableObject.get_list(session, request, team_id=team_id)
+        samples.append((time.perf_counter() - start) * 1000)
+        session.expunge_all()
+    return samples
+
+
+def percentile(samples: list[float], pct: int) -> float:
+    return statistics.quantiles(samples, n=100)[pct - 1]
+
+
+async def main(rows: int, media_per_row: int, limit: int, samples: int) -> None:
+    engine = create_async_engine(config.ASYNC_DATABASE_URL)
+    DeliverableObject.count_strategy = CountStrategy.none
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        async with session.begin() as transaction:
+            print(f"Seeding {rows:,} deliverables with {media_per_row} media each...")
+            team_id = await seed(session, rows, media_per_row)
+
+            rng = random.Random(0)
+            offsets = [rng.randrange(0, rows // limit) * limit for _ in range(samples)]
+
+            print(f"\n{'mode':>10} {'p50 ms':>10} {'p95 ms':>10}")
+            for execution in (ListExecution.single, ListExecution.two_phase):
+                DeliverableObject.list_execution = execution
+                await time_pages(session, team_id, offsets[:10], limit)  # warm up
+                timings = await time_pages(session, team_id, offsets, limit)
+                print(f"{execution:>10} {percentile(timings, 50):>10.2f} {percentile(timings, 95):>10.2f}")
+
+            await transaction.rollback()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--media-per-row", type=int, default=3)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--samples", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.media_per_row, args.limit, args.samples))
@@ -20,7 +20,7 @@ from app.factory import create_app
 from app.utils.configure import TestConfig
 from app.utils.sqids import sqid_decode
 
-from .dependencies import provide_test_transaction
+from .dependencies import provide_test_stream_session, provide_test_transaction
 
 
 @pytest.fixture
@@ -76,6 +76,7 @@ def test_app(
             "db_session": Provide(provide_shared_db_session, sync_to_thread=False),
             # Use test-specific transaction provider to properly set RLS variables from session
             "transaction": Provide(provide_test_transaction),
+            "stream_session": Provide(provide_test_stream_session, sync_to_thread=False),
             "config": Provide(lambda: test_config, sync_to_thread=False),
             "http_client": Provide(provide_test_http_client, sync_to_thread=False),
             "s3_client": Provide(provide_test_s3_client, sync_to_thread=False),
@@ -203,3 +203,30 @@ async def transaction(db_session: AsyncSession, team) -> AsyncGenerator[AsyncSes
     await db_session.execute(text(f"SET LOCAL app.team_id = {int(team.id)}"))
     await db_session.execute(text("SET LOCAL app.is_system_mode = false"))
     yield db_session
+
+
+@pytest.fixture
+async def admin_session(test_config: TestConfig, setup_database) -> AsyncGenerator[AsyncSession]:
+    """Provide a session as the admin (migration) role, like the worker's ``admin_sessionmaker``.
+
+    For code that needs privileges the application role doesn't have (partition
+    DDL). Runs on its own connection, so rows created in ``db_session`` aren't
+    visible to it; the outer transaction is rolled back like ``db_session``'s.
+    """
+    engine = create_async_engine(test_config.ADMIN_ASYNC_DB_URL, poolclass=NullPool)
+    connection = await engine.connect()
+    transaction = await connection.begin()
+    session = async_sessionmaker(
+        bind=connection,
+        expire_on_commit=False,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )()
+
+    try:
+        yield session
+    finally:
+        await session.close()
+        await transaction.rollback()
+        await connection.close()
+        await engine.dispose()
@@ -1,4 +1,6 @@
+import asyncio
 from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 from pathlib import Path
 from unittest.mock import AsyncMock
 
@@ -9,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.client.s3_client import BaseS3Client
 from app.utils.configure import Config, TestConfig
+from app.utils.db import StreamSessionFactory
 
 # ============================================================================
 # Mock Clients
@@ -105,6 +108,30 @@ async def provide_test_transaction(db_session: AsyncSession, request: "Request")
             pass  # Connection might be closed
 
 
+def provide_test_stream_session(db_session: AsyncSession, request: "Request") -> StreamSessionFactory:
+    """Test stream session provider: streams reuse the shared db_session with the request's RLS context.
+
+    The shared session can't run statements concurrently, so sessions opened at
+    the same time (e.g. dashboard widgets) take turns.
+    """
+    team_id = request.session.get("team_id")
+    lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def stream_session() -> AsyncGenerator[AsyncSession]:
+        async with lock:
+            if team_id:
+                await db_session.execute(text(f"SET LOCAL app.team_id = {team_id}"))
+                await db_session.execute(text("SET LOCAL app.is_system_mode = false"))
+            try:
+                yield db_session
+            finally:
+                if team_id:
+                    await db_session.execute(text("SET LOCAL app.is_system_mode = true"))
+
+    return stream_session
+
+
 def provide_test_config(test_config: TestConfig) -> Config:
     """Dependency provider for test config."""
     return test_config
@@ -0,0 +1,177 @@
+"""Tests for server-side dashboard rendering (/dashboards/{id}/render)."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+
+import msgspec
+from litestar.channels import ChannelsPlugin
+from litestar.channels.backends.memory import MemoryChannelsBackend
+from litestar.testing import AsyncTestClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.dashboard.live import stream_widget_updates
+from app.dashboard.models import Dashboard, Widget
+from app.dashboard.render import prewarm_dashboards, render_widgets
+from app.objects.base import ObjectRegistry
+from app.objects.cache import LRUMemoryStore, table_change_channel
+from app.objects.enums import ObjectTypes
+from app.utils.sqids import sqid_encode
+from tests.factories.brands import BrandFactory
+from tests.factories.users import TeamFactory
+
+WINDOW = {"start_date": "2025-11-01T00:00:00Z", "end_date": "2025-11-30T23:59:59Z", "granularity": "week"}
+
+
+async def create_dashboard(session: AsyncSession, team, queries: list[dict], is_default: bool = False) -> Dashboard:
+    dashboard = Dashboard(name="Render", config={}, team_id=team.id, is_default=is_default)
+    session.add(dashboard)
+    await session.flush()
+    for index, query in enumerate(queries):
+        session.add(
+            Widget(dashboard_id=dashboard.id, team_id=team.id, type="bar_chart", title=f"Widget {index}", query=query)
+        )
+    await session.flush()
+    return dashboard
+
+
+class TestRenderDashboard:
+    async def test_renders_every_widget(self, authenticated_client: AsyncTestClient, db_session: AsyncSession, team):
+        for day, name in [(3, "Render A"), (10, "Render B"), (11, "Render C")]:
+            await BrandFactory.create_async(
+                session=db_session, team_id=team.id, name=name, created_at=datetime(2025, 11, day, tzinfo=UTC)
+            )
+        queries = [
+            {"object_type": ObjectTypes.Brands, "field": "name", "aggregation": "count_", **WINDOW},
+            {"object_type": ObjectTypes.Brands, "field": "not_a_field", **WINDOW},
+            {"object_type": ObjectTypes.Brands, "field": "id", "aggregation": "count_", **WINDOW},
+        ]
+        dashboard = await create_dashboard(db_session, team, queries)
+
+        response = await authenticated_client.get(f"/dashboards/{dashboard.id}/render")
+        assert response.status_code == 200, response.text
+        widgets = response.json()["widgets"]
+
+        assert len(widgets) == 3
+        for query, widget in zip(queries, widgets, strict=True):
+            if widget["error"] is not None:
+                continue
+            single = await authenticated_client.post(
+                f"/o/{query['object_type']}/data", json={k: v for k, v in query.items() if k != "object_type"}
+            )
+            assert widget["data"] == single.json()
+        assert widgets[0]["data"]["total_records"] == 3
+        assert widgets[1]["data"] is None
+        assert "not_a_field" in widgets[1]["error"]
+        assert widgets[2]["data"]["total_records"] == 3
+
+    async def test_unknown_dashboard(self, authenticated_client: AsyncTestClient):
+        response = await authenticated_client.get("/dashboards/unknown/render")
+        assert response.status_code in (400, 404)
+
+
+class TestRenderWidgets:
+    """Concurrency and timeouts, with a session factory that only waits."""
+
+    async def test_bounded_concurrency_and_per_widget_timeout(self, db_session: AsyncSession, team):
+        queries = [{"object_type": ObjectTypes.Brands, "field": "name", **WINDOW} for _ in range(6)]
+        dashboard = await create_dashboard(db_session, team, queries)
+        await db_session.refresh(dashboard, attribute_names=["widgets"])
+
+        active = 0
+        peak = 0
+
+        @asynccontextmanager
+        async def slow_session() -> AsyncGenerator[AsyncSession]:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            try:
+                await asyncio.sleep(1)
+                yield db_session
+            finally:
+                active -= 1
+
+        registry = ObjectRegistry(s3_client=None, config=None)
+        results = await render_widgets(dashboard.widgets, slow_session, registry, concurrency=2, timeout=0.05)
+
+        assert peak == 2
+        assert [result.widget_id for result in results] == [widget.id for widget in dashboard.widgets]
+        assert all(result.data is None and result.error == "Timed out after 0.05s" for result in results)
+
+
+class TestPrewarmDashboards:
+    async def test_warms_default_dashboards_under_team_rls(self, db_session: AsyncSession, team):
+        other_team = await TeamFactory.create_async(session=db_session)
+        for team_id, name in [(team.id, "Warm A"), (team.id, "Warm B"), (other_team.id, "Other team")]:
+            await BrandFactory.create_async(
+                session=db_session, team_id=team_id, name=name, created_at=datetime(2025, 11, 4, tzinfo=UTC)
+            )
+        count_names = {"object_type": ObjectTypes.Brands, "field": "name", "aggregation": "count_", **WINDOW}
+        await create_dashboard(
+            db_session, team, [count_names, {"object_type": ObjectTypes.Brands, "field": "nope"}], is_default=True
+        )
+        await create_dashboard(db_session, team, [{"object_type": ObjectTypes.Brands, "field": "id", **WINDOW}])
+
+        cache = LRUMemoryStore()
+        sessions = async_sessionmaker(
+            bind=db_session.bind, expire_on_commit=False, join_transaction_mode="create_savepoint"
+        )
+        stats = await prewarm_dashboards(sessions, ObjectRegistry(s3_client=None, config=None), cache, concurrency=1)
+
+        assert stats == {"teams": 1, "warmed": 1, "failed": 1, "budget_exhausted": False}
+        # Only the team's own rows are counted
+        [entry] = cache._store.values()
+        assert msgspec.json.decode(entry.data)["total_records"] == 2
+
+
+class TestLiveUpdates:
+    async def test_debounced_refresh_of_affected_widgets(self, db_session: AsyncSession, team):
+        await BrandFactory.create_async(
+            session=db_session, team_id=team.id, name="Live", created_at=datetime(2025, 11, 4, tzinfo=UTC)
+        )
+        queries = [
+            {"object_type": ObjectTypes.Brands, "field": "name", "aggregation": "count_", **WINDOW},
+            {"object_type": ObjectTypes.Invoices, "field": "customer_name", **WINDOW},
+            {"object_type": ObjectTypes.Brands, "field": "nope"},
+        ]
+        dashboard = await create_dashboard(db_session, team, queries)
+        await db_session.refresh(dashboard, attribute_names=["widgets"])
+
+        @asynccontextmanager
+        async def session() -> AsyncGenerator[AsyncSession]:
+            yield db_session
+
+        sent: list[dict] = []
+
+        async def send(text: str) -> None:
+            sent.append(msgspec.json.decode(text))
+
+        async with ChannelsPlugin(backend=MemoryChannelsBackend(), arbitrary_channels_allowed=True) as channels:
+            updates = asyncio.create_task(
+                stream_widget_updates(
+                    send,
+                    channels,
+                    dashboard.widgets,
+                    session,
+                    ObjectRegistry(s3_client=None, config=None),
+                    team.id,
+                    debounce=0.1,
+                )
+            )
+            await asyncio.sleep(0.05)
+            # Another team's writes don't concern this dashboard
+            channels.publish(b"brands", [table_change_channel(team.id + 1, "brands")])
+            for _ in range(3):
+                channels.publish(b"brands", [table_change_channel(team.id, "brands")])
+            # Wait for the refresh however long the query takes, then long enough to catch a second one
+            async with asyncio.timeout(5):
+                while not sent:
+                    await asyncio.sleep(0.01)
+            await asyncio.sleep(0.3)
+            updates.cancel()
+
+        [update] = sent
+        assert update["widget_id"] == sqid_encode(dashboard.widgets[0].id)
+        assert update["data"]["total_records"] == 1
@@ -0,0 +1,96 @@
+"""Tests for request-scoped event buffering and UPDATED event coalescing (app/events/service.py)."""
+
+import pytest
+from litestar.channels import ChannelsPlugin
+from litestar.channels.backends.memory import MemoryChannelsBackend
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.events.enums import EventType
+from app.events.models import Event
+from app.events.schemas import FieldChange, UpdatedEventData
+from app.events.service import buffered_events, emit_event
+from app.threads.models import Message
+from app.utils.configure import config
+from tests.factories.brands import BrandFactory
+from tests.factories.users import UserFactory
+
+
+async def event_count(db_session: AsyncSession, object_ids: list[int]) -> int:
+    result = await db_session.execute(select(func.count()).select_from(Event).where(Event.object_id.in_(object_ids)))
+    return result.scalar_one()
+
+
+async def emit_rename(db_session: AsyncSession, brand, user, team, old="Old", new=None, channels=None) -> Event:
+    return await emit_event(
+        session=db_session,
+        event_type=EventType.UPDATED,
+        obj=brand,
+        user_id=user.id,
+        team_id=team.id,
+        event_data=UpdatedEventData(changes={"name": FieldChange(old=old, new=new or brand.name)}),
+        channels=channels,
+    )
+
+
+class TestBufferedEvents:
+    async def test_events_are_written_together_when_the_block_exits(self, db_session: AsyncSession, user, team):
+        brands = [await BrandFactory.create_async(session=db_session, team_id=team.id) for _ in range(3)]
+        brand_ids = [brand.id for brand in brands]
+
+        async with buffered_events(db_session):
+            events = [await emit_rename(db_session, brand, user, team) for brand in brands]
+            # Nested blocks share the outer buffer (the repeat rename coalesces into the buffered one)
+            async with buffered_events(db_session):
+                assert await emit_rename(db_session, brands[0], user, team) is events[0]
+            assert all(event.id is None for event in events)
+            assert await event_count(db_session, brand_ids) == 0
+
+        assert all(event.id is not None for event in events)
+        assert await event_count(db_session, brand_ids) == 3
+
+    async def test_events_are_discarded_when_the_block_raises(self, db_session: AsyncSession, user, team):
+        brand = await BrandFactory.create_async(session=db_session, team_id=team.id)
+
+        with pytest.raises(RuntimeError):
+            async with buffered_events(db_session):
+                await emit_rename(db_session, brand, user, team)
+                raise RuntimeError
+
+        assert await event_count(db_session, [brand.id]) == 0
+        # Without a buffer, events are written immediately
+        assert (await emit_rename(db_session, brand, user, team)).id is not None
+
+
+class TestCoalescing:
+    async def test_consecutive_updates_by_one_actor_merge(self, db_session: AsyncSession, user, team):
+        brand = await BrandFactory.create_async(session=db_session, team_id=team.id)
+        other_user = await UserFactory.create_async(session=db_session)
+
+        first = await emit_rename(db_session, brand, user, team, old="A", new="B")
+        assert await emit_rename(db_session, brand, user, team, old="B", new="C") is first
+        assert first.event_data == {"changes": {"name": {"old": "A", "new": "C"}}}
+
+        # Another actor starts a new event, which later updates coalesce into
+        second = await emit_rename(db_session, brand, other_user, team, old="C", new="D")
+        assert second.id != first.id
+        assert await emit_rename(db_session, brand, other_user, team, old="D", new="E") is second
+        assert await event_count(db_session, [brand.id]) == 2
+
+    async def test_coalescing_can_be_disabled(self, db_session: AsyncSession, user, team, monkeypatch):
+        monkeypatch.setattr(config, "EVENT_COALESCE_SECONDS", 0)
+        brand = await BrandFactory.create_async(session=db_session, team_id=team.id)
+
+        await emit_rename(db_session, brand, user, team, old="A", new="B")
+        await emit_rename(db_session, brand, user, team, old="B", new="C")
+        assert await event_count(db_session, [brand.id]) == 2
+
+    async def test_coalesced_updates_rewrite_one_thread_message(self, db_session: AsyncSession, user, team):
+        brand = await BrandFactory.create_async(session=db_session, team_id=team.id)
+
+        async with ChannelsPlugin(backend=MemoryChannelsBackend(), arbitrary_channels_allowed=True) as channels:
+            event = await emit_rename(db_session, brand, user, team, old="A", new="B", channels=channels)
+            await emit_rename(db_session, brand, user, team, old="B", new="C", channels=channels)
+
+        [message] = (await db_session.execute(select(Message).where(Message.event_id == event.id))).scalars()
+        assert "A → C" in str(message.content)
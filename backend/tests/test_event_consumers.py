@@ -1,9 +1,15 @@
 """Tests for event consumer helper functions."""
 
+from app.brands.models.brands import Brand
 from app.events.consumers import (
     _parse_event_data_to_updated,
     build_update_message_content,
+    post_created_to_thread,
+    post_updated_to_thread,
 )
+from app.events.enums import EventType
+from app.events.models import Event
+from app.events.registry import ConsumerRegistration, _registry
 from app.events.schemas import FieldChange, UpdatedEventData
 
 
@@ -386,3 +392,41 @@ class TestIntegration:
 
         assert "updated " in all_text
         assert all_text == "updated "
+
+
+class TestDispatchIndex:
+    """Test cases for the compiled (event type, object type) dispatch index."""
+
+    def test_lookup_by_event_and_object_type(self):
+        """Thread consumers are dispatched only for threadable objects and their event type."""
+        created_brand = _registry.get_consumers(Event(event_type=EventType.CREATED, object_type="brands"))
+        created_invoice = _registry.get_consumers(Event(event_type=EventType.CREATED, object_type="invoices"))
+
+        assert post_created_to_thread in created_brand
+        assert post_updated_to_thread not in created_brand
+        assert post_created_to_thread not in created_invoice
+        # Unfiltered consumers serve object types no filter mentions, in the same order
+        assert created_invoice == [c for c in created_brand if c is not post_created_to_thread]
+
+    def test_outbox_selection(self):
+        """Outbox and inline consumers partition the matching consumers."""
+        event = Event(event_type=EventType.UPDATED, object_type="brands")
+
+        assert post_updated_to_thread in _registry.get_consumers(event, outbox=True)
+        assert post_updated_to_thread not in _registry.get_consumers(event, outbox=False)
+
+    def test_argument_adapter_passes_accepted_arguments(self):
+        """Only the arguments a consumer declares are passed."""
+
+        async def consumer(event, obj, channels): ...
+
+        registration = ConsumerRegistration(consumer=consumer, model_filters=[Brand])
+        event = Event(event_type=EventType.CREATED, object_type="brands")
+        obj = MockObject(id=1)
+
+        values = {"session": None, "event": event, "obj": obj, "events": [event], "objs": [obj]}
+        kwargs = registration.adapt_arguments(values, {"channels": "channels", "viewer_store": "viewers"})
+
+        assert kwargs == {"event": event, "obj": obj, "channels": "channels"}
+        assert registration.tables == frozenset({"brands"})
+        assert registration.matches(event)
@@ -0,0 +1,81 @@
+"""Tests for outbox event dispatch (app/events/dispatcher.py)."""
+
+import pytest
+from litestar.channels import ChannelsPlugin
+from litestar.channels.backends.memory import MemoryChannelsBackend
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.events.dispatcher import drain_outbox
+from app.events.enums import EventType
+from app.events.models import EventOutboxEntry
+from app.events.schemas import CreatedEventData
+from app.events.service import emit_event
+from app.threads.models import Message, Thread
+from app.utils.configure import config
+
+
+@pytest.fixture
+def outbox_mode(monkeypatch):
+    monkeypatch.setattr(config, "EVENT_DISPATCH_MODE", "outbox")
+
+
+async def emit_created(db_session: AsyncSession, brand, user, team) -> int:
+    event = await emit_event(
+        session=db_session,
+        event_type=EventType.CREATED,
+        obj=brand,
+        user_id=user.id,
+        team_id=team.id,
+        event_data=CreatedEventData(initial_values={"name": brand.name}),
+    )
+    return event.id
+
+
+async def thread_messages(db_session: AsyncSession, brand) -> list[Message]:
+    result = await db_session.execute(
+        select(Message).join(Thread).where(Thread.threadable_type == "brands", Thread.threadable_id == brand.id)
+    )
+    return list(result.scalars())
+
+
+@pytest.mark.usefixtures("outbox_mode")
+class TestOutboxDispatch:
+    def sessions(self, db_session: AsyncSession) -> async_sessionmaker[AsyncSession]:
+        return async_sessionmaker(
+            bind=db_session.bind, expire_on_commit=False, join_transaction_mode="create_savepoint"
+        )
+
+    async def test_consumers_run_after_commit_from_the_outbox(self, db_session: AsyncSession, brand, user, team):
+        event_id = await emit_created(db_session, brand, user, team)
+
+        # The request only recorded the event
+        [entry] = (await db_session.execute(select(EventOutboxEntry))).scalars()
+        assert entry.event_id == event_id
+        assert await thread_messages(db_session, brand) == []
+
+        async with ChannelsPlugin(backend=MemoryChannelsBackend(), arbitrary_channels_allowed=True) as channels:
+            stats = await drain_outbox(self.sessions(db_session), {"channels": channels})
+
+        assert stats == {"delivered": 1, "failed": 0}
+        [message] = await thread_messages(db_session, brand)
+        assert message.user_id == user.id
+        db_session.expire_all()
+        assert (await db_session.execute(select(EventOutboxEntry))).scalars().all() == []
+
+    async def test_failed_consumer_is_leased_for_retry(self, db_session: AsyncSession, brand, user, team):
+        event_id = await emit_created(db_session, brand, user, team)
+        sessions = self.sessions(db_session)
+
+        # Without channels the thread consumer can't be called
+        assert await drain_outbox(sessions, {}) == {"delivered": 0, "failed": 1}
+        db_session.expire_all()
+        entry = await db_session.get(EventOutboxEntry, event_id)
+        assert entry is not None
+        assert entry.attempts == 1
+        assert entry.completed == []
+        assert entry.last_error is not None
+        assert "post_created_to_thread" in entry.last_error
+
+        # Not due again until the lease expires
+        assert await drain_outbox(sessions, {}) == {"delivered": 0, "failed": 0}
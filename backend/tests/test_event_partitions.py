@@ -0,0 +1,80 @@
+"""Tests for monthly events partitions and their archival (app/events/partitions.py)."""
+
+import gzip
+import json
+from datetime import UTC, date, datetime
+
+import pytest
+from psycopg.errors import InsufficientPrivilege
+from sqlalchemy import select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.client.s3_client import LocalS3Client
+from app.events.enums import EventType
+from app.events.models import Event
+from app.events.partitions import (
+    add_months,
+    archive_key,
+    archive_partition,
+    create_partitions,
+    expired_months,
+    list_partitions,
+    month_start,
+)
+from tests.factories.users import TeamFactory, UserFactory
+
+
+class TestMonths:
+    def test_add_months_crosses_years(self):
+        assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+        assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+    def test_expired_months_keep_the_retention_period(self):
+        partitions = [date(2025, 9, 1), date(2025, 10, 1), date(2025, 11, 1), date(2026, 10, 1)]
+        assert expired_months(partitions, date(2026, 10, 16), 12) == [date(2025, 9, 1)]
+
+
+class TestArchival:
+    async def test_expired_partition_is_archived_and_dropped(self, admin_session: AsyncSession, tmp_path):
+        team = await TeamFactory.create_async(session=admin_session)
+        user = await UserFactory.create_async(session=admin_session)
+        month = add_months(month_start(datetime.now(tz=UTC)), -24)
+        await create_partitions(admin_session, month, month)
+        assert month in await list_partitions(admin_session)
+
+        events = [
+            Event(
+                actor_id=user.id,
+                object_type="brands",
+                object_id=i,
+                event_type=EventType.CREATED,
+                event_data={"initial_values": {"name": f"Brand {i}"}},
+                team_id=team.id,
+                created_at=datetime(month.year, month.month, 2, tzinfo=UTC),
+            )
+            for i in range(3)
+        ]
+        admin_session.add_all(events)
+        await admin_session.flush()
+
+        sessions = async_sessionmaker(
+            bind=admin_session.bind, expire_on_commit=False, join_transaction_mode="create_savepoint"
+        )
+        s3_client = LocalS3Client(uploads_dir=str(tmp_path))
+        assert await archive_partition(sessions, s3_client, month) == 3
+
+        lines = gzip.decompress(s3_client.get_file_bytes(archive_key(month))).decode().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [event.id for event in events]
+        assert month not in await list_partitions(admin_session)
+        result = await admin_session.execute(select(Event.id).where(Event.id.in_([event.id for event in events])))
+        assert result.all() == []
+
+    async def test_app_role_cannot_manage_partitions(self, db_session: AsyncSession):
+        month = month_start(datetime.now(tz=UTC))
+        for function in ("events_create_partition", "events_drop_partition"):
+            with pytest.raises(DBAPIError) as excinfo:
+                async with db_session.begin_nested():
+                    await db_session.execute(text(f"SELECT {function}(:month)"), {"month": month})
+            assert isinstance(excinfo.value.orig, InsufficientPrivilege)
+        assert month in await list_partitions(db_session)
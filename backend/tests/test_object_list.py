@@ -0,0 +1,680 @@
+"""Tests for the object list endpoint (POST /o/{object_type})."""
+
+import csv
+import gzip
+import io
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from litestar.testing import AsyncTestClient
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.actions.enums import ActionGroupType
+from app.actions.registry import ActionRegistry
+from app.brands.models.brands import Brand
+from app.brands.objects import BrandObject
+from app.brands.schemas import BrandCreateSchema
+from app.deliverables.actions.deliverable import PublishDeliverable
+from app.deliverables.enums import DeliverableStates
+from app.deliverables.models import Deliverable, DeliverableMedia
+from app.deliverables.objects import DeliverableObject
+from app.objects import base as objects_base, export as objects_export
+from app.objects.enums import CountStrategy, ListExecution, ObjectTypes
+from app.objects.schemas import ObjectListRequest
+from app.utils.db import create_model, delete_model
+from app.utils.db_metrics import statement_cache_stats
+from tests.factories.brands import BrandFactory
+from tests.factories.deliverables import DeliverableFactory
+from tests.factories.media import MediaFactory
+from tests.factories.users import TeamFactory
+
+
+class TestObjectListPagination:
+    """Tests for offset and keyset (cursor) pagination."""
+
+    @pytest.fixture
+    async def brands(self, team, db_session: AsyncSession):
+        """Create brands with some shared created_at values to exercise the id tiebreaker."""
+        base = datetime(2025, 6, 1, tzinfo=UTC)
+        brands = [
+            await BrandFactory.create_async(
+                session=db_session,
+                team_id=team.id,
+                name=f"Brand {i:02d}",
+                website=None if i % 3 == 0 else f"https://brand{i}.example.com",
+                created_at=base + timedelta(days=i // 2),
+            )
+            for i in range(7)
+        ]
+        await db_session.flush()
+        return brands
+
+    async def _collect_pages(self, client: AsyncTestClient, body: dict) -> list[dict]:
+        """Follow next_cursor until exhausted and return every page."""
+        pages = []
+        cursor = None
+        while True:
+            response = await client.post(f"/o/{ObjectTypes.Brands}", json={**body, "cursor": cursor})
+            assert response.status_code in [200, 201], f"Got {response.status_code}: {response.text}"
+            page = response.json()
+            pages.append(page)
+            cursor = page["next_cursor"]
+            if cursor is None:
+                return pages
+
+    async def test_cursor_pages_match_offset_order(self, authenticated_client: AsyncTestClient, brands):
+        """Cursor paging with the default sort visits every row once, in offset order."""
+        offset_response = await authenticated_client.post(f"/o/{ObjectTypes.Brands}", json={"limit": 50})
+        expected_ids = [obj["id"] for obj in offset_response.json()["objects"]]
+        assert len(expected_ids) == 7
+
+        pages = await self._collect_pages(authenticated_client, {"limit": 3})
+
+        assert [len(page["objects"]) for page in pages] == [3, 3, 1]
+        assert [obj["id"] for page in pages for obj in page["objects"]] == expected_ids
+        assert all(page["total"] == 7 for page in pages)
+
+    @pytest.mark.parametrize("direction", ["sort_asc", "sort_desc"])
+    async def test_cursor_with_nullable_sort_column(self, authenticated_client: AsyncTestClient, brands, direction):
+        """Nullable sort keys page through NULLs without skipping or repeating rows."""
+        body = {"limit": 2, "sorts": [{"column": "website", "direction": direction}]}
+        offset_response = await authenticated_client.post(f"/o/{ObjectTypes.Brands}", json={**body, "limit": 50})
+        expected_ids = [obj["id"] for obj in offset_response.json()["objects"]]
+
+        pages = await self._collect_pages(authenticated_client, body)
+
+        assert [obj["id"] for page in pages for obj in page["objects"]] == expected_ids
+
+    async def test_offset_mode_returns_next_cursor(self, authenticated_client: AsyncTestClient, brands):
+        """Offset requests still work and hand out a cursor when more rows exist."""
+        everything = await authenticated_client.post(f"/o/{ObjectTypes.Brands}", json={"limit": 50})
+        all_ids = [obj["id"] for obj in everything.json()["objects"]]
+        response = await authenticated_client.post(f"/o/{ObjectTypes.Brands}", json={"limit": 3, "offset": 2})
+        data = response.json()
+
+        assert [obj["id"] for obj in data["objects"]] == all_ids[2:5]
+        assert data["offset"] == 2
+        assert data["next_cursor"] is not None
+
+        # The cursor continues where the offset page ended
+        rest = await authenticated_client.post(
+            f"/o/{ObjectTypes.Brands}", json={"limit": 50, "cursor": data["next_cursor"]}
+        )
+        assert [obj["id"] for obj in rest.json()["objects"]] == all_ids[5:]
+
+        # The last offset page has nothing to continue from
+        last = await authenticated_client.post(f"/o/{ObjectTypes.Brands}", json={"limit": 5, "offset": 5})
+        assert len(last.json()["objects"]) == 2
+        assert last.json()["next_cursor"] is None
+
+    async def test_cursor_rejected_for_different_sorts(self, authenticated_client: AsyncTestClient, brands):
+        """A cursor issued for one sort order can't be replayed against another."""
+        first = await authenticated_client.post(f"/o/{ObjectTypes.Brands}", json={"limit": 2})
+        cursor = first.json()["next_cursor"]
+
+        response = await authenticated_client.post(
+            f"/o/{ObjectTypes.Brands}",
+            json={"limit": 2, "cursor": cursor, "sorts": [{"column": "name", "direction": "sort_asc"}]},
+        )
+
+        assert response.status_code == 400
+
+    async def test_malformed_cursor_rejected(self, authenticated_client: AsyncTestClient, brands):
+        response = await authenticated_client.post(f"/o/{ObjectTypes.Brands}", json={"cursor": "not-a-cursor"})
+
+        assert response.status_code == 400
+
+
+class TestObjectListCounts:
+    """Tests for list total count strategies."""
+
+    @pytest.fixture
+    async def brands(self, team, db_session: AsyncSession):
+        brands = [
+            await BrandFactory.create_async(session=db_session, team_id=team.id, name=f"Counted {i}") for i in range(5)
+        ]
+        await db_session.flush()
+        return brands
+
+    async def test_exact_count(self, authenticated_client: AsyncTestClient, brands):
+        response = await authenticated_client.post(f"/o/{ObjectTypes.Brands}", json={"limit": 2})
+        data = response.json()
+
+        assert data["total"] == 5
+        assert data["has_more"] is True
+        assert data["total_is_estimate"] is False
+
+    async def test_no_count_strategy(self, authenticated_client: AsyncTestClient, brands, monkeypatch):
+        monkeypatch.setattr(BrandObject, "count_strategy", CountStrategy.none)
+
+        response = await authenticated_client.post(f"/o/{ObjectTypes.Brands}", json={"limit": 2})
+        data = response.json()
+
+        assert data["total"] is None
+        assert data["has_more"] is True
+
+        last_page = await authenticated_client.post(f"/o/{ObjectTypes.Brands}", json={"limit": 2, "offset": 4})
+        assert last_page.json()["has_more"] is False
+
+    async def test_estimate_count_strategy(self, authenticated_client: AsyncTestClient, brands, monkeypatch):
+        monkeypatch.setattr(BrandObject, "count_strategy", CountStrategy.estimate)
+
+        # Small results fall back to an exact count
+        response = await authenticated_client.post(f"/o/{ObjectTypes.Brands}", json={"limit": 2})
+        assert response.json()["total"] == 5
+        assert response.json()["total_is_estimate"] is False
+
+        monkeypatch.setattr(objects_base, "ESTIMATE_EXACT_THRESHOLD", 0)
+        response = await authenticated_client.post(f"/o/{ObjectTypes.Brands}", json={"limit": 2})
+        data = response.json()
+        assert data["total_is_estimate"] is True
+        assert isinstance(data["total"], int)
+
+    async def test_cached_count_invalidated_by_events(
+        self, authenticated_client: AsyncTestClient, brands, team, user, db_session: AsyncSession
+    ):
+        async def total() -> int:
+            response = await authenticated_client.post(f"/o/{ObjectTypes.Brands}", json={"limit": 1})
+            return response.json()["total"]
+
+        assert await total() == 5
+
+        # Rows written without an event are served from the cache until the TTL expires
+        await BrandFactory.create_async(session=db_session, team_id=team.id, name="Silent")
+        await db_session.flush()
+        assert await total() == 5
+
+        # A CREATED event invalidates the cached total
+        await create_model(
+            session=db_session,
+            team_id=team.id,
+            campaign_id=None,
+            model_class=Brand,
+            create_vals=BrandCreateSchema(name="Announced"),
+            user_id=user.id,
+        )
+        assert await total() == 7
+
+        # As does a DELETED event
+        await delete_model(session=db_session, model_instance=brands[0], user_id=user.id, team_id=team.id)
+        await db_session.flush()
+        assert await total() == 6
+
+    async def test_rolled_back_write_keeps_cached_count(
+        self, authenticated_client: AsyncTestClient, brands, team, user, db_session: AsyncSession
+    ):
+        async def total() -> int:
+            response = await authenticated_client.post(f"/o/{ObjectTypes.Brands}", json={"limit": 1})
+            return response.json()["total"]
+
+        assert await total() == 5
+
+        # The generation is bumped in the writing transaction, so it rolls back with the write
+        savepoint = await db_session.begin_nested()
+        await create_model(
+            session=db_session,
+            team_id=team.id,
+            campaign_id=None,
+            model_class=Brand,
+            create_vals=BrandCreateSchema(name="Rolled back"),
+            user_id=user.id,
+        )
+        await savepoint.rollback()
+
+        await BrandFactory.create_async(session=db_session, team_id=team.id, name="Silent")
+        await db_session.flush()
+        assert await total() == 5
+
+
+class TestObjectListProjection:
+    """Tests for column-projection-aware list queries."""
+
+    async def test_narrow_columns_skip_relationship_joins(self, deliverable, db_session: AsyncSession):
+        request = ObjectListRequest(column=["title", "state"])
+        query = await DeliverableObject.query_from_request(db_session, request)
+        sql = str(query.compile(compile_kwargs={"literal_binds": True}))
+
+        assert "campaigns" not in sql
+        assert "deliverable_media" not in sql
+        assert "deliverables.content" in sql  # subtitle dependency
+        assert "deliverables.notes" not in sql
+
+    async def test_projected_list_renders_requested_columns(
+        self, authenticated_client: AsyncTestClient, deliverable, campaign, db_session: AsyncSession
+    ):
+        # Start from an empty identity map so nothing is served from earlier loads
+        db_session.expunge_all()
+
+        response = await authenticated_client.post(
+            f"/o/{ObjectTypes.Deliverables}",
+            json={"column": ["title", "campaign_id", "owner_name"]},
+        )
+
+        assert response.status_code in [200, 201], f"Got {response.status_code}: {response.text}"
+        [row] = response.json()["objects"]
+        assert [field["key"] for field in row["fields"]] == ["title", "campaign_id", "owner_name"]
+        assert row["fields"][1]["value"]["label"] == campaign.name
+        assert row["title"] == deliverable.title
+
+    async def test_projected_campaign_list_loads_action_dependencies(
+        self, authenticated_client: AsyncTestClient, campaign, db_session: AsyncSession
+    ):
+        db_session.expunge_all()
+
+        response = await authenticated_client.post(f"/o/{ObjectTypes.Campaigns}", json={"column": ["name"]})
+
+        assert response.status_code in [200, 201], f"Got {response.status_code}: {response.text}"
+        [row] = response.json()["objects"]
+        assert [field["key"] for field in row["fields"]] == ["name"]
+        assert row["actions"]
+
+    async def test_without_columns_uses_all_list_fields(self, authenticated_client: AsyncTestClient, deliverable):
+        response = await authenticated_client.post(f"/o/{ObjectTypes.Deliverables}", json={})
+
+        [row] = response.json()["objects"]
+        expected = [col.key for col in DeliverableObject.column_definitions if col.include_in_list]
+        assert [field["key"] for field in row["fields"]] == expected
+
+
+class TestListStatementCache:
+    """List statements are cached by shape (columns, operations, sorts), not by values."""
+
+    @pytest.mark.parametrize("execution", [ListExecution.single, ListExecution.two_phase])
+    async def test_filter_values_reuse_compiled_statements(
+        self, authenticated_client: AsyncTestClient, deliverable, monkeypatch, execution
+    ):
+        monkeypatch.setattr(DeliverableObject, "list_execution", execution)
+
+        def body(i: int) -> dict:
+            return {
+                "limit": 10 + i,
+                "search": f"term {i}",
+                "filters": [
+                    {"type": "text_filter", "column": "title", "operation": "contains", "value": f"t{i}"},
+                    {"type": "enum_filter", "column": "state", "values": ["draft", "posted"][: 1 + i % 2]},
+                ],
+                "sorts": [{"column": "title", "direction": "sort_desc"}],
+            }
+
+        for i in range(2):  # warm up both enum list lengths
+            await authenticated_client.post(f"/o/{ObjectTypes.Deliverables}", json=body(i))
+        before = statement_cache_stats()
+
+        for i in range(2, 6):
+            response = await authenticated_client.post(f"/o/{ObjectTypes.Deliverables}", json=body(i))
+            assert response.status_code in [200, 201], response.text
+
+        after = statement_cache_stats()
+        assert after.get("miss", 0) == before.get("miss", 0)
+        assert after["hit"] > before["hit"]
+
+
+class TestTwoPhaseListExecution:
+    """Tests for page-ids-then-hydrate list execution."""
+
+    @pytest.fixture
+    async def deliverables_with_media(self, team, campaign, db_session: AsyncSession):
+        base = datetime(2025, 6, 1, tzinfo=UTC)
+        deliverables = []
+        for i in range(4):
+            deliverable = await DeliverableFactory.create_async(
+                session=db_session,
+                team_id=team.id,
+                campaign_id=campaign.id,
+                created_at=base + timedelta(days=i),
+            )
+            for _ in range(3):
+                media = await MediaFactory.create_async(session=db_session, team_id=team.id)
+                db_session.add(DeliverableMedia(deliverable_id=deliverable.id, media_id=media.id, team_id=team.id))
+            deliverables.append(deliverable)
+        await db_session.flush()
+        db_session.expunge_all()
+        return deliverables
+
+    @pytest.mark.parametrize("execution", [ListExecution.single, ListExecution.two_phase])
+    @pytest.mark.parametrize("list_columns", [None, DeliverableObject.list_columns])
+    async def test_execution_modes_return_same_page(
+        self, authenticated_client: AsyncTestClient, deliverables_with_media, execution, list_columns, monkeypatch
+    ):
+        monkeypatch.setattr(DeliverableObject, "list_execution", execution)
+        # None falls back to the legacy load_options (joinedload of the media association collection)
+        monkeypatch.setattr(DeliverableObject, "list_columns", list_columns)
+
+        response = await authenticated_client.post(f"/o/{ObjectTypes.Deliverables}", json={"limit": 2})
+        data = response.json()
+
+        assert [obj["id"] for obj in data["objects"]] == [str(d.id) for d in reversed(deliverables_with_media)][:2]
+        assert data["has_more"] is True
+        assert data["total"] == 4
+
+    async def test_two_phase_cursor_paging_preserves_order(
+        self, authenticated_client: AsyncTestClient, deliverables_with_media
+    ):
+        ids = []
+        cursor = None
+        while True:
+            response = await authenticated_client.post(
+                f"/o/{ObjectTypes.Deliverables}",
+                json={"limit": 3, "cursor": cursor, "sorts": [{"column": "created_at", "direction": "sort_asc"}]},
+            )
+            data = response.json()
+            ids.extend(obj["id"] for obj in data["objects"])
+            if not (cursor := data["next_cursor"]):
+                break
+
+        assert ids == [str(d.id) for d in deliverables_with_media]
+
+
+class TestObjectListSearch:
+    """Tests for trigram-indexed search and the ILIKE fallback."""
+
+    @pytest.fixture
+    async def brands(self, team, db_session: AsyncSession):
+        brands = [
+            await BrandFactory.create_async(session=db_session, team_id=team.id, name=name, description=description)
+            for name, description in [
+                ("Patagonia", "Outdoor clothing"),
+                ("Summit Gear", "Resells Patagonia jackets and other outdoor brands"),
+                ("Nike", "Athletic apparel"),
+            ]
+        ]
+        await db_session.flush()
+        return brands
+
+    async def _search(self, client: AsyncTestClient, body: dict) -> dict:
+        response = await client.post(f"/o/{ObjectTypes.Brands}", json=body)
+        assert response.status_code in [200, 201], f"Got {response.status_code}: {response.text}"
+        return response.json()
+
+    async def test_substring_match_ranked_by_similarity(self, authenticated_client: AsyncTestClient, brands):
+        data = await self._search(authenticated_client, {"search": "patagonia"})
+
+        assert [obj["title"] for obj in data["objects"]] == ["Patagonia", "Summit Gear"]
+        assert data["next_cursor"] is None
+
+    async def test_typo_tolerant_match(self, authenticated_client: AsyncTestClient, brands):
+        data = await self._search(authenticated_client, {"search": "patagona"})
+
+        assert data["objects"][0]["title"] == "Patagonia"
+
+    async def test_explicit_sort_overrides_ranking(self, authenticated_client: AsyncTestClient, brands):
+        data = await self._search(
+            authenticated_client,
+            {"search": "patagonia", "sorts": [{"column": "name", "direction": "sort_desc"}]},
+        )
+
+        assert [obj["title"] for obj in data["objects"]] == ["Summit Gear", "Patagonia"]
+
+    async def test_cursor_rejected_for_ranked_search(self, authenticated_client: AsyncTestClient, brands):
+        first = await authenticated_client.post(f"/o/{ObjectTypes.Brands}", json={"limit": 1})
+        cursor = first.json()["next_cursor"]
+
+        response = await authenticated_client.post(
+            f"/o/{ObjectTypes.Brands}", json={"limit": 1, "search": "patagonia", "cursor": cursor}
+        )
+
+        assert response.status_code == 400
+
+    async def test_search_uses_trigram_index_under_rls(self, admin_session: AsyncSession):
+        team = await TeamFactory.create_async(session=admin_session)
+        await BrandFactory.create_async(session=admin_session, team_id=team.id, name="Patagonia")
+        await admin_session.flush()
+
+        # The match runs inside search_brands, so log nested plans (auto_explain) to see it
+        plans: list[str] = []
+        driver_connection = (await (await admin_session.connection()).get_raw_connection()).driver_connection
+        assert driver_connection is not None
+        driver_connection.add_notice_handler(lambda notice: plans.append(notice.message_primary or ""))
+        for setting in [
+            "LOAD 'auto_explain'",
+            "SET LOCAL auto_explain.log_min_duration = 0",
+            "SET LOCAL auto_explain.log_nested_statements = on",
+            "SET LOCAL client_min_messages = log",
+            "SET LOCAL enable_seqscan = off",
+            "SET LOCAL app.is_system_mode = false",
+            f"SET LOCAL app.team_id = {int(team.id)}",
+            "SET LOCAL ROLE arive",
+        ]:
+            await admin_session.execute(text(setting))
+
+        query = BrandObject.build_list_query(ObjectListRequest(search="patagonia"), Brand.name)
+        assert (await admin_session.scalars(query)).all() == ["Patagonia"]
+
+        [search_plan] = [plan for plan in plans if "Query Text: SELECT id FROM brands" in plan]
+        assert "Bitmap Index Scan on ix_brands_search_trgm" in search_plan
+
+    async def test_search_function_applies_policy_scope(self, db_session: AsyncSession, brands, team, campaign):
+        other_team = await TeamFactory.create_async(session=db_session)
+        await BrandFactory.create_async(session=db_session, team_id=other_team.id, name="Patagonia Outlet")
+        await DeliverableFactory.create_async(
+            session=db_session, team_id=team.id, campaign_id=campaign.id, title="Patagonia launch"
+        )
+        await DeliverableFactory.create_async(session=db_session, team_id=team.id, title="Patagonia recap")
+        await db_session.flush()
+
+        async def matches(object_class, label) -> list[str]:
+            query = select(label).where(object_class.create_search_filter("patagonia")).order_by(label)
+            return list((await db_session.scalars(query)).all())
+
+        await db_session.execute(text("SET LOCAL app.is_system_mode = false"))
+        await db_session.execute(text(f"SET LOCAL app.team_id = {int(team.id)}"))
+        assert await matches(BrandObject, Brand.name) == ["Patagonia", "Summit Gear"]
+
+        # A campaign guest only finds the campaign's deliverables
+        await db_session.execute(text("SET LOCAL app.team_id = ''"))
+        await db_session.execute(text(f"SET LOCAL app.campaign_id = {int(campaign.id)}"))
+        assert await matches(DeliverableObject, Deliverable.title) == ["Patagonia launch"]
+        assert await matches(BrandObject, Brand.name) == []
+
+        await db_session.execute(text("SET LOCAL app.campaign_id = ''"))
+        await db_session.execute(text("SET LOCAL app.is_system_mode = true"))
+
+    async def test_fallback_without_search_columns(self, authenticated_client: AsyncTestClient, brands, monkeypatch):
+        monkeypatch.setattr(BrandObject, "search_columns", None)
+
+        data = await self._search(authenticated_client, {"search": "apparel"})
+
+        assert [obj["title"] for obj in data["objects"]] == ["Nike"]
+
+
+class TestListSerializer:
+    """Tests for compiled list-row serializers."""
+
+    def test_serializers_compiled_once_per_column_set(self):
+        columns = DeliverableObject.get_list_columns(ObjectListRequest(column=["title"]))
+
+        assert DeliverableObject.list_serializer() is DeliverableObject.list_serializer()
+        assert DeliverableObject.list_serializer(columns) is DeliverableObject.list_serializer(columns)
+        assert [key for key, *_ in DeliverableObject.list_serializer(columns).fields] == ["title"]
+
+    async def test_encode_matches_list_response_rows(
+        self, authenticated_client: AsyncTestClient, deliverable, db_session: AsyncSession
+    ):
+        response = await authenticated_client.post(f"/o/{ObjectTypes.Deliverables}", json={})
+        [row] = response.json()["objects"]
+
+        obj = await DeliverableObject.get_by_id(db_session, deliverable.id)
+        [encoded] = json.loads(DeliverableObject.list_serializer().encode([obj], ActionRegistry()))
+
+        assert encoded == row
+
+
+class TestListActionAvailability:
+    """Tests for page-level (batched) action availability."""
+
+    @pytest.fixture
+    async def deliverables(self, team, campaign, db_session: AsyncSession):
+        deliverables = [
+            await DeliverableFactory.create_async(
+                session=db_session,
+                team_id=team.id,
+                campaign_id=campaign.id,
+                state=DeliverableStates.DRAFT if i % 2 else DeliverableStates.POSTED,
+            )
+            for i in range(6)
+        ]
+        await db_session.flush()
+        return deliverables
+
+    async def test_availability_memoized_per_declared_input(
+        self, authenticated_client: AsyncTestClient, deliverables, monkeypatch
+    ):
+        checked_states = []
+        is_available = PublishDeliverable.is_available
+
+        def counting_is_available(obj, deps):
+            checked_states.append(obj.state)
+            return is_available(obj, deps)
+
+        monkeypatch.setattr(PublishDeliverable, "is_available", counting_is_available)
+
+        response = await authenticated_client.post(f"/o/{ObjectTypes.Deliverables}", json={})
+
+        assert sorted(checked_states) == sorted([DeliverableStates.DRAFT, DeliverableStates.POSTED])
+        rows = {row["id"]: row for row in response.json()["objects"]}
+        for deliverable in deliverables:
+            labels = [action["label"] for action in rows[str(deliverable.id)]["actions"]]
+            assert (PublishDeliverable.label in labels) == (deliverable.state == DeliverableStates.DRAFT)
+
+    def test_batch_matches_single_object_evaluation(self, deliverables):
+        action_group = ActionRegistry().get_class(ActionGroupType.DeliverableActions)
+
+        batch = action_group.get_available_actions_batch(deliverables)
+
+        assert batch == [action_group.get_available_actions(obj=obj) for obj in deliverables]
+        # Rows with the same available actions share one DTO list
+        assert batch[0] is batch[2]
+        assert batch[1] is batch[3]
+
+
+class TestObjectListExport:
+    """Tests for the streaming CSV export (POST /o/{object_type}/export)."""
+
+    @staticmethod
+    def read_csv(content: bytes) -> list[list[str]]:
+        return list(csv.reader(io.StringIO(content.decode())))
+
+    async def test_export_renders_columns_through_accessors(
+        self, authenticated_client: AsyncTestClient, deliverable, campaign
+    ):
+        response = await authenticated_client.post(
+            f"/o/{ObjectTypes.Deliverables}/export", json={"column": ["title", "campaign_id", "state"]}
+        )
+
+        assert response.status_code == 200, response.text
+        assert response.headers["content-type"].startswith("text/csv")
+        assert 'filename="deliverables_export.csv"' in response.headers["content-disposition"]
+        header, *rows = self.read_csv(response.content)
+        labels = {col.key: col.label for col in DeliverableObject.column_definitions}
+        assert header == [labels["title"], labels["campaign_id"], labels["state"]]
+        assert rows == [[deliverable.title, campaign.name, deliverable.state.value]]
+
+    async def test_gzip_export_matches_plain_export(self, authenticated_client: AsyncTestClient, deliverable):
+        url = f"/o/{ObjectTypes.Deliverables}/export"
+
+        plain = await authenticated_client.post(url, json={})
+        compressed = await authenticated_client.post(url, params={"gzip": "true"}, json={})
+
+        assert compressed.headers["content-type"] == "application/gzip"
+        assert 'filename="deliverables_export.csv.gz"' in compressed.headers["content-disposition"]
+        assert gzip.decompress(compressed.content) == plain.content
+
+    async def test_export_streams_in_chunks_with_filters_and_sorts(
+        self, authenticated_client: AsyncTestClient, team, campaign, db_session: AsyncSession, monkeypatch
+    ):
+        for i in range(5):
+            await DeliverableFactory.create_async(
+                session=db_session, team_id=team.id, campaign_id=campaign.id, title=f"Export {i}"
+            )
+        await DeliverableFactory.create_async(
+            session=db_session, team_id=team.id, campaign_id=campaign.id, title="Excluded"
+        )
+        await db_session.flush()
+        monkeypatch.setattr(objects_export, "EXPORT_CHUNK_SIZE", 2)
+
+        response = await authenticated_client.post(
+            f"/o/{ObjectTypes.Deliverables}/export",
+            json={
+                "column": ["title"],
+                "search": "Export",
+                "sorts": [{"column": "title", "direction": "sort_desc"}],
+                "limit": 1,
+            },
+        )
+
+        assert response.status_code == 200, response.text
+        _, *rows = self.read_csv(response.content)
+        assert rows == [[f"Export {i}"] for i in reversed(range(5))]
+
+    async def test_ndjson_export_keeps_types(self, authenticated_client: AsyncTestClient, deliverable, campaign):
+        response = await authenticated_client.post(
+            f"/o/{ObjectTypes.Deliverables}/export",
+            params={"format": "ndjson"},
+            json={"column": ["title", "campaign_id", "state", "posting_date"]},
+        )
+
+        assert response.status_code == 200, response.text
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        [row] = [json.loads(line) for line in response.content.splitlines()]
+        assert row["title"] == deliverable.title
+        assert row["campaign_id"] == {"id": str(campaign.id), "label": campaign.name}
+        assert row["state"] == deliverable.state.value
+        assert datetime.fromisoformat(row["posting_date"]) == deliverable.posting_date
+
+    @pytest.mark.parametrize("export_format", ["arrow", "parquet"])
+    async def test_columnar_export_is_typed(
+        self,
+        authenticated_client: AsyncTestClient,
+        team,
+        campaign,
+        db_session: AsyncSession,
+        monkeypatch,
+        export_format,
+    ):
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        for i in range(5):
+            await DeliverableFactory.create_async(
+                session=db_session, team_id=team.id, campaign_id=campaign.id, title=f"Export {i}"
+            )
+        await db_session.flush()
+        monkeypatch.setattr(objects_export, "EXPORT_CHUNK_SIZE", 2)
+
+        response = await authenticated_client.post(
+            f"/o/{ObjectTypes.Deliverables}/export",
+            params={"format": export_format},
+            json={
+                "column": ["id", "title", "campaign_id", "state", "created_at"],
+                "sorts": [{"column": "title", "direction": "sort_asc"}],
+            },
+        )
+
+        assert response.status_code == 200, response.text
+        if export_format == "parquet":
+            parquet_file = pq.ParquetFile(pa.BufferReader(response.content))
+            assert parquet_file.metadata.num_row_groups == 3
+            table = parquet_file.read()
+        else:
+            table = pa.ipc.open_stream(response.content).read_all()
+        assert table.schema.field("id").type == pa.int64()
+        assert table.schema.field("created_at").type == pa.timestamp("us", tz="UTC")
+        assert pa.types.is_dictionary(table.schema.field("state").type)
+        assert table.column("title").to_pylist() == [f"Export {i}" for i in range(5)]
+        assert {ref["label"] for ref in table.column("campaign_id").to_pylist()} == {campaign.name}
+
+    async def test_gzip_is_rejected_for_columnar_formats(self, authenticated_client: AsyncTestClient):
+        response = await authenticated_client.post(
+            f"/o/{ObjectTypes.Deliverables}/export", params={"format": "parquet", "gzip": "true"}, json={}
+        )
+
+        assert response.status_code == 400
+
+    async def test_unknown_column_is_rejected(self, authenticated_client: AsyncTestClient):
+        response = await authenticated_client.post(
+            f"/o/{ObjectTypes.Deliverables}/export", json={"column": ["not_a_column"]}
+        )
+
+        assert response.status_code == 400
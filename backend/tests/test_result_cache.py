@@ -0,0 +1,149 @@
+"""Tests for the time-series result cache (app/objects/cache.py)."""
+
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+import pytest
+from litestar.testing import AsyncTestClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.events.enums import EventType
+from app.events.models import Event
+from app.objects.cache import LRUMemoryStore, PostgresResultStore, _changed_tables, cache_key, invalidate_tables
+from app.objects.enums import Granularity, ObjectTypes
+from app.objects.services import align_time_range, bucket_bounds
+from app.payments.models import Invoice
+from app.payments.schemas import InvoiceCreateSchema
+from app.utils.db import create_model
+from tests.factories.payments import InvoiceFactory
+
+
+class TestCachedEndpoint:
+    REQUEST = {
+        "field": "customer_name",
+        "start_date": "2025-11-01T00:00:00Z",
+        "end_date": "2025-11-30T23:59:59Z",
+        "granularity": "month",
+    }
+
+    async def total(self, client: AsyncTestClient) -> int:
+        response = await client.post(f"/o/{ObjectTypes.Invoices}/data", json=self.REQUEST)
+        assert response.status_code in [200, 201], response.text
+        return response.json()["total_records"]
+
+    async def test_events_invalidate_cached_results(
+        self, authenticated_client: AsyncTestClient, db_session: AsyncSession, team, user
+    ):
+        for day in (3, 4):
+            await InvoiceFactory.create_async(
+                session=db_session, team_id=team.id, created_at=datetime(2025, 11, day, tzinfo=UTC)
+            )
+        await db_session.flush()
+        assert await self.total(authenticated_client) == 2
+
+        # A write without an event isn't seen until something invalidates the entry
+        await InvoiceFactory.create_async(
+            session=db_session, team_id=team.id, created_at=datetime(2025, 11, 5, tzinfo=UTC)
+        )
+        await db_session.flush()
+        assert await self.total(authenticated_client) == 2
+
+        invoice = await create_model(
+            session=db_session,
+            team_id=team.id,
+            campaign_id=None,
+            model_class=Invoice,
+            create_vals=InvoiceCreateSchema(
+                invoice_number=5151,
+                customer_name="Acme",
+                customer_email="billing@acme.test",
+                posting_date=date.today(),
+                due_date=date.today(),
+                amount_due=Decimal("80.00"),
+            ),
+            user_id=user.id,
+            track_fields=["customer_name"],
+        )
+        invoice.created_at = datetime(2025, 11, 6, tzinfo=UTC)
+        await db_session.flush()
+        assert await self.total(authenticated_client) == 4
+
+    async def test_invalidate_tables_covers_every_team(self, db_session: AsyncSession, team):
+        before = await cache_key(db_session, team.id, ["invoices"], ("request",))
+        assert await cache_key(db_session, team.id, ["invoices"], ("request",)) == before
+        assert await cache_key(db_session, team.id, ["invoices"], ("other",)) != before
+
+        await invalidate_tables(db_session, ["deliverables"])
+        assert await cache_key(db_session, team.id, ["invoices"], ("request",)) == before
+        await invalidate_tables(db_session, ["invoices"])
+        assert await cache_key(db_session, team.id, ["invoices"], ("request",)) != before
+
+    def test_changed_tables_lock_in_the_same_order(self):
+        def events(*pairs: tuple[int, str]) -> list[Event]:
+            return [Event(event_type=EventType.UPDATED, team_id=team_id, object_type=table) for team_id, table in pairs]
+
+        forward = _changed_tables(events((1, "deliverables"), (1, "campaigns"), (2, "invoices"), (1, "deliverables")))
+        backward = _changed_tables(events((2, "invoices"), (1, "campaigns"), (1, "deliverables")))
+        assert forward == backward == [(1, "campaigns"), (1, "deliverables"), (2, "invoices")]
+        assert _changed_tables(events((1, "result_cache_entries"))) == []
+
+
+class TestBucketAlignment:
+    @pytest.mark.parametrize(
+        ("granularity", "start", "end"),
+        [
+            (Granularity.hour, datetime(2026, 2, 18, 13, tzinfo=UTC), datetime(2026, 2, 18, 14, tzinfo=UTC)),
+            (Granularity.day, datetime(2026, 2, 18, tzinfo=UTC), datetime(2026, 2, 19, tzinfo=UTC)),
+            (Granularity.week, datetime(2026, 2, 16, tzinfo=UTC), datetime(2026, 2, 23, tzinfo=UTC)),
+            (Granularity.month, datetime(2026, 2, 1, tzinfo=UTC), datetime(2026, 3, 1, tzinfo=UTC)),
+            (Granularity.quarter, datetime(2026, 1, 1, tzinfo=UTC), datetime(2026, 4, 1, tzinfo=UTC)),
+            (Granularity.year, datetime(2026, 1, 1, tzinfo=UTC), datetime(2027, 1, 1, tzinfo=UTC)),
+        ],
+    )
+    def test_bucket_bounds(self, granularity: Granularity, start: datetime, end: datetime):
+        assert bucket_bounds(datetime(2026, 2, 18, 13, 45, 12, tzinfo=UTC), granularity) == (start, end)
+
+    def test_relative_windows_within_a_bucket_align_to_the_same_range(self):
+        first = align_time_range(
+            datetime(2026, 1, 19, 8, 5, tzinfo=UTC), datetime(2026, 2, 18, 8, 5, tzinfo=UTC), Granularity.day
+        )
+        later = align_time_range(
+            datetime(2026, 1, 19, 22, 40, tzinfo=UTC), datetime(2026, 2, 18, 22, 40, tzinfo=UTC), Granularity.day
+        )
+        assert first == later
+        assert first[0] == datetime(2026, 1, 19, tzinfo=UTC)
+        assert bucket_bounds(first[1], Granularity.day)[0] == datetime(2026, 2, 18, tzinfo=UTC)
+
+
+class TestStores:
+    async def test_lru_evicts_least_recently_used(self):
+        store = LRUMemoryStore(max_entries=2)
+        await store.set("a", b"1")
+        await store.set("b", b"2")
+        assert await store.get("a") == b"1"
+        await store.set("c", b"3")
+
+        assert await store.get("b") is None
+        assert await store.get("a") == b"1"
+        assert await store.get("c") == b"3"
+
+    async def test_postgres_store(self, db_session: AsyncSession):
+        sessions = async_sessionmaker(
+            bind=db_session.bind, expire_on_commit=False, join_transaction_mode="create_savepoint"
+        )
+        store = PostgresResultStore(sessions)
+
+        await store.set("key", b"value", expires_in=60)
+        assert await store.get("key") == b"value"
+        expires_in = await store.expires_in("key")
+        assert expires_in is not None
+        assert 0 < expires_in <= 60
+        await store.set("key", b"newer", expires_in=60)
+        assert await store.get("key") == b"newer"
+
+        await store.set("expired", b"old", expires_in=-1)
+        assert await store.get("expired") is None
+        assert await store.delete_expired() == 1
+
+        await store.delete("key")
+        assert not await store.exists("key")
@@ -6,10 +6,18 @@ These tests verify that:
 3. System mode bypass works as expected
 """
 
+from types import SimpleNamespace
+from typing import cast
+
 import pytest
+from litestar import Request
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.auth.enums import ScopeType
+from app.utils import db as db_utils
+from app.utils.db_metrics import instrument_statement_cache, statement_cache_stats
+
 
 class TestRLSConfiguration:
     """Test that RLS is properly configured in the database."""
@@ -188,3 +196,43 @@ class TestRLSConfiguration:
         finally:
             # Restore system mode for cleanup
             await db_session.execute(text("SET LOCAL app.is_system_mode = true"))
+
+
+class TestSetRLSVariables:
+    """Tests for set_rls_variables (request scope -> transaction settings)."""
+
+    @staticmethod
+    def scoped_request(**session) -> Request:
+        # set_rls_variables only reads the session and the path
+        return cast(Request, SimpleNamespace(session=session, url=SimpleNamespace(path="/test")))
+
+    async def test_team_scope_sets_team_id(self, db_session: AsyncSession, monkeypatch):
+        monkeypatch.setattr(db_utils.config, "IS_SYSTEM_MODE", False)
+
+        await db_utils.set_rls_variables(db_session, self.scoped_request(scope_type=ScopeType.TEAM.value, team_id=42))
+
+        result = await db_session.execute(text("SELECT current_setting('app.team_id')"))
+        assert result.scalar_one() == "42"
+
+    async def test_campaign_scope_sets_campaign_id(self, db_session: AsyncSession, monkeypatch):
+        monkeypatch.setattr(db_utils.config, "IS_SYSTEM_MODE", False)
+
+        await db_utils.set_rls_variables(
+            db_session, self.scoped_request(scope_type=ScopeType.CAMPAIGN.value, campaign_id=7)
+        )
+
+        result = await db_session.execute(text("SELECT current_setting('app.campaign_id')"))
+        assert result.scalar_one() == "7"
+
+    async def test_scope_ids_share_one_cached_statement(self, db_session: AsyncSession, monkeypatch):
+        monkeypatch.setattr(db_utils.config, "IS_SYSTEM_MODE", False)
+        instrument_statement_cache()
+        await db_utils.set_rls_variables(db_session, self.scoped_request(scope_type=ScopeType.TEAM.value, team_id=1))
+
+        misses = statement_cache_stats().get("miss", 0)
+        for team_id in range(2, 12):
+            await db_utils.set_rls_variables(
+                db_session, self.scoped_request(scope_type=ScopeType.TEAM.value, team_id=team_id)
+            )
+
+        assert statement_cache_stats().get("miss", 0) == misses
@@ -1,16 +1,51 @@
-"""Tests for time series data endpoint (/o/{object_type}/data)."""
+"""Tests for time series data endpoints (/o/{object_type}/data and /data/batch)."""
 
-from datetime import UTC, datetime
+import logging
+from datetime import UTC, date, datetime
+from decimal import Decimal
 
 import pytest
 from litestar.testing import AsyncTestClient
+from sqlalchemy import event, select
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.objects.enums import ObjectTypes
+from app.brands.models.brands import Brand
+from app.deliverables.enums import DeliverableStates, SocialMediaPlatforms
+from app.deliverables.models import Deliverable
+from app.deliverables.objects import DeliverableObject
+from app.deliverables.schemas import DeliverableCreateSchema, DeliverableUpdateSchema
+from app.events.enums import EventType
+from app.events.service import buffered_events, emit_event
+from app.objects import services, time_series
+from app.objects.enums import AggregationType, FieldType, Granularity, ObjectTypes
+from app.objects.models import TimeSeriesRollup
+from app.objects.rollups import query_rollup_time_series, rebuild_rollups, uses_rollups
+from app.objects.schemas import (
+    CategoricalDataPoint,
+    NumericalDataPoint,
+    TextFilterDefinition,
+    TimeSeriesDataRequest,
+)
+from app.objects.services import (
+    OTHER_CATEGORY,
+    TimeSeriesSpec,
+    approximate_sample_percent,
+    downsample_lttb,
+    query_time_series_batch,
+    query_time_series_data,
+    scale_sampled_data_points,
+)
+from app.payments.models import Invoice
+from app.payments.objects import InvoiceObject
+from app.payments.schemas import InvoiceCreateSchema, InvoiceUpdateSchema
 from app.roster.models import Roster
+from app.utils.configure import config
+from app.utils.db import create_model, delete_model, update_model
 from tests.factories.brands import BrandFactory
 from tests.factories.campaigns import CampaignFactory
 from tests.factories.deliverables import DeliverableFactory
+from tests.factories.payments import InvoiceFactory
 
 
 class TestTimeSeriesData:
@@ -402,3 +437,699 @@ class TestTimeSeriesData:
         assert breakdowns.get("Nike") == 2, "Should have 2 campaigns for Nike"
         assert breakdowns.get("Adidas") == 1, "Should have 1 campaign for Adidas"
         assert bucket_2025["total_count"] == 3
+
+
+class TestTimeSeriesRollups:
+    """Rollup-backed time series must match the raw aggregation."""
+
+    START = datetime(2025, 11, 1, tzinfo=UTC)
+    END = datetime(2025, 11, 30, 23, 59, 59, tzinfo=UTC)
+
+    async def assert_matches_raw(
+        self,
+        session: AsyncSession,
+        object_class,
+        field: str,
+        granularity: Granularity,
+        aggregation: AggregationType,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> None:
+        start, end = start or self.START, end or self.END
+        field_type = object_class.get_field_metadata(field).type
+        raw = await query_time_series_data(
+            session, object_class.model(), field, field_type, start, end, granularity, aggregation, []
+        )
+        rollup = await query_rollup_time_series(session, object_class, field, start, end, granularity, aggregation)
+        assert rollup[1] == raw[1]
+        assert [point.timestamp for point in rollup[0]] == [point.timestamp for point in raw[0]]
+        for rollup_point, raw_point in zip(rollup[0], raw[0], strict=True):
+            if isinstance(raw_point, NumericalDataPoint):
+                assert isinstance(rollup_point, NumericalDataPoint)
+                assert rollup_point.count == raw_point.count
+                assert rollup_point.value == pytest.approx(raw_point.value)
+            else:
+                assert rollup_point == raw_point
+
+    async def test_rebuild_matches_raw(self, transaction: AsyncSession, team, campaign):
+        for day, platform, state in [
+            (3, SocialMediaPlatforms.INSTAGRAM, DeliverableStates.DRAFT),
+            (3, SocialMediaPlatforms.TIKTOK, DeliverableStates.POSTED),
+            (12, SocialMediaPlatforms.INSTAGRAM, DeliverableStates.POSTED),
+            (28, SocialMediaPlatforms.YOUTUBE, DeliverableStates.DRAFT),
+        ]:
+            await DeliverableFactory.create_async(
+                session=transaction,
+                team_id=team.id,
+                campaign_id=campaign.id,
+                platforms=platform,
+                state=state,
+                created_at=datetime(2025, 11, day, 9, 30, tzinfo=UTC),
+            )
+        for day, amount in [(4, "100.25"), (4, "50.50"), (20, "12.00")]:
+            await InvoiceFactory.create_async(
+                session=transaction,
+                team_id=team.id,
+                amount_due=Decimal(amount),
+                created_at=datetime(2025, 11, day, 14, tzinfo=UTC),
+            )
+        # Outside the window
+        await DeliverableFactory.create_async(
+            session=transaction, team_id=team.id, created_at=datetime(2025, 12, 2, tzinfo=UTC)
+        )
+        await transaction.flush()
+
+        await rebuild_rollups(transaction, DeliverableObject)
+        await rebuild_rollups(transaction, InvoiceObject)
+
+        for granularity in (Granularity.hour, Granularity.day, Granularity.week, Granularity.month):
+            await self.assert_matches_raw(
+                transaction, DeliverableObject, "platforms", granularity, AggregationType.count_
+            )
+        await self.assert_matches_raw(transaction, DeliverableObject, "state", Granularity.week, AggregationType.count_)
+        for aggregation in (AggregationType.sum, AggregationType.avg, AggregationType.count_):
+            for granularity in (Granularity.day, Granularity.month):
+                await self.assert_matches_raw(transaction, InvoiceObject, "amount_due", granularity, aggregation)
+
+    async def test_events_maintain_rollups(self, transaction: AsyncSession, team, user, campaign):
+        deliverables = [
+            await create_model(
+                session=transaction,
+                team_id=team.id,
+                campaign_id=campaign.id,
+                model_class=Deliverable,
+                create_vals=DeliverableCreateSchema(
+                    title=f"Post {i}", platforms=platform, posting_date=datetime.now(tz=UTC)
+                ),
+                user_id=user.id,
+                track_fields=["title", "platforms"],
+            )
+            for i, platform in enumerate(
+                [SocialMediaPlatforms.INSTAGRAM, SocialMediaPlatforms.INSTAGRAM, SocialMediaPlatforms.TIKTOK]
+            )
+        ]
+        invoice = await create_model(
+            session=transaction,
+            team_id=team.id,
+            campaign_id=None,
+            model_class=Invoice,
+            create_vals=InvoiceCreateSchema(
+                invoice_number=4242,
+                customer_name="Acme",
+                customer_email="billing@acme.test",
+                posting_date=date.today(),
+                due_date=date.today(),
+                amount_due=Decimal("80.00"),
+            ),
+            user_id=user.id,
+            track_fields=["customer_name"],
+        )
+
+        first = deliverables[0]
+        await update_model(
+            session=transaction,
+            model_instance=first,
+            update_vals=DeliverableUpdateSchema(
+                title=first.title,
+                platforms=SocialMediaPlatforms.YOUTUBE,
+                posting_date=first.posting_date,
+                campaign_id=campaign.id,
+            ),
+            user_id=user.id,
+            team_id=team.id,
+            track_fields=["platforms"],
+        )
+        await update_model(
+            session=transaction,
+            model_instance=invoice,
+            update_vals=InvoiceUpdateSchema(
+                invoice_number=invoice.invoice_number,
+                customer_name=invoice.customer_name,
+                customer_email=invoice.customer_email,
+                posting_date=invoice.posting_date,
+                due_date=invoice.due_date,
+                amount_due=Decimal("120.50"),
+                amount_paid=Decimal("20.00"),
+                description=None,
+                notes=None,
+                campaign_id=None,
+            ),
+            user_id=user.id,
+            team_id=team.id,
+            track_fields=["amount_due", "amount_paid"],
+        )
+        await delete_model(session=transaction, model_instance=deliverables[1], user_id=user.id, team_id=team.id)
+        await transaction.flush()
+
+        now = datetime.now(tz=UTC)
+        start, end = now.replace(hour=0, minute=0, second=0, microsecond=0), now.replace(hour=23, minute=59)
+        await self.assert_matches_raw(
+            transaction, DeliverableObject, "platforms", Granularity.day, AggregationType.count_, start, end
+        )
+        for field in ("amount_due", "amount_paid"):
+            await self.assert_matches_raw(
+                transaction, InvoiceObject, field, Granularity.day, AggregationType.sum, start, end
+            )
+
+        # The incremental rows hold the same totals a rebuild produces
+        async def live_rollups() -> set[tuple]:
+            result = await transaction.execute(
+                select(
+                    TimeSeriesRollup.object_type,
+                    TimeSeriesRollup.field,
+                    TimeSeriesRollup.granularity,
+                    TimeSeriesRollup.bucket,
+                    TimeSeriesRollup.category,
+                    TimeSeriesRollup.row_count,
+                    TimeSeriesRollup.value_sum,
+                ).where(TimeSeriesRollup.row_count != 0)
+            )
+            return {tuple(row) for row in result.all()}
+
+        incremental = await live_rollups()
+        await rebuild_rollups(transaction, DeliverableObject)
+        await rebuild_rollups(transaction, InvoiceObject)
+        assert await live_rollups() == incremental
+
+    async def test_string_valued_changes_match_raw(self, transaction: AsyncSession, team, user, campaign):
+        deliverable = await create_model(
+            session=transaction,
+            team_id=team.id,
+            campaign_id=campaign.id,
+            model_class=Deliverable,
+            create_vals=DeliverableCreateSchema(
+                title="Post", platforms=SocialMediaPlatforms.INSTAGRAM, posting_date=datetime.now(tz=UTC)
+            ),
+            user_id=user.id,
+            track_fields=["title"],
+        )
+        assert deliverable.state == DeliverableStates.DRAFT
+
+        # Changes read back from a stored event carry enum values, not members
+        deliverable.state = DeliverableStates.POSTED
+        await emit_event(
+            session=transaction,
+            event_type=EventType.UPDATED,
+            obj=deliverable,
+            user_id=user.id,
+            team_id=team.id,
+            event_data={"changes": {"state": {"old": "draft", "new": "posted"}}},
+        )
+        await transaction.flush()
+
+        now = datetime.now(tz=UTC)
+        start, end = now.replace(hour=0, minute=0, second=0, microsecond=0), now.replace(hour=23, minute=59)
+        await self.assert_matches_raw(
+            transaction, DeliverableObject, "state", Granularity.day, AggregationType.count_, start, end
+        )
+
+    async def test_buffered_hard_delete_decrements_rollups(self, transaction: AsyncSession, team, user, campaign):
+        async def create_deliverable(title: str) -> Deliverable:
+            return await create_model(
+                session=transaction,
+                team_id=team.id,
+                campaign_id=campaign.id,
+                model_class=Deliverable,
+                create_vals=DeliverableCreateSchema(
+                    title=title, platforms=SocialMediaPlatforms.INSTAGRAM, posting_date=datetime.now(tz=UTC)
+                ),
+                user_id=user.id,
+                track_fields=["title", "platforms"],
+            )
+
+        async with buffered_events(transaction):
+            kept, deleted = await create_deliverable("Kept"), await create_deliverable("Deleted")
+
+        # The flush that writes the DELETED event also deletes the row, before the rollup consumer runs
+        async with buffered_events(transaction):
+            await delete_model(session=transaction, model_instance=deleted, user_id=user.id, team_id=team.id)
+            # Created and deleted within one buffer nets out
+            transient = await create_deliverable("Transient")
+            await delete_model(session=transaction, model_instance=transient, user_id=user.id, team_id=team.id)
+
+        assert await transaction.get(Deliverable, kept.id) is not None
+        now = datetime.now(tz=UTC)
+        start, end = now.replace(hour=0, minute=0, second=0, microsecond=0), now.replace(hour=23, minute=59)
+        await self.assert_matches_raw(
+            transaction, DeliverableObject, "platforms", Granularity.day, AggregationType.count_, start, end
+        )
+        rollup_points, total = await query_rollup_time_series(
+            transaction, DeliverableObject, "platforms", start, end, Granularity.day, AggregationType.count_
+        )
+        assert total == 1
+        assert sum(point.total_count for point in rollup_points if isinstance(point, CategoricalDataPoint)) == 1
+
+    async def test_endpoint_reads_rollups_without_filters(
+        self, authenticated_client: AsyncTestClient, team, campaign, db_session: AsyncSession
+    ):
+        for day in (5, 6):
+            await DeliverableFactory.create_async(
+                session=db_session,
+                team_id=team.id,
+                campaign_id=campaign.id,
+                platforms=SocialMediaPlatforms.INSTAGRAM,
+                created_at=datetime(2025, 11, day, tzinfo=UTC),
+            )
+        await db_session.flush()
+
+        async def instagram_total(filters: list) -> int:
+            response = await authenticated_client.post(
+                f"/o/{ObjectTypes.Deliverables}/data",
+                json={
+                    "field": "platforms",
+                    "start_date": self.START.isoformat(),
+                    "end_date": self.END.isoformat(),
+                    "granularity": "month",
+                    "filters": filters,
+                },
+            )
+            assert response.status_code in [200, 201], response.text
+            return response.json()["total_records"]
+
+        # Factory rows bypass events: only the raw path (any filter) sees them until a rebuild
+        title_filter = [{"type": "text_filter", "column": "title", "operation": "contains", "value": ""}]
+        assert await instagram_total([]) == 0
+        assert await instagram_total(title_filter) == 2
+
+        await rebuild_rollups(db_session, DeliverableObject)
+        assert await instagram_total([]) == 2
+
+    async def test_campaign_scoped_requests_read_raw(self, db_session: AsyncSession, team, campaign):
+        await DeliverableFactory.create_async(
+            session=db_session,
+            team_id=team.id,
+            campaign_id=campaign.id,
+            platforms=SocialMediaPlatforms.INSTAGRAM,
+            created_at=datetime(2025, 11, 5, tzinfo=UTC),
+        )
+        await db_session.flush()
+        request = TimeSeriesDataRequest(
+            field="platforms", start_date=self.START, end_date=self.END, granularity=Granularity.month
+        )
+
+        # Rollup rows are team-wide: campaign guests count only the rows their policy shows them
+        team_scoped = await time_series.get_time_series(db_session, DeliverableObject, request)
+        campaign_scoped = await time_series.get_time_series(
+            db_session, DeliverableObject, request, campaign_scoped=True
+        )
+        assert team_scoped.total_records == 0
+        assert campaign_scoped.total_records == 1
+
+    def test_uses_rollups(self):
+        platforms = DeliverableObject.get_field_metadata("platforms")
+        amount_due = InvoiceObject.get_field_metadata("amount_due")
+        title = DeliverableObject.get_field_metadata("title")
+        assert platforms is not None and amount_due is not None and title is not None
+
+        assert uses_rollups(DeliverableObject, platforms, AggregationType.count_, [])
+        assert uses_rollups(InvoiceObject, amount_due, AggregationType.avg, [])
+        assert not uses_rollups(InvoiceObject, amount_due, AggregationType.max, [])
+        assert not uses_rollups(DeliverableObject, title, AggregationType.count_, [])
+        title_filter = TextFilterDefinition(column="title", operation="contains", value="x")
+        assert not uses_rollups(DeliverableObject, platforms, AggregationType.count_, [title_filter])
+        assert not uses_rollups(DeliverableObject, platforms, AggregationType.count_, [], campaign_scoped=True)
+
+
+class TestTimeSeriesSinglePass:
+    """The raw aggregation returns its total from the same statement."""
+
+    async def test_total_comes_from_the_aggregation_query(
+        self, db_session: AsyncSession, brands_for_totals, caplog: pytest.LogCaptureFixture
+    ):
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(Engine, "before_cursor_execute", record)
+        try:
+            with caplog.at_level(logging.DEBUG, logger="app.objects.services"):
+                points, total = await query_time_series_data(
+                    db_session,
+                    Brand,
+                    "name",
+                    FieldType.String,
+                    datetime(2025, 11, 1, tzinfo=UTC),
+                    datetime(2025, 11, 30, tzinfo=UTC),
+                    Granularity.week,
+                    AggregationType.count_,
+                    [],
+                )
+        finally:
+            event.remove(Engine, "before_cursor_execute", record)
+
+        assert len(statements) == 1
+        assert total == 3
+        assert sum(point.total_count for point in points if isinstance(point, CategoricalDataPoint)) == 3
+        assert any("Time series query SQL" in record.message for record in caplog.records)
+
+    async def test_numerical_total_with_filters(self, db_session: AsyncSession, brands_for_totals):
+        name_filter = TextFilterDefinition(column="name", operation="equals", value="Totals A")
+        points, total = await query_time_series_data(
+            db_session,
+            Brand,
+            "id",
+            FieldType.Int,
+            datetime(2025, 11, 1, tzinfo=UTC),
+            datetime(2025, 11, 30, tzinfo=UTC),
+            Granularity.day,
+            AggregationType.count_,
+            [name_filter],
+        )
+        assert total == 1
+        assert sum(point.count for point in points if isinstance(point, NumericalDataPoint)) == 1
+
+        _points, total = await query_time_series_data(
+            db_session,
+            Brand,
+            "id",
+            FieldType.Int,
+            datetime(2024, 1, 1, tzinfo=UTC),
+            datetime(2024, 1, 31, tzinfo=UTC),
+            Granularity.day,
+            AggregationType.count_,
+            [],
+        )
+        assert total == 0
+
+    @pytest.fixture
+    async def brands_for_totals(self, team, db_session: AsyncSession):
+        for i, name in enumerate(["Totals A", "Totals B", "Totals C"]):
+            await BrandFactory.create_async(
+                session=db_session, team_id=team.id, name=name, created_at=datetime(2025, 11, 3 + 7 * i, tzinfo=UTC)
+            )
+        await db_session.flush()
+
+
+class TestTimeSeriesBatch:
+    """Batched series must match the single-series endpoint, from one scan."""
+
+    START = datetime(2025, 11, 1, tzinfo=UTC)
+    END = datetime(2025, 11, 30, 23, 59, 59, tzinfo=UTC)
+
+    async def test_batch_matches_single_queries(self, db_session: AsyncSession, team, campaign):
+        for day, platform, state in [
+            (3, SocialMediaPlatforms.INSTAGRAM, DeliverableStates.DRAFT),
+            (3, SocialMediaPlatforms.TIKTOK, DeliverableStates.POSTED),
+            (12, SocialMediaPlatforms.INSTAGRAM, DeliverableStates.POSTED),
+            (20, SocialMediaPlatforms.YOUTUBE, DeliverableStates.DRAFT),
+        ]:
+            await DeliverableFactory.create_async(
+                session=db_session,
+                team_id=team.id,
+                campaign_id=campaign.id,
+                platforms=platform,
+                state=state,
+                created_at=datetime(2025, 11, day, tzinfo=UTC),
+            )
+        await db_session.flush()
+
+        specs = [
+            TimeSeriesSpec("platforms", FieldType.Enum, AggregationType.count_),
+            TimeSeriesSpec("state", FieldType.Enum, AggregationType.count_),
+            TimeSeriesSpec("platforms", FieldType.Enum, AggregationType.mode),
+            TimeSeriesSpec("id", FieldType.Int, AggregationType.count_),
+        ]
+        filters = [TextFilterDefinition(column="title", operation="contains", value="")]
+
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(Engine, "before_cursor_execute", record)
+        try:
+            series, total = await query_time_series_batch(
+                db_session, Deliverable, specs, self.START, self.END, Granularity.week, filters
+            )
+        finally:
+            event.remove(Engine, "before_cursor_execute", record)
+
+        assert len(statements) == 1
+        assert total == 4
+        for spec, points in zip(specs, series, strict=True):
+            single, single_total = await query_time_series_data(
+                db_session,
+                Deliverable,
+                spec.field_name,
+                spec.field_type,
+                self.START,
+                self.END,
+                Granularity.week,
+                spec.aggregation,
+                filters,
+            )
+            assert single_total == total
+            assert points == single, spec
+
+    async def test_endpoint_mixes_rollups_and_raw(
+        self, authenticated_client: AsyncTestClient, db_session: AsyncSession, team, campaign
+    ):
+        for day, amount_due in [(4, "10.50"), (4, "4.50"), (18, "20.00")]:
+            await InvoiceFactory.create_async(
+                session=db_session,
+                team_id=team.id,
+                campaign_id=campaign.id,
+                amount_due=Decimal(amount_due),
+                created_at=datetime(2025, 11, day, tzinfo=UTC),
+            )
+        await db_session.flush()
+        await rebuild_rollups(db_session, InvoiceObject)
+
+        window = {"start_date": self.START.isoformat(), "end_date": self.END.isoformat(), "granularity": "week"}
+        items = [
+            {"field": "amount_due"},  # sum, from the rollups
+            {"field": "customer_name", "aggregation": "count_"},
+            {"field": "amount_paid", "aggregation": "max"},
+        ]
+        response = await authenticated_client.post(
+            f"/o/{ObjectTypes.Invoices}/data/batch", json={"series": items, **window}
+        )
+        assert response.status_code in [200, 201], response.text
+        batch = response.json()["series"]
+
+        assert [series["field_name"] for series in batch] == ["amount_due", "customer_name", "amount_paid"]
+        assert [series["aggregation_type"] for series in batch] == ["sum", "count_", "max"]
+        for item, series in zip(items, batch, strict=True):
+            single = await authenticated_client.post(f"/o/{ObjectTypes.Invoices}/data", json={**item, **window})
+            assert single.status_code in [200, 201], single.text
+            assert series == single.json()
+        assert batch[0]["total_records"] == 3
+        assert sum(point["value"] for point in batch[0]["data"]["data_points"]) == pytest.approx(35.0)
+
+    async def test_empty_batch_is_rejected(self, authenticated_client: AsyncTestClient):
+        response = await authenticated_client.post(f"/o/{ObjectTypes.Invoices}/data/batch", json={"series": []})
+        assert response.status_code == 400
+
+
+class TestIncrementalRefresh:
+    WINDOW = {"start_date": "2025-11-01T00:00:00Z", "end_date": "2025-11-30T23:59:59Z", "granularity": "week"}
+
+    @pytest.mark.parametrize("field", ["amount_due", "customer_name"])
+    async def test_delta_matches_tail_of_full_series(
+        self, authenticated_client: AsyncTestClient, db_session: AsyncSession, team, campaign, field: str
+    ):
+        for day, amount_due in [(4, "10.50"), (12, "4.50"), (19, "20.00"), (20, "7.00")]:
+            await InvoiceFactory.create_async(
+                session=db_session,
+                team_id=team.id,
+                campaign_id=campaign.id,
+                amount_due=Decimal(amount_due),
+                created_at=datetime(2025, 11, day, tzinfo=UTC),
+            )
+        await db_session.flush()
+        await rebuild_rollups(db_session, InvoiceObject)
+
+        url = f"/o/{ObjectTypes.Invoices}/data"
+        full = (await authenticated_client.post(url, json={"field": field, **self.WINDOW})).json()
+        response = await authenticated_client.post(
+            url, json={"field": field, "since_bucket": "2025-11-19T15:30:00Z", **self.WINDOW}
+        )
+        assert response.status_code in [200, 201], response.text
+        delta = response.json()
+
+        # The watermark is snapped to the start of its (Monday) week
+        assert delta["since_bucket"] == "2025-11-17T00:00:00Z"
+        assert delta["start_date"] == full["start_date"]
+        points = delta["data"]["data_points"]
+        assert points
+        assert points == [p for p in full["data"]["data_points"] if p["timestamp"] >= "2025-11-17T00:00:00Z"]
+        assert delta["total_records"] == 2
+
+    async def test_watermark_after_window_returns_nothing(self, authenticated_client: AsyncTestClient):
+        response = await authenticated_client.post(
+            f"/o/{ObjectTypes.Invoices}/data",
+            json={"field": "customer_name", "since_bucket": "2025-12-03T00:00:00Z", **self.WINDOW},
+        )
+        assert response.status_code in [200, 201], response.text
+        assert response.json()["data"]["data_points"] == []
+        assert response.json()["total_records"] == 0
+
+
+class TestResponseCapping:
+    START = datetime(2025, 11, 1, tzinfo=UTC)
+    END = datetime(2025, 11, 30, 23, 59, 59, tzinfo=UTC)
+
+    async def test_top_n_folds_tail_into_other(
+        self, authenticated_client: AsyncTestClient, db_session: AsyncSession, team, campaign
+    ):
+        for customer_name, n in [("Acme", 3), ("Globex", 2), ("Initech", 1), ("Umbrella", 1)]:
+            for _ in range(n):
+                await InvoiceFactory.create_async(
+                    session=db_session,
+                    team_id=team.id,
+                    campaign_id=campaign.id,
+                    customer_name=customer_name,
+                    created_at=datetime(2025, 11, 10, tzinfo=UTC),
+                )
+        await db_session.flush()
+
+        response = await authenticated_client.post(
+            f"/o/{ObjectTypes.Invoices}/data",
+            json={
+                "field": "customer_name",
+                "start_date": self.START.isoformat(),
+                "end_date": self.END.isoformat(),
+                "granularity": "month",
+                "top_n": 2,
+            },
+        )
+        assert response.status_code in [200, 201], response.text
+        [point] = response.json()["data"]["data_points"]
+        assert point["breakdowns"] == {"Acme": 3, "Globex": 2, OTHER_CATEGORY: 2}
+        assert point["total_count"] == response.json()["total_records"] == 7
+
+    async def test_top_n_from_rollups_matches_raw(self, db_session: AsyncSession, team, campaign):
+        for day, state in [
+            (3, DeliverableStates.DRAFT),
+            (3, DeliverableStates.POSTED),
+            (4, DeliverableStates.POSTED),
+            (12, DeliverableStates.IN_REVIEW),
+            (20, DeliverableStates.POSTED),
+        ]:
+            await DeliverableFactory.create_async(
+                session=db_session,
+                team_id=team.id,
+                campaign_id=campaign.id,
+                state=state,
+                created_at=datetime(2025, 11, day, tzinfo=UTC),
+            )
+        await db_session.flush()
+        await rebuild_rollups(db_session, DeliverableObject)
+
+        args = (self.START, self.END, Granularity.week, AggregationType.count_)
+        raw = await query_time_series_data(db_session, Deliverable, "state", FieldType.Enum, *args, [], top_n=1)
+        rollup = await query_rollup_time_series(db_session, DeliverableObject, "state", *args, top_n=1)
+        assert rollup == raw
+        breakdowns = [point.breakdowns for point in raw[0] if isinstance(point, CategoricalDataPoint)]
+        assert [breakdown for breakdown in breakdowns if breakdown] == [
+            {"posted": 2, OTHER_CATEGORY: 1},
+            {OTHER_CATEGORY: 1},
+            {"posted": 1},
+        ]
+
+    def test_lttb_keeps_ends_and_peaks(self):
+        points = [
+            NumericalDataPoint(timestamp=datetime(2025, 11, 1, hour, tzinfo=UTC), value=0.0, count=0)
+            for hour in range(24)
+        ]
+        points[9] = NumericalDataPoint(timestamp=points[9].timestamp, value=50.0, count=5)
+
+        sampled = downsample_lttb(points, 6)
+        assert len(sampled) == 6
+        assert sampled[0] is points[0] and sampled[-1] is points[-1]
+        assert points[9] in sampled
+        assert sampled == sorted(sampled, key=lambda point: point.timestamp)
+        assert downsample_lttb(points, 30) == points
+
+    async def test_invalid_limits_are_rejected(self, authenticated_client: AsyncTestClient):
+        for limit in [{"top_n": 0}, {"max_points": 2}]:
+            response = await authenticated_client.post(
+                f"/o/{ObjectTypes.Invoices}/data", json={"field": "amount_due", **limit}
+            )
+            assert response.status_code == 400
+
+
+class TestApproximateTimeSeries:
+    START = datetime(2025, 11, 1, tzinfo=UTC)
+    END = datetime(2025, 11, 30, 23, 59, 59, tzinfo=UTC)
+
+    @pytest.fixture
+    async def invoices(self, db_session: AsyncSession, team, campaign):
+        for day, customer_name in [(3, "Acme"), (3, "Globex"), (17, "Acme")]:
+            await InvoiceFactory.create_async(
+                session=db_session,
+                team_id=team.id,
+                campaign_id=campaign.id,
+                customer_name=customer_name,
+                amount_paid=Decimal("10.00"),
+                created_at=datetime(2025, 11, day, tzinfo=UTC),
+            )
+        await db_session.flush()
+
+    async def test_full_sample_matches_exact(self, db_session: AsyncSession, invoices):
+        for field, field_type, aggregation in [
+            ("customer_name", FieldType.String, AggregationType.count_),
+            ("amount_paid", FieldType.USD, AggregationType.sum),
+        ]:
+            args = (db_session, Invoice, field, field_type, self.START, self.END, Granularity.week, aggregation)
+            filters = [TextFilterDefinition(column="customer_name", operation="equals", value="Acme")]
+            assert await query_time_series_data(*args, filters, sample_percent=100.0) == (
+                await query_time_series_data(*args, filters)
+            )
+
+    def test_sampled_points_are_scaled_up(self):
+        timestamp = datetime(2025, 11, 3, tzinfo=UTC)
+        [point] = scale_sampled_data_points(
+            [NumericalDataPoint(timestamp=timestamp, value=12.0, count=3)], 4.0, AggregationType.sum
+        )
+        assert isinstance(point, NumericalDataPoint)
+        assert (point.value, point.count) == (48.0, 12)
+        [point] = scale_sampled_data_points(
+            [NumericalDataPoint(timestamp=timestamp, value=4.0, count=3)], 4.0, AggregationType.avg
+        )
+        assert isinstance(point, NumericalDataPoint)
+        assert (point.value, point.count) == (4.0, 12)
+
+        assert approximate_sample_percent(services.APPROXIMATE_SAMPLE_ROWS) is None
+        assert approximate_sample_percent(services.APPROXIMATE_SAMPLE_ROWS * 50) == pytest.approx(2.0)
+
+    async def test_endpoint_suggests_and_samples(self, authenticated_client: AsyncTestClient, invoices, monkeypatch):
+        request = {
+            "field": "customer_name",
+            "start_date": self.START.isoformat(),
+            "end_date": self.END.isoformat(),
+            "granularity": "week",
+        }
+        url = f"/o/{ObjectTypes.Invoices}/data"
+        time_series._row_estimates.clear()
+        estimates: list[int] = []
+        estimate_rows = time_series.estimate_time_series_rows
+
+        async def recording_estimate(*args) -> int:
+            estimates.append(rows := await estimate_rows(*args))
+            return rows
+
+        monkeypatch.setattr(time_series, "estimate_time_series_rows", recording_estimate)
+        exact = (await authenticated_client.post(url, json=request)).json()
+        assert exact["approximate_suggested"] is False
+        assert exact["sampling"] is None
+        assert len(estimates) == 1
+
+        monkeypatch.setattr(config, "TIME_SERIES_APPROXIMATE_THRESHOLD", 0)
+        # The planner's estimate for these few rows is tiny, so sample "everything"
+        monkeypatch.setattr(time_series, "approximate_sample_percent", lambda estimated_rows: 100.0)
+        response = await authenticated_client.post(url, json={**request, "approximate": True})
+        assert response.status_code in [200, 201], response.text
+        approximate = response.json()
+
+        assert approximate["approximate_suggested"] is True
+        # The window's estimate is reused rather than explained again
+        assert len(estimates) == 1
+        assert approximate["sampling"] == {
+            "sample_percent": 100.0,
+            "sampled_records": 3,
+            "error_margin": pytest.approx(1.96 / 3**0.5),
+        }
+        assert approximate["data"] == exact["data"]
+        assert approximate["total_records"] == exact["total_records"] == 3